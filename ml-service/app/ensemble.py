@@ -3,14 +3,18 @@ Model Ensemble for Improved Predictions
 Combines predictions from multiple models for better accuracy
 """
 
+import time
 import numpy as np
 import torch
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+ENSEMBLE_CLASSES = ['bearish', 'neutral', 'bullish']
+ENSEMBLE_METHODS = ['weighted_average', 'majority_voting', 'max_confidence']
+
 
 @dataclass
 class ModelPrediction:
@@ -103,14 +107,11 @@ class PredictionEnsemble:
         weights = weights / weights.sum()  # Normalize to sum to 1
 
         # Combine probabilities
-        combined_probs = np.zeros(3)
-        for pred, weight in zip(predictions, weights):
-            combined_probs += pred.probabilities * weight
+        combined_probs = weights @ np.stack([p.probabilities for p in predictions])
 
         # Get final direction and confidence
-        classes = ['bearish', 'neutral', 'bullish']
         predicted_class_idx = combined_probs.argmax()
-        direction = classes[predicted_class_idx]
+        direction = ENSEMBLE_CLASSES[predicted_class_idx]
         confidence = float(combined_probs.max())
 
         metadata = {
@@ -196,57 +197,176 @@ class PredictionEnsemble:
         return max_pred.probabilities, max_pred.direction, max_pred.confidence, metadata
 
 
+class PredictionHistoryBuffer:
+    """
+    Bounded per-symbol prediction history in fixed-size arrays
+
+    Each symbol gets a (capacity, 3) float32 probability ring buffer and a
+    float64 timestamp ring buffer; appends overwrite the oldest slot in O(1).
+    """
+
+    def __init__(self, capacity: int = 10, num_classes: int = 3):
+        """
+        Initialize the store
+
+        Args:
+            capacity: Predictions kept per symbol
+            num_classes: Probabilities per prediction
+        """
+        self.capacity = capacity
+        self.num_classes = num_classes
+        self._probabilities: Dict[str, np.ndarray] = {}
+        self._timestamps: Dict[str, np.ndarray] = {}
+        self._count: Dict[str, int] = {}
+
+    def append(self, symbol: str, probabilities: np.ndarray, timestamp: Optional[float] = None):
+        """Record one prediction (timestamp in epoch seconds, default: now)"""
+        if symbol not in self._probabilities:
+            self._probabilities[symbol] = np.zeros((self.capacity, self.num_classes), dtype=np.float32)
+            self._timestamps[symbol] = np.zeros(self.capacity, dtype=np.float64)
+            self._count[symbol] = 0
+
+        slot = self._count[symbol] % self.capacity
+        self._probabilities[symbol][slot] = probabilities
+        self._timestamps[symbol][slot] = time.time() if timestamp is None else timestamp
+        self._count[symbol] += 1
+
+    def get(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recorded predictions for a symbol, oldest first
+
+        Returns:
+            Tuple of (timestamps (n,), probabilities (n, num_classes))
+        """
+        count = self._count.get(symbol, 0)
+        if count == 0:
+            return np.zeros(0), np.zeros((0, self.num_classes), dtype=np.float32)
+
+        n = min(count, self.capacity)
+        order = (np.arange(count - n, count)) % self.capacity
+
+        return self._timestamps[symbol][order], self._probabilities[symbol][order]
+
+    def clear(self, symbol: Optional[str] = None):
+        """Drop history for one symbol (or all symbols)"""
+        symbols = [symbol] if symbol is not None else list(self._count)
+        for sym in symbols:
+            self._probabilities.pop(sym, None)
+            self._timestamps.pop(sym, None)
+            self._count.pop(sym, None)
+
+
+class RedisPredictionHistory:
+    """
+    Bounded per-symbol prediction history in Redis streams
+
+    Shared by every worker process and kept across restarts. Each entry
+    stores the timestamp and the float32 probabilities as raw bytes; the
+    stream is trimmed to `capacity` entries on every append.
+    """
+
+    def __init__(self, redis_client, capacity: int = 10, num_classes: int = 3, key_prefix: str = 'prediction_history'):
+        """
+        Initialize the store
+
+        Args:
+            redis_client: Redis client (decode_responses=False)
+            capacity: Predictions kept per symbol
+            num_classes: Probabilities per prediction
+            key_prefix: Stream key prefix
+        """
+        self.redis_client = redis_client
+        self.capacity = capacity
+        self.num_classes = num_classes
+        self.key_prefix = key_prefix
+
+    def _key(self, symbol: str) -> str:
+        return f"{self.key_prefix}:{symbol}"
+
+    def append(self, symbol: str, probabilities: np.ndarray, timestamp: Optional[float] = None):
+        """Record one prediction (timestamp in epoch seconds, default: now)"""
+        self.redis_client.xadd(
+            self._key(symbol),
+            {
+                'ts': repr(time.time() if timestamp is None else float(timestamp)),
+                'p': np.asarray(probabilities, dtype=np.float32).tobytes()
+            },
+            maxlen=self.capacity,
+            approximate=False
+        )
+
+    def get(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recorded predictions for a symbol, oldest first
+
+        Returns:
+            Tuple of (timestamps (n,), probabilities (n, num_classes))
+        """
+        entries = self.redis_client.xrange(self._key(symbol))
+        if not entries:
+            return np.zeros(0), np.zeros((0, self.num_classes), dtype=np.float32)
+
+        timestamps = np.array([float(fields[b'ts']) for _, fields in entries])
+        probabilities = np.frombuffer(
+            b''.join(fields[b'p'] for _, fields in entries), dtype=np.float32
+        ).reshape(-1, self.num_classes)
+
+        return timestamps, probabilities
+
+    def clear(self, symbol: Optional[str] = None):
+        """Drop history for one symbol (or all symbols)"""
+        if symbol is not None:
+            self.redis_client.delete(self._key(symbol))
+        else:
+            keys = list(self.redis_client.scan_iter(match=f"{self.key_prefix}:*"))
+            if keys:
+                self.redis_client.delete(*keys)
+
+
 class TemporalEnsemble:
     """
     Temporal ensemble that combines predictions across multiple timeframes
     Gives more weight to recent predictions
     """
 
-    def __init__(self, decay_factor: float = 0.9):
+    def __init__(self, decay_factor: float = 0.9, history=None, max_history: int = 10):
         """
         Initialize temporal ensemble
 
         Args:
             decay_factor: Weight decay for older predictions (0-1)
+            history: Prediction store (PredictionHistoryBuffer or
+                RedisPredictionHistory); default is an in-process buffer
+            max_history: Predictions kept per symbol for the default store
         """
         self.decay_factor = decay_factor
-        self.prediction_history: Dict[str, List[ModelPrediction]] = {}
+        self.history = history if history is not None else PredictionHistoryBuffer(capacity=max_history)
 
-    def add_prediction(self, symbol: str, prediction: ModelPrediction):
+    def add_prediction(self, symbol: str, prediction: ModelPrediction, timestamp: Optional[float] = None):
         """Add a new prediction to history"""
-        if symbol not in self.prediction_history:
-            self.prediction_history[symbol] = []
-
-        self.prediction_history[symbol].append(prediction)
-
-        # Keep only last 10 predictions
-        if len(self.prediction_history[symbol]) > 10:
-            self.prediction_history[symbol] = self.prediction_history[symbol][-10:]
+        self.history.append(symbol, prediction.probabilities, timestamp)
 
     def get_temporal_prediction(self, symbol: str) -> Tuple[np.ndarray, str, float, Dict]:
         """
         Get prediction combining temporal history
         More recent predictions have higher weight
         """
-        if symbol not in self.prediction_history or not self.prediction_history[symbol]:
-            raise ValueError(f"No prediction history for {symbol}")
+        timestamps, probabilities = self.history.get(symbol)
+        n = len(probabilities)
 
-        predictions = self.prediction_history[symbol]
-        n = len(predictions)
+        if n == 0:
+            raise ValueError(f"No prediction history for {symbol}")
 
         # Calculate exponential weights (more recent = higher weight)
-        weights = np.array([self.decay_factor ** (n - i - 1) for i in range(n)])
+        weights = self.decay_factor ** np.arange(n - 1, -1, -1, dtype=float)
         weights = weights / weights.sum()
 
         # Combine probabilities with temporal weights
-        combined_probs = np.zeros(3)
-        for pred, weight in zip(predictions, weights):
-            combined_probs += pred.probabilities * weight
+        combined_probs = weights @ probabilities.astype(float)
 
         # Get direction and confidence
-        classes = ['bearish', 'neutral', 'bullish']
         predicted_class_idx = combined_probs.argmax()
-        direction = classes[predicted_class_idx]
+        direction = ENSEMBLE_CLASSES[predicted_class_idx]
         confidence = float(combined_probs.max())
 
         metadata = {
@@ -254,30 +374,128 @@ class TemporalEnsemble:
             'predictions_used': n,
             'decay_factor': self.decay_factor,
             'weights': weights.tolist(),
-            'trend': self._detect_trend(predictions)
+            'first_prediction_at': float(timestamps[0]),
+            'last_prediction_at': float(timestamps[-1]),
+            'trend': self._detect_trend(probabilities.argmax(axis=1))
         }
 
         logger.info(f"Temporal ensemble for {symbol}: {direction} ({confidence:.3f}) from {n} predictions")
 
         return combined_probs, direction, confidence, metadata
 
-    def _detect_trend(self, predictions: List[ModelPrediction]) -> str:
-        """Detect if predictions are trending in a direction"""
-        if len(predictions) < 3:
+    def _detect_trend(self, directions: np.ndarray) -> str:
+        """Detect if predictions are trending in a direction (directions as class indices)"""
+        if len(directions) < 3:
             return 'insufficient_data'
 
-        recent_3 = predictions[-3:]
+        recent_3 = directions[-3:]
 
-        if all(p.direction == 'bullish' for p in recent_3):
-            return 'strong_bullish'
-        elif all(p.direction == 'bearish' for p in recent_3):
-            return 'strong_bearish'
-        elif all(p.direction == recent_3[0].direction for p in recent_3):
-            return f'consistent_{recent_3[0].direction}'
+        if (recent_3 == recent_3[0]).all():
+            direction = ENSEMBLE_CLASSES[recent_3[0]]
+            if direction in ('bullish', 'bearish'):
+                return f'strong_{direction}'
+            return f'consistent_{direction}'
         else:
             return 'mixed'
 
 
+def combine_probability_tensor(
+    probabilities: np.ndarray,
+    weights: np.ndarray = None,
+    available: np.ndarray = None,
+    confidences: np.ndarray = None,
+    min_confidence: float = 0.3
+) -> Dict:
+    """
+    Combine predictions of many models for many symbols with all three methods
+
+    Array-backed counterpart of PredictionEnsemble.combine_predictions:
+    model filtering, the all-below-threshold fallback, the single-model
+    shortcut and tie-breaking follow the same rules, for every symbol at once.
+
+    Args:
+        probabilities: (models, symbols, 3) class probabilities
+        weights: (models,) or (models, symbols) model weights, e.g. historical
+            accuracy (default: equal)
+        available: (models, symbols) bool, False where a model has no
+            prediction for a symbol (default: all available)
+        confidences: (models, symbols) confidence scores (default: max probability)
+        min_confidence: Minimum confidence to include a prediction
+
+    Returns:
+        Dict with 'models_used' (symbols,) and, per method, a dict of
+        'probabilities' (symbols, 3), 'direction' (symbols,) class indices
+        and 'confidence' (symbols,). Symbols with no available model have
+        models_used == 0 and meaningless outputs.
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    num_models, num_symbols, num_classes = probs.shape
+
+    available = np.ones((num_models, num_symbols), dtype=bool) if available is None else np.asarray(available, dtype=bool)
+    confidences = probs.max(axis=2) if confidences is None else np.asarray(confidences, dtype=float)
+    weights = np.ones(num_models) if weights is None else np.asarray(weights, dtype=float)
+    weights = np.broadcast_to(weights.reshape(num_models, -1), (num_models, num_symbols))
+
+    # Confidence filter; fall back to all available models where nothing passes
+    included = available & (confidences >= min_confidence)
+    none_pass = ~included.any(axis=0)
+    included = np.where(none_pass[None, :], available, included)
+    n_included = included.sum(axis=0)
+
+    # Weighted average
+    w = np.where(included, weights, 0.0)
+    w = w / np.maximum(w.sum(axis=0, keepdims=True), 1e-12)
+    weighted_probs = np.einsum('ms,msc->sc', w, probs)
+
+    # Majority voting (ties go to the direction seen first, like Counter.most_common)
+    votes = probs.argmax(axis=2)
+    one_hot = (votes[..., None] == np.arange(num_classes)) & included[..., None]
+    vote_counts = one_hot.sum(axis=0)
+    first_seen = np.where(one_hot, np.arange(num_models)[:, None, None], num_models).min(axis=0)
+    tie_rank = np.where(vote_counts == vote_counts.max(axis=1, keepdims=True), first_seen, num_models + 1)
+    majority = tie_rank.argmin(axis=1)
+    vote_probs = vote_counts / np.maximum(n_included, 1)[:, None]
+    majority_voters = one_hot[np.arange(num_models)[:, None], np.arange(num_symbols)[None, :], majority[None, :]]
+    voter_confidence = (confidences * majority_voters).sum(axis=0) / np.maximum(majority_voters.sum(axis=0), 1)
+    vote_ratio = vote_counts[np.arange(num_symbols), majority] / np.maximum(n_included, 1)
+
+    # Max confidence (first model wins ties, like max())
+    selected = np.where(included, confidences, -np.inf).argmax(axis=0)
+    symbol_idx = np.arange(num_symbols)
+    max_probs = probs[selected, symbol_idx]
+
+    results = {
+        'models_used': n_included,
+        'weighted_average': {
+            'probabilities': weighted_probs,
+            'direction': weighted_probs.argmax(axis=1),
+            'confidence': weighted_probs.max(axis=1)
+        },
+        'majority_voting': {
+            'probabilities': vote_probs,
+            'direction': majority,
+            'confidence': vote_ratio * voter_confidence
+        },
+        'max_confidence': {
+            'probabilities': max_probs,
+            'direction': max_probs.argmax(axis=1),
+            'confidence': confidences[selected, symbol_idx]
+        }
+    }
+
+    # Single available model: every method returns its prediction unchanged
+    single = available.sum(axis=0) == 1
+    if single.any():
+        only = available.argmax(axis=0)
+        for method in ENSEMBLE_METHODS:
+            result = results[method]
+            result['probabilities'] = np.where(single[:, None], probs[only, symbol_idx], result['probabilities'])
+            result['direction'] = np.where(single, probs[only, symbol_idx].argmax(axis=1), result['direction'])
+            result['confidence'] = np.where(single, confidences[only, symbol_idx], result['confidence'])
+
+    return results
+
+
 def create_ensemble_prediction(
     symbol: str,
     model_predictions: List[Dict],
@@ -4,7 +4,7 @@ Provides AI-powered price predictions and risk scoring
 """
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Literal
 import numpy as np
@@ -15,12 +15,29 @@ import redis
 import pickle
 from datetime import datetime, timedelta
 import asyncio
+import time
 
-from app.models.crypto_lstm import CryptoLSTM
+from app.models.crypto_lstm import GLOBAL_MODEL_NAME, build_model
+from app.models.stateful_inference import StatefulInferenceCache
 from app.utils.feature_engineering import engineer_features, create_sequences
-from app.utils.database import fetch_price_history, get_latest_prices
+from app.utils.database import fetch_price_history, fetch_price_histories, get_latest_prices, query_price_histories
+from app.utils.risk_engine import score_histories, align_returns, build_portfolio_breakdown, RISK_CACHE_HOURS, MIN_HISTORY_DAYS
+from app.utils.risk_materializer import RiskMaterializer, get_materialized_risk_score
+from app.utils.accuracy_tracker import AccuracyTracker, LOOKBACK_DAYS
 from app.training.trainer import load_checkpoint
-from app.ensemble import PredictionEnsemble, ModelPrediction, create_ensemble_prediction
+from app.training.backtest import backtest_accuracy, load_published_report
+from app.utils import metrics
+from app.utils.metrics import time_stage, record_cache, MetricsMiddleware
+from app.utils.tracing import TracingMiddleware, RequestProfiler
+from app.ensemble import (
+    PredictionEnsemble,
+    ModelPrediction,
+    create_ensemble_prediction,
+    combine_probability_tensor,
+    RedisPredictionHistory,
+    TemporalEnsemble,
+    ENSEMBLE_CLASSES
+)
 
 # Configure logging
 logging.basicConfig(
@@ -47,6 +64,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency / endpoint tracking for /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Per-request stage tracing: Server-Timing header, slow request log and
+# sampled cProfile dumps (one in PROFILE_EVERY_N_REQUESTS, 0 disables)
+app.add_middleware(
+    TracingMiddleware,
+    profiler=RequestProfiler(
+        sample_every=int(os.getenv('PROFILE_EVERY_N_REQUESTS', 0)),
+        output_dir=os.getenv('PROFILE_DIR', './profiles')
+    ),
+    slow_request_seconds=float(os.getenv('SLOW_REQUEST_SECONDS', 2.0)),
+    server_timing=os.getenv('SERVER_TIMING', 'true').lower() == 'true'
+)
+
 # Redis cache client
 redis_client = redis.Redis(
     host=os.getenv('REDIS_HOST', 'localhost'),
@@ -58,6 +90,9 @@ redis_client = redis.Redis(
 # Model cache (in-memory)
 model_cache: Dict[str, Dict] = {}
 
+# Ensemble variant models (in-memory) by checkpoint file, rebuilt when the file's version changes
+variant_model_cache: Dict[str, Dict] = {}
+
 # Supported cryptocurrencies
 SUPPORTED_SYMBOLS = [
     'BTC', 'ETH', 'SOL', 'BNB', 'XRP',
@@ -70,6 +105,53 @@ MODEL_CHECKPOINT_DIR = os.getenv('MODEL_CHECKPOINT_DIR', './models/checkpoints')
 CACHE_TTL = int(os.getenv('CACHE_TTL', 300))  # 5 minutes
 SEQUENCE_LENGTH = 70  # Reduced from 90 to work with 90 days of data from free API
 INPUT_FEATURES = 20
+RISK_HISTORY_DAYS = 90
+MAX_RISK_BATCH_SYMBOLS = 500
+MAX_PORTFOLIO_ASSETS = 100
+
+# Stateful inference: advance cached LSTM state by one candle instead of
+# re-running the full window; full-window re-sync every N incremental steps
+# (12 keeps probabilities within 0.1 of a full recompute, see stateful_inference)
+STATEFUL_INFERENCE = os.getenv('STATEFUL_INFERENCE', 'false').lower() == 'true'
+STATEFUL_RESYNC_INTERVAL = int(os.getenv('STATEFUL_RESYNC_INTERVAL', 12))
+stateful_cache = StatefulInferenceCache(resync_interval=STATEFUL_RESYNC_INTERVAL)
+
+# Hot reload: poll checkpoint versions (mtime) every N seconds, 0 disables
+MODEL_RELOAD_INTERVAL = float(os.getenv('MODEL_RELOAD_INTERVAL', 30))
+PREDICTION_TIMEFRAMES = ['7d', '14d', '30d']
+ENSEMBLE_METHODS = ['weighted_average', 'majority_voting', 'max_confidence']
+ENSEMBLE_MODEL_VARIANTS = ['best', 'v1']  # {symbol}_best.pth (current/improved), {symbol}_v1.pth (original backup)
+
+# Temporal ensemble: recent ensemble predictions per symbol/timeframe are kept
+# in Redis streams (shared by all workers, kept across restarts) and combined
+# with exponentially decaying weights
+TEMPORAL_HISTORY_SIZE = int(os.getenv('TEMPORAL_HISTORY_SIZE', 10))
+TEMPORAL_DECAY_FACTOR = float(os.getenv('TEMPORAL_DECAY_FACTOR', 0.9))
+temporal_ensemble = TemporalEnsemble(
+    decay_factor=TEMPORAL_DECAY_FACTOR,
+    history=RedisPredictionHistory(redis_client, capacity=TEMPORAL_HISTORY_SIZE)
+)
+
+# Global model: one checkpoint (GLOBAL_best.pth) with a symbol embedding
+# serves every symbol it was trained on instead of one model per symbol
+GLOBAL_MODEL = os.getenv('GLOBAL_MODEL', 'false').lower() == 'true'
+
+# Last seen checkpoint version per symbol
+checkpoint_versions: Dict[str, int] = {}
+model_reloader_task: Optional[asyncio.Task] = None
+
+# Risk score materialization: check for new candles every N seconds, 0 disables
+RISK_MATERIALIZE_INTERVAL = float(os.getenv('RISK_MATERIALIZE_INTERVAL', 300))
+risk_materializer = RiskMaterializer(redis_client, SUPPORTED_SYMBOLS, days=RISK_HISTORY_DAYS)
+risk_materializer_task: Optional[asyncio.Task] = None
+
+# Live accuracy: served predictions are flushed to the prediction log every
+# N seconds (0 disables tracking) and scored against realised prices every
+# ACCURACY_RESOLVE_INTERVAL seconds
+PREDICTION_LOG_INTERVAL = float(os.getenv('PREDICTION_LOG_INTERVAL', 60))
+ACCURACY_RESOLVE_INTERVAL = float(os.getenv('ACCURACY_RESOLVE_INTERVAL', 3600))
+accuracy_tracker = AccuracyTracker()
+accuracy_tracker_task: Optional[asyncio.Task] = None
 
 # ============================================================================
 # Pydantic Models (Request/Response)
@@ -122,6 +204,89 @@ class RiskScoreResponse(BaseModel):
     cache_expires_at: str
 
 
+class RiskScoreBatchRequest(BaseModel):
+    """Request model for batch risk scoring"""
+    symbols: Optional[List[str]] = Field(None, description="Symbols to score (default: all supported symbols)")
+
+    @validator('symbols')
+    def validate_symbols(cls, v):
+        if v is None:
+            return v
+        if len(v) > MAX_RISK_BATCH_SYMBOLS:
+            raise ValueError(f"At most {MAX_RISK_BATCH_SYMBOLS} symbols per batch")
+        # Allow all symbols for risk scoring (no model required); keep order, drop duplicates
+        return list(dict.fromkeys(symbol.upper() for symbol in v))
+
+
+class RiskScoreBatchResponse(BaseModel):
+    """Response model for batch risk scoring"""
+    results: List[RiskScoreResponse]
+    errors: Dict[str, str] = Field(..., description="Symbols that could not be scored")
+    analyzed_at: str
+
+
+class PortfolioRiskRequest(BaseModel):
+    """Request model for portfolio risk scoring"""
+    allocations: Dict[str, float] = Field(..., description="Symbol -> allocation (weights or amounts; normalized to sum to 1)")
+
+    @validator('allocations')
+    def validate_allocations(cls, v):
+        if not v:
+            raise ValueError("At least one allocation is required")
+        if len(v) > MAX_PORTFOLIO_ASSETS:
+            raise ValueError(f"At most {MAX_PORTFOLIO_ASSETS} assets per portfolio")
+
+        allocations: Dict[str, float] = {}
+        for symbol, weight in v.items():
+            if weight < 0:
+                raise ValueError(f"Allocation for {symbol} must be non-negative")
+            allocations[symbol.upper()] = allocations.get(symbol.upper(), 0.0) + weight
+
+        if sum(allocations.values()) <= 0:
+            raise ValueError("Allocations must sum to a positive value")
+        return allocations
+
+
+class PortfolioRiskResponse(BaseModel):
+    """Response model for portfolio risk scoring"""
+    portfolio_risk_score: int = Field(..., ge=0, le=100, description="Portfolio risk score (0-100)")
+    risk_level: Literal['low', 'medium', 'high', 'extreme']
+    metrics: Dict = Field(..., description="Volatility, concentration and correlation risk")
+    assets: Dict = Field(..., description="Per-asset weight, volatility and risk contribution")
+    correlation_matrix: Dict[str, Dict[str, float]]
+    observations: int = Field(..., description="Aligned daily returns used")
+    warnings: List[str]
+    analyzed_at: str
+
+
+class EnsembleBatchRequest(BaseModel):
+    """Request model for batch ensemble prediction"""
+    symbols: Optional[List[str]] = Field(None, description="Symbols to predict (default: all supported symbols)")
+    ensemble_method: Literal['weighted_average', 'majority_voting', 'max_confidence'] = Field(
+        default='weighted_average',
+        description="Ensemble combination method"
+    )
+    min_confidence: float = Field(default=0.3, ge=0, le=1, description="Minimum confidence threshold")
+
+    @validator('symbols')
+    def validate_symbols(cls, v):
+        if v is None:
+            return v
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in v))
+        unsupported = [symbol for symbol in symbols if symbol not in SUPPORTED_SYMBOLS]
+        if unsupported:
+            raise ValueError(f"Symbols not supported: {', '.join(unsupported)}")
+        return symbols
+
+
+class EnsembleBatchResponse(BaseModel):
+    """Response model for batch ensemble prediction"""
+    method: str
+    results: Dict[str, Dict] = Field(..., description="Symbol -> direction, confidence, probabilities, models used")
+    errors: Dict[str, str] = Field(..., description="Symbols without an ensemble prediction")
+    generated_at: str
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
@@ -180,19 +345,85 @@ def get_cache_key(symbol: str, timeframe: str, operation: str = 'prediction') ->
     return f"{operation}:{symbol}:{timeframe}"
 
 
+def model_key(symbol: str) -> str:
+    """Name of the model (cache key and checkpoint prefix) serving a symbol"""
+    return GLOBAL_MODEL_NAME if GLOBAL_MODEL else symbol
+
+
+def get_checkpoint_path(symbol: str) -> str:
+    """Path of the served checkpoint for a symbol"""
+    return os.path.join(MODEL_CHECKPOINT_DIR, f"{symbol}_best.pth")
+
+
+def get_checkpoint_version(symbol: str) -> Optional[int]:
+    """
+    Version of the served checkpoint (mtime in ns), or None if missing
+
+    Checkpoints are published with write-then-rename, so a new version
+    always refers to a complete file.
+    """
+    try:
+        return os.stat(get_checkpoint_path(symbol)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_model_from_checkpoint(symbol: str) -> Dict:
+    """
+    Build a model from the symbol's checkpoint (blocking)
+
+    Returns:
+        Dict with 'model', 'scaler', 'metadata', 'backtest', 'loaded_at',
+        'checkpoint_version' ('backtest' is the published backtest report or None)
+    """
+    checkpoint_path = get_checkpoint_path(symbol)
+    version = get_checkpoint_version(symbol)
+
+    with metrics.MODEL_LOAD_SECONDS.time(symbol=symbol):
+        # Load checkpoint first to get architecture config
+        checkpoint = torch.load(checkpoint_path, map_location='cpu')
+        config = checkpoint.get('config', {})
+
+        # Create model instance with correct architecture (stacked or fused)
+        model = build_model(config, input_size=INPUT_FEATURES)
+
+        logger.info(f"Loading {config.get('architecture', 'stacked')} model for {symbol} with architecture: {model.hidden_sizes}")
+
+        # Load checkpoint weights
+        checkpoint_data = load_checkpoint(checkpoint_path, model)
+
+        model.eval()  # Set to evaluation mode
+
+    return {
+        'model': model,
+        'scaler': checkpoint_data.get('scaler'),
+        'metadata': checkpoint_data.get('metadata', {}),
+        'backtest': load_published_report(checkpoint_path),
+        'loaded_at': datetime.utcnow().isoformat(),
+        'checkpoint_version': version
+    }
+
+
 async def load_model(symbol: str) -> Dict:
     """
     Load ML model from checkpoint or cache
 
+    With GLOBAL_MODEL every symbol shares the one cached global model.
+
     Returns:
         Dict with 'model', 'scaler', 'metadata'
     """
-    if symbol in model_cache:
+    key = model_key(symbol)
+
+    if key in model_cache:
+        record_cache('model', hit=True)
         logger.info(f"Model for {symbol} loaded from memory cache")
-        return model_cache[symbol]
+        return ensure_model_serves(model_cache[key], symbol)
+
+    record_cache('model', hit=False)
 
     # Load from checkpoint
-    checkpoint_path = os.path.join(MODEL_CHECKPOINT_DIR, f"{symbol}_best.pth")
+    checkpoint_path = get_checkpoint_path(key)
 
     if not os.path.exists(checkpoint_path):
         logger.error(f"Model checkpoint not found: {checkpoint_path}")
@@ -202,48 +433,210 @@ async def load_model(symbol: str) -> Dict:
         )
 
     try:
-        # Load checkpoint first to get architecture config
-        checkpoint = torch.load(checkpoint_path, map_location='cpu')
-        config = checkpoint.get('config', {})
+        model_info = load_model_from_checkpoint(key)
 
-        # Extract architecture parameters from config
-        hidden_sizes = config.get('hidden_sizes', [128, 64, 32])
-        dropout = config.get('dropout', 0.2)
+        # Cache in memory
+        model_cache[key] = model_info
+        checkpoint_versions[key] = model_info['checkpoint_version']
+        logger.info(f"Model for {key} loaded from checkpoint and cached")
 
-        # Create model instance with correct architecture
-        model = CryptoLSTM(
-            input_size=INPUT_FEATURES,
-            hidden_sizes=hidden_sizes,
-            num_classes=3,
-            dropout=dropout
+    except Exception as e:
+        logger.error(f"Error loading model for {symbol}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to load model: {str(e)}"
         )
 
-        logger.info(f"Loading model for {symbol} with architecture: {hidden_sizes}")
+    return ensure_model_serves(model_info, symbol)
 
-        # Load checkpoint weights
-        checkpoint_data = load_checkpoint(checkpoint_path, model)
 
-        model.eval()  # Set to evaluation mode
+def ensure_model_serves(model_info: Dict, symbol: str) -> Dict:
+    """Raise 404 if a global model was not trained on the symbol"""
+    symbols = getattr(model_info['model'], 'symbols', None)
+    if symbols is not None and symbol not in symbols:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"The global model was not trained on {symbol}. Please retrain it with {symbol} included."
+        )
+    return model_info
 
-        # Cache in memory
-        model_info = {
-            'model': model,
-            'scaler': checkpoint_data.get('scaler'),
-            'metadata': checkpoint_data.get('metadata', {}),
-            'loaded_at': datetime.utcnow().isoformat()
-        }
 
-        model_cache[symbol] = model_info
-        logger.info(f"Model for {symbol} loaded from checkpoint and cached")
+def invalidate_prediction_cache(symbol: str):
+    """Delete the Redis prediction and ensemble keys of one symbol"""
+    keys = [get_cache_key(symbol, timeframe) for timeframe in PREDICTION_TIMEFRAMES]
+    keys += [
+        f"ensemble:{symbol}:{timeframe}:{method}"
+        for timeframe in PREDICTION_TIMEFRAMES
+        for method in ENSEMBLE_METHODS
+    ]
+    redis_client.delete(*keys)
 
-        return model_info
 
-    except Exception as e:
-        logger.error(f"Error loading model for {symbol}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to load model: {str(e)}"
-        )
+def update_temporal_ensemble(symbol: str, timeframe: str, ensemble_result: Dict) -> Optional[Dict]:
+    """
+    Add an ensemble prediction to the shared history and combine the history
+
+    Args:
+        symbol: Cryptocurrency symbol
+        timeframe: Prediction timeframe
+        ensemble_result: Result of create_ensemble_prediction
+
+    Returns:
+        Temporal direction, confidence and trend, or None if Redis is unavailable
+    """
+    history_key = f"{symbol}:{timeframe}"
+    prediction = ModelPrediction(
+        symbol=symbol,
+        probabilities=ensemble_result['probabilities'],
+        direction=ensemble_result['direction'],
+        confidence=ensemble_result['confidence'],
+        model_name='ensemble'
+    )
+
+    try:
+        temporal_ensemble.add_prediction(history_key, prediction)
+        _, direction, confidence, metadata = temporal_ensemble.get_temporal_prediction(history_key)
+    except redis.RedisError as e:
+        metrics.REDIS_ERRORS.inc(operation='stream')
+        logger.warning(f"Temporal history unavailable for {symbol} {timeframe}: {e}")
+        return None
+
+    return {
+        'direction': direction,
+        'confidence': round(confidence, 3),
+        'predictions_used': metadata['predictions_used'],
+        'trend': metadata['trend']
+    }
+
+
+async def reload_updated_models() -> List[str]:
+    """
+    Reload models whose checkpoint changed since it was last seen
+
+    The new model is built in a worker thread and swapped into model_cache
+    in one assignment, so requests keep using the old model until then.
+    Only the predictions of symbols served by a changed model are
+    invalidated (all symbols when the global model changes).
+
+    Returns:
+        Symbols whose checkpoint changed
+    """
+    changed = []
+
+    for key in dict.fromkeys(model_key(symbol) for symbol in SUPPORTED_SYMBOLS):
+        version = get_checkpoint_version(key)
+        previous = checkpoint_versions.get(key)
+        if version is None or version == previous:
+            continue
+
+        checkpoint_versions[key] = version
+        if previous is None and key not in model_cache:
+            # First sighting; nothing served from this model yet
+            continue
+
+        if key in model_cache:
+            try:
+                model_cache[key] = await asyncio.to_thread(load_model_from_checkpoint, key)
+                logger.info(f"♻️  Reloaded model for {key} (checkpoint version {version})")
+            except Exception as e:
+                logger.error(f"Reload failed for {key}, keeping previous model: {e}")
+                continue
+
+        for symbol in SUPPORTED_SYMBOLS:
+            if model_key(symbol) != key:
+                continue
+
+            changed.append(symbol)
+            stateful_cache.invalidate(symbol)
+
+            try:
+                invalidate_prediction_cache(symbol)
+            except Exception as e:
+                metrics.REDIS_ERRORS.inc(operation='delete')
+                logger.warning(f"Error clearing Redis cache for {symbol}: {e}")
+
+    return changed
+
+
+async def risk_materializer_loop():
+    """Background task: rematerialize risk scores after each price ingestion"""
+    while True:
+        try:
+            await asyncio.to_thread(risk_materializer.refresh)
+        except Exception as e:
+            logger.error(f"Risk materializer error: {e}")
+        await asyncio.sleep(RISK_MATERIALIZE_INTERVAL)
+
+
+def resolve_live_accuracy() -> Dict:
+    """
+    Join the prediction log against realised prices and refresh live accuracy (blocking)
+
+    Only real candles are used (no mock fallback): symbols without rows keep
+    their previous statistics, and a failing query raises before anything
+    is replaced.
+    """
+    try:
+        histories = query_price_histories(SUPPORTED_SYMBOLS, days=LOOKBACK_DAYS)
+    except Exception:
+        metrics.DB_ERRORS.inc(operation='price_histories')
+        raise
+    return accuracy_tracker.resolve(histories)
+
+
+async def accuracy_tracker_loop():
+    """Background task: flush served predictions and periodically rescore them"""
+    last_resolved = None
+    while True:
+        try:
+            await asyncio.to_thread(accuracy_tracker.flush)
+
+            if ACCURACY_RESOLVE_INTERVAL > 0 and (
+                last_resolved is None or time.monotonic() - last_resolved >= ACCURACY_RESOLVE_INTERVAL
+            ):
+                last_resolved = time.monotonic()
+                summary = await asyncio.to_thread(resolve_live_accuracy)
+                logger.info(f"Live accuracy updated from {summary['resolved']} resolved predictions")
+        except Exception as e:
+            logger.error(f"Accuracy tracker error: {e}")
+        await asyncio.sleep(PREDICTION_LOG_INTERVAL)
+
+
+def record_served_predictions(symbol: str, model_version: Optional[int], price: float, probabilities: Dict[str, np.ndarray]):
+    """Queue served predictions (timeframe -> probabilities) for live accuracy scoring"""
+    if PREDICTION_LOG_INTERVAL <= 0:
+        return
+    for timeframe, timeframe_probabilities in probabilities.items():
+        accuracy_tracker.record(symbol, timeframe, timeframe_probabilities, price, model_version)
+
+
+def historical_accuracy(symbol: str, timeframe: str, model_info: Dict) -> Dict[str, float]:
+    """
+    last30Days / last90Days accuracy of the served model for a symbol and timeframe
+
+    Live accuracy of the loaded checkpoint version is used once enough of its
+    predictions have resolved, then the published walk-forward backtest,
+    then the checkpoint's test/validation accuracy.
+    """
+    metadata = model_info.get('metadata', {})
+    return (
+        accuracy_tracker.accuracy(symbol, timeframe, model_info.get('checkpoint_version'))
+        or backtest_accuracy(model_info.get('backtest'), symbol, timeframe)
+        or {
+            'last30Days': metadata.get('test_accuracy', 0.65),
+            'last90Days': metadata.get('val_accuracy', 0.68)
+        }
+    )
+
+
+async def model_reloader():
+    """Background task: poll checkpoint versions and hot-swap changed models"""
+    while True:
+        await asyncio.sleep(MODEL_RELOAD_INTERVAL)
+        try:
+            await reload_updated_models()
+        except Exception as e:
+            logger.error(f"Model reloader error: {e}")
 
 
 def calculate_confidence(probabilities: np.ndarray) -> tuple:
@@ -273,6 +666,103 @@ def get_direction_from_probabilities(probabilities: np.ndarray) -> str:
     return classes[predicted_class_idx]
 
 
+def select_horizon(model, probabilities: np.ndarray, timeframe: str) -> np.ndarray:
+    """
+    Class probabilities of one timeframe from a model output row
+
+    Multi-horizon models output one row per head and the head closest to
+    the timeframe is used; single-horizon models serve the same
+    probabilities for every timeframe.
+    """
+    if getattr(model, 'horizons', None) is None:
+        return probabilities
+    return probabilities[model.horizon_index(int(timeframe.replace('d', '')))]
+
+
+def build_prediction_response(
+    symbol: str,
+    timeframe: str,
+    probabilities: np.ndarray,
+    price_history,
+    latest_features: Dict,
+    metadata: Dict,
+    accuracy: Optional[Dict] = None
+) -> PredictionResponse:
+    """
+    Build the /predict response for one timeframe from class probabilities
+
+    Args:
+        accuracy: historical_accuracy of the response (default: test and
+            validation accuracy from metadata)
+    """
+    # Parse prediction
+    direction = get_direction_from_probabilities(probabilities)
+    confidence_score, confidence_level = calculate_confidence(probabilities)
+
+    # Get current price
+    current_price = float(price_history['price'].iloc[-1])
+
+    # Calculate target price based on direction and timeframe
+    timeframe_days = int(timeframe.replace('d', ''))
+    historical_volatility = price_history['price'].pct_change().std()
+
+    if direction == 'bullish':
+        target_price = current_price * (1 + historical_volatility * timeframe_days / 30 * confidence_score)
+    elif direction == 'bearish':
+        target_price = current_price * (1 - historical_volatility * timeframe_days / 30 * confidence_score)
+    else:  # neutral
+        target_price = current_price
+
+    # Calculate target price range
+    target_price_range = {
+        'low': target_price * 0.95,
+        'high': target_price * 1.05
+    }
+
+    potential_gain = ((target_price - current_price) / current_price) * 100
+
+    # Extract indicators
+    indicators = {
+        'rsi': round(float(latest_features.get('rsi', 50)), 2),
+        'macd': 'bullish' if latest_features.get('macd', 0) > latest_features.get('macd_signal', 0) else 'bearish',
+        'volumeTrend': 'increasing' if latest_features.get('volume_change', 0) > 0 else 'decreasing',
+        'socialSentiment': round(float(latest_features.get('social_score', 50)) / 100, 2)
+    }
+
+    # Generate explanation
+    explanation = generate_explanation(symbol, direction, indicators, confidence_score)
+
+    # Build response
+    generated_at = datetime.utcnow()
+    expires_at = generated_at + timedelta(seconds=CACHE_TTL)
+
+    return PredictionResponse(
+        symbol=symbol,
+        timeframe=timeframe,
+        prediction={
+            'direction': direction,
+            'confidence': confidence_level,
+            'confidenceScore': round(confidence_score, 3),
+            'targetPrice': round(target_price, 2),
+            'targetPriceRange': {
+                'low': round(target_price_range['low'], 2),
+                'high': round(target_price_range['high'], 2)
+            },
+            'currentPrice': round(current_price, 2),
+            'potentialGain': round(potential_gain, 2)
+        },
+        indicators=indicators,
+        explanation=explanation,
+        historical_accuracy=accuracy or {
+            'last30Days': metadata.get('test_accuracy', 0.65),
+            'last90Days': metadata.get('val_accuracy', 0.68)
+        },
+        generated_at=generated_at.isoformat() + 'Z',
+        expires_at=expires_at.isoformat() + 'Z',
+        model_version=metadata.get('model_version', 'v1.0.0')
+    )
+
+
 def generate_explanation(symbol: str, direction: str, indicators: Dict, confidence_score: float) -> str:
     """Generate human-readable prediction explanation"""
 
@@ -310,43 +800,205 @@ def generate_explanation(symbol: str, direction: str, indicators: Dict, confiden
     return explanation
 
 
-async def fetch_and_prepare_data(symbol: str) -> tuple:
+def load_variant_model(name: str, variant: str) -> Optional[Dict]:
     """
-    Fetch historical data and prepare for prediction
+    Model of one ensemble checkpoint variant ({name}_{variant}.pth), cached in memory
+
+    The cached model is reused while the checkpoint version (mtime) is
+    unchanged, so requests only pay a stat() instead of a torch.load.
 
     Returns:
-        (features_tensor, latest_features_dict, price_history)
+        Dict with 'model', 'metadata', 'checkpoint_version', or None if the
+        checkpoint does not exist
     """
+    model_file = f"{name}_{variant}.pth"
+    checkpoint_path = os.path.join(MODEL_CHECKPOINT_DIR, model_file)
+
     try:
-        # Fetch 120 days to ensure we have 90 days after feature engineering
+        version = os.stat(checkpoint_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = variant_model_cache.get(model_file)
+    if cached is not None and cached['checkpoint_version'] == version:
+        record_cache('variant_model', hit=True)
+        return cached
+
+    record_cache('variant_model', hit=False)
+
+    with metrics.MODEL_LOAD_SECONDS.time(symbol=name), time_stage('model_load'):
+        checkpoint = torch.load(checkpoint_path, map_location='cpu')
+        model = build_model(checkpoint.get('config', {}), input_size=INPUT_FEATURES)
+        load_checkpoint(checkpoint_path, model)
+        model.eval()
+
+    variant_info = {
+        'model': model,
+        'metadata': checkpoint.get('metadata', {}),
+        'checkpoint_version': version
+    }
+    variant_model_cache[model_file] = variant_info
+    logger.info(f"Loaded ensemble variant {model_file}")
+
+    return variant_info
+
+
+def predict_variants(windows: Dict[str, torch.Tensor], timeframe: str = '7d') -> Dict[str, List[Dict]]:
+    """
+    Run every available checkpoint variant on the input windows of many symbols (blocking)
+
+    Symbols served by the same checkpoint are stacked into one batch, so
+    each variant model runs a single forward pass; with GLOBAL_MODEL every
+    symbol shares GLOBAL_{variant}.pth and the whole request is one mixed-
+    symbol batch per variant. Multi-horizon variants
+    contribute the head closest to the timeframe. A variant's accuracy (its
+    ensemble weight) is its live last-30-day accuracy once tracked, else
+    its test accuracy.
+
+    Args:
+        windows: Symbol -> normalized input window (1, SEQUENCE_LENGTH, INPUT_FEATURES)
+        timeframe: Prediction timeframe
+
+    Returns:
+        Symbol -> list of prediction dicts (probabilities, direction,
+        confidence, model_name, accuracy, variant, checkpoint_version) for the
+        variants that exist and load
+    """
+    predictions: Dict[str, List[Dict]] = {symbol: [] for symbol in windows}
+
+    # Symbols per checkpoint name
+    groups: Dict[str, List[str]] = {}
+    for symbol in windows:
+        groups.setdefault(model_key(symbol), []).append(symbol)
+
+    for variant in ENSEMBLE_MODEL_VARIANTS:
+        for name, group in groups.items():
+            model_file = f"{name}_{variant}.pth"
+
+            try:
+                variant_info = load_variant_model(name, variant)
+                if variant_info is None:
+                    continue
+
+                # A global variant only serves the symbols it was trained on
+                model = variant_info['model']
+                trained_on = getattr(model, 'symbols', None)
+                served = [symbol for symbol in group if trained_on is None or symbol in trained_on]
+                if not served:
+                    continue
+
+                with time_stage('forward'), torch.no_grad():
+                    batch = torch.cat([model.prepare_input(windows[symbol], symbol) for symbol in served])
+                    output = model(batch).cpu().numpy()
+
+            except Exception as e:
+                logger.warning(f"Could not load {model_file}: {e}")
+                continue
+
+            version = variant_info['checkpoint_version']
+            for symbol, row in zip(served, output):
+                probabilities = select_horizon(model, row, timeframe)
+                direction = get_direction_from_probabilities(probabilities)
+                confidence_score, _ = calculate_confidence(probabilities)
+                live_accuracy = accuracy_tracker.accuracy(symbol, timeframe, version)
+
+                predictions[symbol].append({
+                    'probabilities': probabilities,
+                    'direction': direction,
+                    'confidence': confidence_score,
+                    'model_name': f"{symbol}_{model.hidden_sizes}",
+                    'accuracy': live_accuracy['last30Days'] if live_accuracy else variant_info['metadata'].get('test_accuracy', 0.5),
+                    'variant': variant,
+                    'checkpoint_version': version
+                })
+
+            logger.info(f"Ran {model_file} on {len(served)} symbol(s)")
+
+    return predictions
+
+
+def predict_model_variants(symbol: str, features_tensor: torch.Tensor, timeframe: str = '7d') -> List[Dict]:
+    """
+    Run every available checkpoint variant of a symbol on one input window
+
+    Returns:
+        List of prediction dicts (see predict_variants)
+    """
+    return predict_variants({symbol: features_tensor}, timeframe)[symbol]
+
+
+async def fetch_features(symbol: str) -> tuple:
+    """
+    Fetch historical data and engineer features
+
+    Returns:
+        (features, price_history)
+    """
+    # Fetch 120 days to ensure we have 90 days after feature engineering
+    with time_stage('db_fetch'):
         df = await fetch_price_history(symbol, days=120)
 
-        if len(df) < 91:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Insufficient historical data for {symbol} (need 91+ days, got {len(df)})"
-            )
+    return features_from_history(symbol, df), df
+
+
+def features_from_history(symbol: str, df):
+    """
+    Engineer features from a fetched price history
+
+    Returns:
+        Features DataFrame
+
+    Raises:
+        HTTPException: 400 if the history is too short
+    """
+    if len(df) < 91:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient historical data for {symbol} (need 91+ days, got {len(df)})"
+        )
 
-        # Engineer features
+    # Engineer features
+    with time_stage('feature_engineering'):
         features = engineer_features(df)
 
-        if len(features) < SEQUENCE_LENGTH:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Insufficient data after feature engineering (need {SEQUENCE_LENGTH}+ days, got {len(features)})"
-            )
+    if len(features) < SEQUENCE_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient data after feature engineering (need {SEQUENCE_LENGTH}+ days, got {len(features)})"
+        )
 
-        # Get last N days for prediction (based on SEQUENCE_LENGTH)
-        features_for_prediction = features.tail(SEQUENCE_LENGTH)
+    return features
 
-        # Convert to numpy array
-        features_array = features_for_prediction.values
+
+def prepare_window_tensor(features) -> torch.Tensor:
+    """
+    Normalize the last SEQUENCE_LENGTH rows of features into a model input tensor
+
+    Returns:
+        Tensor of shape (1, SEQUENCE_LENGTH, INPUT_FEATURES)
+    """
+    with time_stage('normalization'):
+        # Get last N days for prediction (based on SEQUENCE_LENGTH)
+        features_array = features.tail(SEQUENCE_LENGTH).values
 
         # Normalize features (using stored scaler would be better)
         features_normalized = (features_array - features_array.mean(axis=0)) / (features_array.std(axis=0) + 1e-8)
 
         # Convert to PyTorch tensor
-        features_tensor = torch.FloatTensor(features_normalized).unsqueeze(0)  # Shape: (1, 90, 20)
+        return torch.FloatTensor(features_normalized).unsqueeze(0)  # Shape: (1, 70, 20)
+
+
+async def fetch_and_prepare_data(symbol: str) -> tuple:
+    """
+    Fetch historical data and prepare for prediction
+
+    Returns:
+        (features_tensor, latest_features_dict, price_history)
+    """
+    try:
+        features, df = await fetch_features(symbol)
+
+        features_tensor = prepare_window_tensor(features)
 
         # Get latest feature values for indicators
         latest_features = features.iloc[-1].to_dict()
@@ -380,11 +1032,26 @@ async def root():
             "/redoc": "API documentation (ReDoc)",
             "/predict": "Price prediction endpoint",
             "/risk-score": "Risk scoring endpoint",
-            "/models/{symbol}": "Model information"
+            "/models/{symbol}": "Model information",
+            "/metrics": "Prometheus metrics"
         }
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def get_metrics():
+    """
+    Prometheus metrics
+
+    Per-stage latency histograms, cache hit ratios, model load times,
+    executor queue depth and Redis/DB error counters.
+    """
+    return PlainTextResponse(
+        metrics.registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
     """
@@ -395,6 +1062,7 @@ async def health_check():
     try:
         redis_connected = redis_client.ping()
     except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='ping')
         logger.warning(f"Redis connection failed: {e}")
         redis_connected = False
 
@@ -425,11 +1093,14 @@ async def predict_price(request: PredictionRequest):
     # Check cache first
     cache_key = get_cache_key(symbol, timeframe)
     try:
-        cached_result = redis_client.get(cache_key)
+        with time_stage('cache_lookup'):
+            cached_result = redis_client.get(cache_key)
+        record_cache('prediction', hit=bool(cached_result))
         if cached_result:
             logger.info(f"Returning cached prediction for {symbol} {timeframe}")
             return pickle.loads(cached_result)
     except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='get')
         logger.warning(f"Cache read error: {e}")
 
     try:
@@ -438,88 +1109,73 @@ async def predict_price(request: PredictionRequest):
         model = model_info['model']
         metadata = model_info['metadata']
 
-        # Fetch and prepare data
-        features_tensor, latest_features, price_history = await fetch_and_prepare_data(symbol)
-
-        # Make prediction
-        with torch.no_grad():
-            output = model(features_tensor)
-            probabilities = output[0].cpu().numpy()
-
-        # Parse prediction
-        direction = get_direction_from_probabilities(probabilities)
-        confidence_score, confidence_level = calculate_confidence(probabilities)
-
-        # Get current price
-        current_price = float(price_history['price'].iloc[-1])
-
-        # Calculate target price based on direction and timeframe
-        timeframe_days = int(timeframe.replace('d', ''))
-        historical_volatility = price_history['price'].pct_change().std()
-
-        if direction == 'bullish':
-            target_price = current_price * (1 + historical_volatility * timeframe_days / 30 * confidence_score)
-        elif direction == 'bearish':
-            target_price = current_price * (1 - historical_volatility * timeframe_days / 30 * confidence_score)
-        else:  # neutral
-            target_price = current_price
-
-        # Calculate target price range
-        target_price_range = {
-            'low': target_price * 0.95,
-            'high': target_price * 1.05
-        }
-
-        potential_gain = ((target_price - current_price) / current_price) * 100
+        if STATEFUL_INFERENCE:
+            # Advance cached recurrent state over new candles only
+            try:
+                features, price_history = await fetch_features(symbol)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(f"Error preparing data for {symbol}: {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Data preparation failed: {str(e)}"
+                )
 
-        # Extract indicators
-        indicators = {
-            'rsi': round(float(latest_features.get('rsi', 50)), 2),
-            'macd': 'bullish' if latest_features.get('macd', 0) > latest_features.get('macd_signal', 0) else 'bearish',
-            'volumeTrend': 'increasing' if latest_features.get('volume_change', 0) > 0 else 'decreasing',
-            'socialSentiment': round(float(latest_features.get('social_score', 50)) / 100, 2)
+            latest_features = features.iloc[-1].to_dict()
+            with time_stage('forward'):
+                probabilities, inference_mode = stateful_cache.predict(symbol, model, features, SEQUENCE_LENGTH)
+            logger.info(f"Stateful inference for {symbol}: {inference_mode}")
+        else:
+            # Fetch and prepare data
+            features_tensor, latest_features, price_history = await fetch_and_prepare_data(symbol)
+
+            # Make prediction
+            with time_stage('forward'), torch.no_grad():
+                output = model(model.prepare_input(features_tensor, symbol))
+                probabilities = output[0].cpu().numpy()
+
+        response_started = time.perf_counter()
+
+        # Multi-horizon models answer every timeframe from this one forward
+        # pass, so all of them are built and cached together
+        timeframes = [timeframe]
+        if getattr(model, 'horizons', None) is not None:
+            timeframes += [other for other in PREDICTION_TIMEFRAMES if other != timeframe]
+
+        served_probabilities = {served: select_horizon(model, probabilities, served) for served in timeframes}
+        responses = {
+            served: build_prediction_response(
+                symbol, served, served_probabilities[served],
+                price_history, latest_features, metadata, historical_accuracy(symbol, served, model_info)
+            )
+            for served in timeframes
         }
+        response = responses[timeframe]
 
-        # Generate explanation
-        explanation = generate_explanation(symbol, direction, indicators, confidence_score)
-
-        # Build response
-        generated_at = datetime.utcnow()
-        expires_at = generated_at + timedelta(seconds=CACHE_TTL)
+        metrics.observe_stage('response_build', response_started)
 
-        response = PredictionResponse(
-            symbol=symbol,
-            timeframe=timeframe,
-            prediction={
-                'direction': direction,
-                'confidence': confidence_level,
-                'confidenceScore': round(confidence_score, 3),
-                'targetPrice': round(target_price, 2),
-                'targetPriceRange': {
-                    'low': round(target_price_range['low'], 2),
-                    'high': round(target_price_range['high'], 2)
-                },
-                'currentPrice': round(current_price, 2),
-                'potentialGain': round(potential_gain, 2)
-            },
-            indicators=indicators,
-            explanation=explanation,
-            historical_accuracy={
-                'last30Days': metadata.get('test_accuracy', 0.65),
-                'last90Days': metadata.get('val_accuracy', 0.68)
-            },
-            generated_at=generated_at.isoformat() + 'Z',
-            expires_at=expires_at.isoformat() + 'Z',
-            model_version=metadata.get('model_version', 'v1.0.0')
+        # Log served predictions for live accuracy
+        record_served_predictions(
+            symbol, model_info.get('checkpoint_version'), float(price_history['price'].iloc[-1]), served_probabilities
         )
 
-        # Cache response
+        # Cache response(s)
         try:
-            redis_client.setex(cache_key, CACHE_TTL, pickle.dumps(response))
+            with time_stage('cache_write'):
+                if len(responses) == 1:
+                    redis_client.setex(cache_key, CACHE_TTL, pickle.dumps(response))
+                else:
+                    pipeline = redis_client.pipeline()
+                    for served, served_response in responses.items():
+                        pipeline.setex(get_cache_key(symbol, served), CACHE_TTL, pickle.dumps(served_response))
+                    pipeline.execute()
         except Exception as e:
+            metrics.REDIS_ERRORS.inc(operation='set')
             logger.warning(f"Cache write error: {e}")
 
-        logger.info(f"Prediction generated for {symbol} {timeframe}: {direction} ({confidence_score:.2f})")
+        prediction = response.prediction
+        logger.info(f"Prediction generated for {symbol} {timeframe}: {prediction['direction']} ({prediction['confidenceScore']:.2f})")
 
         return response
 
@@ -544,137 +1200,182 @@ async def calculate_risk_score(request: RiskScoreRequest):
     """
     symbol = request.symbol
 
-    # Check cache
+    # Precomputed table (O(1) lookup), refreshed after each price ingestion
+    try:
+        with time_stage('cache_lookup'):
+            materialized = get_materialized_risk_score(redis_client, symbol)
+        record_cache('risk_table', hit=bool(materialized))
+        if materialized:
+            logger.info(f"Returning materialized risk score for {symbol}")
+            return RiskScoreResponse(**materialized)
+    except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='hget')
+        logger.warning(f"Risk table read error: {e}")
+
+    # Check cache (on-demand fallback)
     cache_key = get_cache_key(symbol, '7d', 'risk_score')
     try:
-        cached_result = redis_client.get(cache_key)
+        with time_stage('cache_lookup'):
+            cached_result = redis_client.get(cache_key)
+        record_cache('risk_score', hit=bool(cached_result))
         if cached_result:
             logger.info(f"Returning cached risk score for {symbol}")
             return pickle.loads(cached_result)
     except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='get')
         logger.warning(f"Cache read error: {e}")
 
     try:
         # Fetch price history
-        df = await fetch_price_history(symbol, days=90)
+        with time_stage('db_fetch'):
+            df = await fetch_price_history(symbol, days=RISK_HISTORY_DAYS)
+
+        # Score with the vectorized engine (S=1)
+        with time_stage('risk_scoring'):
+            breakdowns, errors = score_histories({symbol: df}, length=RISK_HISTORY_DAYS)
 
-        if len(df) < 30:
+        if errors:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Insufficient data for risk scoring (need 30+ days)"
+                detail=errors[symbol]
             )
 
-        # Calculate risk factors
-        prices = df['price'].values
-        volume = df['volume_24h'].values
-
-        # Volatility (30-day)
-        recent_30d = prices[-30:]
-        volatility = np.std(recent_30d) / np.mean(recent_30d)
-        volatility_score = min(100, int(volatility * 200))
-
-        # Price swings (7-day max swing)
-        recent_7d = prices[-7:]
-        max_swing = (np.max(recent_7d) - np.min(recent_7d)) / np.mean(recent_7d)
-        swing_score = min(100, int(max_swing * 150))
-
-        # Volume volatility
-        volume_changes = np.diff(volume) / (volume[:-1] + 1)
-        volume_volatility = np.std(volume_changes)
-        volume_score = min(100, int(volume_volatility * 100))
-
-        # Trend strength
-        x = np.arange(len(recent_30d))
-        trend_slope = np.polyfit(x, recent_30d, 1)[0] / np.mean(recent_30d)
-        trend_score = min(100, int(abs(trend_slope) * 500))
-
-        # Calculate composite risk score
-        risk_score = int(
-            volatility_score * 0.4 +  # 40% weight
-            swing_score * 0.3 +        # 30% weight
-            volume_score * 0.2 +       # 20% weight
-            trend_score * 0.1          # 10% weight
+        response = RiskScoreResponse(**breakdowns[0])
+
+        # Cache response (2 hour TTL for risk scores)
+        try:
+            with time_stage('cache_write'):
+                redis_client.setex(cache_key, RISK_CACHE_HOURS * 3600, pickle.dumps(response))
+        except Exception as e:
+            metrics.REDIS_ERRORS.inc(operation='set')
+            logger.warning(f"Cache write error: {e}")
+
+        logger.info(f"Risk score calculated for {symbol}: {response.risk_score}/100 ({response.risk_level})")
+
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Risk scoring failed for {symbol}: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Risk scoring failed: {str(e)}"
         )
 
-        risk_score = max(0, min(100, risk_score))
 
-        # Determine risk level
-        if risk_score < 30:
-            risk_level = 'low'
-        elif risk_score < 60:
-            risk_level = 'medium'
-        elif risk_score < 80:
-            risk_level = 'high'
-        else:
-            risk_level = 'extreme'
-
-        # Build risk factors dict
-        risk_factors = {
-            'volatility': {
-                'value': round(volatility, 4),
-                'score': volatility_score,
-                'risk': 'high' if volatility_score > 60 else 'medium' if volatility_score > 30 else 'low'
-            },
-            'priceSwings': {
-                'value': round(max_swing, 4),
-                'score': swing_score,
-                'risk': 'high' if swing_score > 60 else 'medium' if swing_score > 30 else 'low'
-            },
-            'volumeVolatility': {
-                'value': round(volume_volatility, 4),
-                'score': volume_score,
-                'risk': 'high' if volume_score > 60 else 'medium' if volume_score > 30 else 'low'
-            },
-            'trendStrength': {
-                'value': round(abs(trend_slope), 6),
-                'score': trend_score,
-                'risk': 'high' if trend_score > 60 else 'medium' if trend_score > 30 else 'low'
-            }
-        }
+@app.post("/risk-score/batch", response_model=RiskScoreBatchResponse, tags=["Risk Scoring"])
+async def calculate_risk_scores_batch(request: RiskScoreBatchRequest):
+    """
+    Calculate degen risk scores for many cryptocurrencies in one pass
 
-        # Generate warnings
-        warnings = []
-        if volatility_score > 70:
-            warnings.append(f"High volatility detected ({volatility * 100:.1f}% daily stddev)")
-        if swing_score > 70:
-            warnings.append(f"Large price swings in last 7 days ({max_swing * 100:.1f}%)")
-        if risk_score > 80:
-            warnings.append("EXTREME RISK: This asset is highly volatile and speculative")
+    - **symbols**: Cryptocurrency symbols (default: all supported symbols)
 
-        # Build response
-        analyzed_at = datetime.utcnow()
-        cache_expires_at = analyzed_at + timedelta(hours=2)
+    Price histories are fetched with one query and scored together as a
+    (symbols x days) matrix. Symbols without enough history are listed in
+    `errors` instead of failing the whole batch.
+    """
+    symbols = request.symbols or SUPPORTED_SYMBOLS
 
-        response = RiskScoreResponse(
-            symbol=symbol,
-            risk_score=risk_score,
-            risk_level=risk_level,
-            risk_factors=risk_factors,
-            warnings=warnings if warnings else ["No major risk warnings"],
-            analyzed_at=analyzed_at.isoformat() + 'Z',
-            cache_expires_at=cache_expires_at.isoformat() + 'Z'
+    try:
+        with time_stage('db_fetch'):
+            frames = await fetch_price_histories(symbols, days=RISK_HISTORY_DAYS)
+        with time_stage('risk_scoring'):
+            breakdowns, errors = score_histories(frames, length=RISK_HISTORY_DAYS)
+        results = [RiskScoreResponse(**breakdown) for breakdown in breakdowns]
+
+    except Exception as e:
+        logger.error(f"Batch risk scoring failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch risk scoring failed: {str(e)}"
         )
 
-        # Cache response (2 hour TTL for risk scores)
-        try:
-            redis_client.setex(cache_key, 7200, pickle.dumps(response))
-        except Exception as e:
-            logger.warning(f"Cache write error: {e}")
+    # Write through to the per-symbol cache used by /risk-score
+    try:
+        pipeline = redis_client.pipeline()
+        for response in results:
+            cache_key = get_cache_key(response.symbol, '7d', 'risk_score')
+            pipeline.setex(cache_key, RISK_CACHE_HOURS * 3600, pickle.dumps(response))
+        pipeline.execute()
+    except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='pipeline')
+        logger.warning(f"Cache write error: {e}")
+
+    logger.info(f"Batch risk scores calculated for {len(results)}/{len(symbols)} symbols")
+
+    return RiskScoreBatchResponse(
+        results=results,
+        errors=errors,
+        analyzed_at=datetime.utcnow().isoformat() + 'Z'
+    )
 
-        logger.info(f"Risk score calculated for {symbol}: {risk_score}/100 ({risk_level})")
+
+@app.post("/risk-score/portfolio", response_model=PortfolioRiskResponse, tags=["Risk Scoring"])
+async def calculate_portfolio_risk(request: PortfolioRiskRequest):
+    """
+    Calculate portfolio-level risk from allocations
+
+    - **allocations**: Map of symbol to allocation (normalized to weights)
+
+    Histories for all holdings are fetched in one query and aligned by day.
+    A single covariance matrix of daily returns gives portfolio volatility,
+    per-asset risk contributions and the correlation matrix. Concentration
+    comes from the Herfindahl index of the weights.
+    """
+    allocations = request.allocations
+    symbols = list(allocations)
+
+    weights = np.array([allocations[symbol] for symbol in symbols], dtype=float)
+    weights = weights / weights.sum()
+
+    try:
+        with time_stage('db_fetch'):
+            frames = await fetch_price_histories(symbols, days=RISK_HISTORY_DAYS)
+        symbols, returns = align_returns(frames, length=RISK_HISTORY_DAYS)
+
+        if returns.shape[1] < MIN_HISTORY_DAYS - 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Insufficient overlapping history for portfolio risk (need {MIN_HISTORY_DAYS}+ shared days, got {returns.shape[1] + 1})"
+            )
+
+        response = PortfolioRiskResponse(**build_portfolio_breakdown(symbols, weights, returns))
+
+        logger.info(f"Portfolio risk calculated for {len(symbols)} assets: {response.portfolio_risk_score}/100 ({response.risk_level})")
 
         return response
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Risk scoring failed for {symbol}: {str(e)}", exc_info=True)
+        logger.error(f"Portfolio risk scoring failed: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Risk scoring failed: {str(e)}"
+            detail=f"Portfolio risk scoring failed: {str(e)}"
         )
 
 
+@app.post("/risk-score/refresh", tags=["Risk Scoring"])
+async def refresh_risk_scores():
+    """
+    Rematerialize the risk score table for every token now
+
+    Intended to be called by the price ingestion job after new candles land;
+    the background materializer also picks up new candles on its own.
+    """
+    try:
+        summary = await asyncio.to_thread(risk_materializer.refresh, True)
+    except Exception as e:
+        logger.error(f"Risk score refresh failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Risk score refresh failed: {str(e)}"
+        )
+
+    return summary
+
+
 @app.get("/models/{symbol}", response_model=ModelInfo, tags=["Models"])
 async def get_model_info(symbol: str):
     """
@@ -742,7 +1443,8 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
         - max_confidence: Use highest confidence prediction
     - **min_confidence**: Minimum confidence to include a prediction (0-1)
 
-    Returns enhanced prediction with ensemble metadata.
+    Returns enhanced prediction with ensemble metadata. `ensemble_metadata.temporal`
+    combines this prediction with the recent ones for the same symbol and timeframe.
     """
     symbol = request.symbol
     timeframe = request.timeframe
@@ -752,11 +1454,14 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
     # Check cache first
     cache_key = f"ensemble:{symbol}:{timeframe}:{method}"
     try:
-        cached_result = redis_client.get(cache_key)
+        with time_stage('cache_lookup'):
+            cached_result = redis_client.get(cache_key)
+        record_cache('ensemble', hit=bool(cached_result))
         if cached_result:
             logger.info(f"Returning cached ensemble prediction for {symbol} {timeframe}")
             return pickle.loads(cached_result)
     except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='get')
         logger.warning(f"Cache read error: {e}")
 
     try:
@@ -765,61 +1470,7 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
         current_price = float(price_history['price'].iloc[-1])
 
         # Collect predictions from available models
-        model_predictions = []
-
-        # Try to load both original and improved models if they exist
-        model_variants = [
-            f"{symbol}_best.pth",      # Current/improved model
-            f"{symbol}_v1.pth",         # Original model (if backed up)
-        ]
-
-        for model_file in model_variants:
-            checkpoint_path = os.path.join(MODEL_CHECKPOINT_DIR, model_file)
-
-            if not os.path.exists(checkpoint_path):
-                continue
-
-            try:
-                # Load model
-                checkpoint = torch.load(checkpoint_path, map_location='cpu')
-                config = checkpoint.get('config', {})
-                metadata = checkpoint.get('metadata', {})
-
-                hidden_sizes = config.get('hidden_sizes', [128, 64, 32])
-                dropout = config.get('dropout', 0.2)
-
-                model = CryptoLSTM(
-                    input_size=INPUT_FEATURES,
-                    hidden_sizes=hidden_sizes,
-                    num_classes=3,
-                    dropout=dropout
-                )
-
-                checkpoint_data = load_checkpoint(checkpoint_path, model)
-                model.eval()
-
-                # Make prediction
-                with torch.no_grad():
-                    output = model(features_tensor)
-                    probabilities = output[0].cpu().numpy()
-
-                direction = get_direction_from_probabilities(probabilities)
-                confidence_score, _ = calculate_confidence(probabilities)
-
-                # Add to predictions list
-                model_predictions.append({
-                    'probabilities': probabilities,
-                    'direction': direction,
-                    'confidence': confidence_score,
-                    'model_name': f"{symbol}_{hidden_sizes}",
-                    'accuracy': metadata.get('test_accuracy', 0.5)
-                })
-
-                logger.info(f"Loaded model {model_file}: {direction} ({confidence_score:.3f})")
-
-            except Exception as e:
-                logger.warning(f"Could not load {model_file}: {e}")
-                continue
+        model_predictions = await asyncio.to_thread(predict_model_variants, symbol, features_tensor, timeframe)
 
         if not model_predictions:
             # Fallback to single model
@@ -828,6 +1479,14 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
                 detail=f"No models available for ensemble prediction for {symbol}"
             )
 
+        # Log each variant's prediction for live accuracy (ensemble weights)
+        for prediction in model_predictions:
+            record_served_predictions(
+                symbol, prediction['checkpoint_version'], current_price, {timeframe: prediction['probabilities']}
+            )
+
+        response_started = time.perf_counter()
+
         # Create ensemble prediction
         ensemble_result = create_ensemble_prediction(
             symbol=symbol,
@@ -840,6 +1499,7 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
         direction = ensemble_result['direction']
         confidence_score = ensemble_result['confidence']
         ensemble_metadata = ensemble_result['ensemble_metadata']
+        ensemble_metadata['temporal'] = update_temporal_ensemble(symbol, timeframe, ensemble_result)
 
         # Calculate target price
         timeframe_days = int(timeframe.replace('d', ''))
@@ -898,10 +1558,14 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
             model_version='ensemble-v1.0.0'
         )
 
+        metrics.observe_stage('response_build', response_started)
+
         # Cache response
         try:
-            redis_client.setex(cache_key, CACHE_TTL, pickle.dumps(response))
+            with time_stage('cache_write'):
+                redis_client.setex(cache_key, CACHE_TTL, pickle.dumps(response))
         except Exception as e:
+            metrics.REDIS_ERRORS.inc(operation='set')
             logger.warning(f"Cache write error: {e}")
 
         logger.info(f"Ensemble prediction generated for {symbol}: {direction} ({confidence_score:.3f})")
@@ -918,6 +1582,82 @@ async def predict_ensemble(request: EnsemblePredictionRequest):
         )
 
 
+@app.post("/predict/ensemble/batch", response_model=EnsembleBatchResponse, tags=["Predictions"])
+async def predict_ensemble_batch(request: EnsembleBatchRequest):
+    """
+    Ensemble direction predictions for many symbols at once
+
+    Price histories of all symbols come from one database query. Each
+    checkpoint variant runs one forward pass over the stacked windows of the
+    symbols it serves, then all symbols are combined in one pass over a
+    (variants x symbols x 3) probability tensor.
+
+    - **symbols**: Symbols to predict (default: all supported symbols)
+    - **ensemble_method**: weighted_average, majority_voting or max_confidence
+    - **min_confidence**: Minimum confidence to include a prediction (0-1)
+    """
+    symbols = request.symbols or SUPPORTED_SYMBOLS
+    method = request.ensemble_method
+
+    num_variants = len(ENSEMBLE_MODEL_VARIANTS)
+    probabilities = np.zeros((num_variants, len(symbols), 3))
+    weights = np.full((num_variants, len(symbols)), 0.5)
+    available = np.zeros((num_variants, len(symbols)), dtype=bool)
+    errors: Dict[str, str] = {}
+
+    with time_stage('db_fetch'):
+        histories = await fetch_price_histories(symbols, days=120)
+
+    windows: Dict[str, torch.Tensor] = {}
+    for symbol in symbols:
+        try:
+            features = features_from_history(symbol, histories[symbol])
+        except HTTPException as e:
+            errors[symbol] = str(e.detail)
+            continue
+        windows[symbol] = prepare_window_tensor(features)
+
+    variant_predictions = await asyncio.to_thread(predict_variants, windows)
+
+    for j, symbol in enumerate(symbols):
+        for prediction in variant_predictions.get(symbol, []):
+            i = ENSEMBLE_MODEL_VARIANTS.index(prediction['variant'])
+            probabilities[i, j] = prediction['probabilities']
+            weights[i, j] = prediction['accuracy']
+            available[i, j] = True
+
+        if not available[:, j].any() and symbol not in errors:
+            errors[symbol] = "No models available for ensemble prediction"
+
+    combined = combine_probability_tensor(
+        probabilities,
+        weights=weights,
+        available=available,
+        min_confidence=request.min_confidence
+    )[method]
+
+    models_used = available.sum(axis=0)
+    results = {
+        symbol: {
+            'direction': ENSEMBLE_CLASSES[combined['direction'][j]],
+            'confidenceScore': round(float(combined['confidence'][j]), 3),
+            'probabilities': [round(float(p), 4) for p in combined['probabilities'][j]],
+            'modelsAvailable': int(models_used[j])
+        }
+        for j, symbol in enumerate(symbols)
+        if models_used[j] > 0
+    }
+
+    logger.info(f"Batch ensemble ({method}) generated for {len(results)}/{len(symbols)} symbols")
+
+    return EnsembleBatchResponse(
+        method=method,
+        results=results,
+        errors=errors,
+        generated_at=datetime.utcnow().isoformat() + 'Z'
+    )
+
+
 @app.delete("/models/{symbol}/cache", tags=["Models"])
 async def clear_model_cache(symbol: str):
     """
@@ -927,22 +1667,27 @@ async def clear_model_cache(symbol: str):
     """
     symbol = symbol.upper()
 
-    # Remove from memory cache
-    if symbol in model_cache:
-        del model_cache[symbol]
-        logger.info(f"Cleared model cache for {symbol}")
+    # Remove from memory cache (the global model is shared by all symbols)
+    key = model_key(symbol)
+    if key in model_cache:
+        del model_cache[key]
+        logger.info(f"Cleared model cache for {key}")
+
+    for variant in ENSEMBLE_MODEL_VARIANTS:
+        variant_model_cache.pop(f"{key}_{variant}.pth", None)
+
+    stateful_cache.invalidate(symbol)
 
     # Clear prediction caches in Redis
     try:
-        for timeframe in ['7d', '14d', '30d']:
-            cache_key = get_cache_key(symbol, timeframe)
-            redis_client.delete(cache_key)
+        invalidate_prediction_cache(symbol)
 
         risk_cache_key = get_cache_key(symbol, '7d', 'risk_score')
         redis_client.delete(risk_cache_key)
 
         logger.info(f"Cleared Redis caches for {symbol}")
     except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='delete')
         logger.warning(f"Error clearing Redis cache: {e}")
 
     return {
@@ -965,6 +1710,10 @@ async def startup_event():
     logger.info(f"PyTorch device: {'cuda' if torch.cuda.is_available() else 'cpu'}")
     logger.info(f"Model checkpoint directory: {MODEL_CHECKPOINT_DIR}")
     logger.info(f"Cache TTL: {CACHE_TTL} seconds")
+    logger.info(f"Stateful inference: {'enabled' if STATEFUL_INFERENCE else 'disabled'}")
+    logger.info(f"Model reload interval: {MODEL_RELOAD_INTERVAL or 'disabled'} seconds")
+    logger.info(f"Risk materialize interval: {RISK_MATERIALIZE_INTERVAL or 'disabled'} seconds")
+    logger.info(f"Prediction log interval: {PREDICTION_LOG_INTERVAL or 'disabled'} seconds")
     logger.info(f"Supported symbols: {', '.join(SUPPORTED_SYMBOLS)}")
 
     # Check Redis connection
@@ -972,9 +1721,13 @@ async def startup_event():
         redis_client.ping()
         logger.info("✓ Redis connection successful")
     except Exception as e:
+        metrics.REDIS_ERRORS.inc(operation='ping')
         logger.warning(f"✗ Redis connection failed: {e}")
         logger.warning("  Service will run without caching")
 
+    # Report default executor (asyncio.to_thread) queue depth on /metrics
+    metrics.watch_event_loop(asyncio.get_running_loop())
+
     # Pre-load models for top assets (optional)
     # for symbol in ['BTC', 'ETH', 'SOL']:
     #     try:
@@ -983,6 +1736,23 @@ async def startup_event():
     #     except Exception as e:
     #         logger.warning(f"✗ Could not pre-load model for {symbol}: {e}")
 
+    # Start checkpoint hot reloader
+    global model_reloader_task, risk_materializer_task, accuracy_tracker_task
+    if MODEL_RELOAD_INTERVAL > 0:
+        for key in dict.fromkeys(model_key(symbol) for symbol in SUPPORTED_SYMBOLS):
+            version = get_checkpoint_version(key)
+            if version is not None:
+                checkpoint_versions[key] = version
+        model_reloader_task = asyncio.create_task(model_reloader())
+
+    # Start risk score materializer
+    if RISK_MATERIALIZE_INTERVAL > 0:
+        risk_materializer_task = asyncio.create_task(risk_materializer_loop())
+
+    # Start prediction log flushing and live accuracy scoring
+    if PREDICTION_LOG_INTERVAL > 0:
+        accuracy_tracker_task = asyncio.create_task(accuracy_tracker_loop())
+
     logger.info("ML Service ready")
     logger.info("=" * 60)
 
@@ -992,8 +1762,26 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down ML Service...")
 
+    # Stop checkpoint hot reloader
+    if model_reloader_task is not None:
+        model_reloader_task.cancel()
+
+    # Stop risk score materializer
+    if risk_materializer_task is not None:
+        risk_materializer_task.cancel()
+
+    # Stop accuracy tracker and write out buffered predictions
+    if accuracy_tracker_task is not None:
+        accuracy_tracker_task.cancel()
+    try:
+        accuracy_tracker.flush()
+    except Exception as e:
+        logger.warning(f"Could not flush prediction log: {e}")
+
     # Clear model cache
     model_cache.clear()
+    variant_model_cache.clear()
+    stateful_cache.invalidate()
 
     # Close Redis connection
     try:
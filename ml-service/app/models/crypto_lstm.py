@@ -8,14 +8,91 @@ Architecture:
 - LSTM Layer 3: 32 units with dropout 0.2
 - Dense Layer: 16 units with ReLU
 - Output Layer: 3 units with Softmax (Bearish, Neutral, Bullish)
+
+Architectures (selected through the checkpoint config['architecture']):
+- 'stacked': three separate single-layer LSTMs (CryptoLSTM, default)
+- 'fused':   one multi-layer nn.LSTM so cuDNN/oneDNN can run the whole
+             recurrent stack as a single fused kernel (FusedCryptoLSTM)
+- 'multi_horizon': the stacked recurrent trunk with one dense head per
+             prediction horizon, e.g. 7d/14d/30d from one forward pass
+             (MultiHorizonCryptoLSTM)
+- 'global':  one stacked model for many assets; a learned symbol embedding
+             is concatenated to the features of every timestep (GlobalCryptoLSTM)
 """
 
+import numpy as np
 import torch
 import torch.nn as nn
-from typing import Optional
+from typing import Dict, List, Optional
+
 
+# Checkpoint prefix of the global (all-symbol) model: GLOBAL_best.pth
+GLOBAL_MODEL_NAME = 'GLOBAL'
 
-class CryptoLSTM(nn.Module):
+
+class CryptoLSTMBase(nn.Module):
+    """
+    Shared helpers for all CryptoLSTM architectures
+    """
+
+    def get_num_parameters(self) -> int:
+        """Calculate total number of trainable parameters"""
+        return sum(p.numel() for p in self.parameters() if p.requires_grad)
+
+    def predict_direction(self, probabilities: torch.Tensor) -> tuple:
+        """
+        Convert softmax probabilities to prediction and confidence
+
+        Args:
+            probabilities: Tensor of shape (batch_size, 3), or
+                (batch_size, num_horizons, 3) for multi-horizon models
+
+        Returns:
+            Tuple of (predicted_classes, confidence_scores)
+        """
+        # Get predicted class (0: bearish, 1: neutral, 2: bullish)
+        predicted_classes = torch.argmax(probabilities, dim=-1)
+
+        # Confidence is the maximum probability
+        confidence_scores = torch.max(probabilities, dim=-1)[0]
+
+        return predicted_classes, confidence_scores
+
+    def prepare_input(self, x: torch.Tensor, symbol: str) -> torch.Tensor:
+        """
+        Turn a normalized feature window into this model's input
+
+        Per-asset models take the window as is; GlobalCryptoLSTM appends
+        the symbol column.
+
+        Args:
+            x: Tensor of shape (batch_size, sequence_length, input_size)
+            symbol: Asset symbol of the window
+
+        Returns:
+            Model input tensor
+        """
+        return x
+
+    def get_confidence_level(self, confidence: float) -> str:
+        """
+        Map confidence score to human-readable level
+
+        Args:
+            confidence: Confidence score (0-1)
+
+        Returns:
+            Confidence level string ('low', 'medium', 'high')
+        """
+        if confidence >= 0.70:
+            return "high"
+        elif confidence >= 0.50:
+            return "medium"
+        else:
+            return "low"
+
+
+class CryptoLSTM(CryptoLSTMBase):
     """
     3-layer LSTM model for crypto price direction prediction
 
@@ -91,79 +168,432 @@ class CryptoLSTM(nn.Module):
         Returns:
             Output tensor of shape (batch_size, num_classes) with softmax probabilities
         """
+        out, _ = self.forward_with_state(x)
+        return out
+
+    def forward_with_state(self, x, states: Optional[list] = None) -> tuple:
+        """
+        Forward pass that also takes/returns the recurrent state
+
+        Feeding one new timestep with the states returned by a previous call
+        continues the sequence without re-running the earlier timesteps.
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_size)
+            states: Optional list of (h, c) tuples, one per LSTM layer
+                (None starts from zero state)
+
+        Returns:
+            Tuple of (probabilities, states)
+        """
         # x shape: (batch_size, sequence_length, input_size)
         # e.g., (32, 90, 20) for batch of 32, 90-day sequences, 20 features
+        states = states or [None, None, None]
 
         # LSTM Layer 1
-        out, _ = self.lstm1(x)
+        out, state1 = self.lstm1(x, states[0])
         out = self.dropout1(out)
 
         # LSTM Layer 2
-        out, _ = self.lstm2(out)
+        out, state2 = self.lstm2(out, states[1])
         out = self.dropout2(out)
 
         # LSTM Layer 3
-        out, (hidden, cell) = self.lstm3(out)
+        out, state3 = self.lstm3(out, states[2])
         out = self.dropout3(out)
 
         # Take last timestep output
         out = out[:, -1, :]  # Shape: (batch_size, 32)
 
-        # Dense layers
+        return self.head(out), [state1, state2, state3]
+
+    def head(self, out: torch.Tensor) -> torch.Tensor:
+        """
+        Dense head on the last timestep of the recurrent trunk
+
+        Args:
+            out: Tensor of shape (batch_size, hidden_sizes[-1])
+
+        Returns:
+            Probabilities of shape (batch_size, num_classes)
+        """
         out = self.fc1(out)  # Shape: (batch_size, 16)
         out = self.relu(out)
         out = self.fc2(out)  # Shape: (batch_size, 3)
-        out = self.softmax(out)  # Shape: (batch_size, 3) with probabilities summing to 1
+        return self.softmax(out)  # Shape: (batch_size, 3) with probabilities summing to 1
 
-        return out
 
-    def get_num_parameters(self) -> int:
-        """Calculate total number of trainable parameters"""
-        return sum(p.numel() for p in self.parameters() if p.requires_grad)
+class MultiHorizonCryptoLSTM(CryptoLSTM):
+    """
+    CryptoLSTM with one classification head per prediction horizon
 
-    def predict_direction(self, probabilities: torch.Tensor) -> tuple:
+    The three LSTM layers are shared; each horizon gets its own dense
+    head (hidden -> 16 -> num_classes). A forward pass returns
+    probabilities of shape (batch_size, num_horizons, num_classes), so one
+    model serves 7d, 14d and 30d predictions for the cost of one pass
+    through the recurrent stack.
+    """
+
+    def __init__(
+        self,
+        input_size: int = 20,
+        hidden_sizes: list = [128, 64, 32],
+        num_classes: int = 3,
+        dropout: float = 0.2,
+        horizons: List[int] = [7, 14, 30]
+    ):
         """
-        Convert softmax probabilities to prediction and confidence
+        Initialize the MultiHorizonCryptoLSTM model
+
+        Args:
+            input_size: Number of features per timestep (default: 20)
+            hidden_sizes: List of hidden layer sizes (default: [128, 64, 32])
+            num_classes: Number of output classes per horizon (default: 3)
+            dropout: Dropout rate for regularization (default: 0.2)
+            horizons: Prediction horizons in days, one head each (default: [7, 14, 30])
+        """
+        super(MultiHorizonCryptoLSTM, self).__init__(
+            input_size=input_size,
+            hidden_sizes=hidden_sizes,
+            num_classes=num_classes,
+            dropout=dropout
+        )
+
+        self.horizons = list(horizons)
+
+        # Replace the single dense head with one per horizon
+        del self.fc1, self.fc2
+        self.heads = nn.ModuleList([
+            nn.Sequential(
+                nn.Linear(hidden_sizes[2], 16),
+                nn.ReLU(),
+                nn.Linear(16, num_classes)
+            )
+            for _ in self.horizons
+        ])
+
+    def head(self, out: torch.Tensor) -> torch.Tensor:
+        """
+        Per-horizon dense heads on the shared last timestep
 
         Args:
-            probabilities: Tensor of shape (batch_size, 3)
+            out: Tensor of shape (batch_size, hidden_sizes[-1])
 
         Returns:
-            Tuple of (predicted_classes, confidence_scores)
+            Probabilities of shape (batch_size, num_horizons, num_classes)
         """
-        # Get predicted class (0: bearish, 1: neutral, 2: bullish)
-        predicted_classes = torch.argmax(probabilities, dim=1)
+        logits = torch.stack([head(out) for head in self.heads], dim=1)
+        return torch.softmax(logits, dim=-1)
 
-        # Confidence is the maximum probability
-        confidence_scores = torch.max(probabilities, dim=1)[0]
+    def horizon_index(self, days: int) -> int:
+        """Index of the head closest to a horizon in days"""
+        return min(range(len(self.horizons)), key=lambda i: abs(self.horizons[i] - days))
 
-        return predicted_classes, confidence_scores
 
-    def get_confidence_level(self, confidence: float) -> str:
+class GlobalCryptoLSTM(CryptoLSTM):
+    """
+    One CryptoLSTM shared by many assets
+
+    A learned embedding of the asset symbol is concatenated to the features
+    of every timestep before the stacked LSTM trunk. The symbol travels in
+    the input as one extra column holding its index in `symbols` (see
+    add_symbol_column), so the model takes (batch, seq, input_size + 1)
+    tensors and a batch may mix windows of different assets.
+    """
+
+    def __init__(
+        self,
+        input_size: int = 20,
+        hidden_sizes: list = [128, 64, 32],
+        num_classes: int = 3,
+        dropout: float = 0.2,
+        symbols: List[str] = [],
+        embedding_dim: int = 8
+    ):
         """
-        Map confidence score to human-readable level
+        Initialize the GlobalCryptoLSTM model
 
         Args:
-            confidence: Confidence score (0-1)
+            input_size: Number of features per timestep, without the symbol column (default: 20)
+            hidden_sizes: List of hidden layer sizes (default: [128, 64, 32])
+            num_classes: Number of output classes (default: 3)
+            dropout: Dropout rate for regularization (default: 0.2)
+            symbols: Asset symbols the model is trained on; the index of a
+                symbol in this list is its embedding row
+            embedding_dim: Size of the symbol embedding (default: 8)
+        """
+        if not symbols:
+            raise ValueError("Global model requires at least one symbol")
+
+        super(GlobalCryptoLSTM, self).__init__(
+            input_size=input_size + embedding_dim,
+            hidden_sizes=hidden_sizes,
+            num_classes=num_classes,
+            dropout=dropout
+        )
+
+        self.input_size = input_size
+        self.symbols = list(symbols)
+        self.embedding_dim = embedding_dim
+        self.symbol_embedding = nn.Embedding(len(self.symbols), embedding_dim)
+
+    def forward_with_state(self, x, states: Optional[list] = None) -> tuple:
+        """
+        Forward pass that also takes/returns the recurrent state
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_size + 1);
+                the last column is the symbol index
+            states: Optional list of (h, c) tuples, one per LSTM layer
 
         Returns:
-            Confidence level string ('low', 'medium', 'high')
+            Tuple of (probabilities, states)
         """
-        if confidence >= 0.70:
-            return "high"
-        elif confidence >= 0.50:
-            return "medium"
+        features = x[:, :, :-1]
+        symbol_ids = x[:, 0, -1].round().long()
+
+        embedded = self.symbol_embedding(symbol_ids)  # Shape: (batch_size, embedding_dim)
+        embedded = embedded.unsqueeze(1).expand(-1, x.size(1), -1).to(features.dtype)
+
+        return super(GlobalCryptoLSTM, self).forward_with_state(torch.cat([features, embedded], dim=2), states)
+
+    def prepare_input(self, x: torch.Tensor, symbol: str) -> torch.Tensor:
+        """Append the symbol column to a normalized feature window"""
+        if symbol not in self.symbols:
+            raise ValueError(f"Global model was not trained on {symbol}")
+
+        column = torch.full((*x.shape[:2], 1), float(self.symbols.index(symbol)), dtype=x.dtype, device=x.device)
+        return torch.cat([x, column], dim=2)
+
+
+def add_symbol_column(X: np.ndarray, symbol_index: int) -> np.ndarray:
+    """
+    Append a constant symbol-index column to training windows for GlobalCryptoLSTM
+
+    Args:
+        X: Normalized windows (num_samples, sequence_length, num_features)
+        symbol_index: Index of the asset in the global model's symbols
+
+    Returns:
+        float32 array of shape (num_samples, sequence_length, num_features + 1)
+    """
+    column = np.full((*X.shape[:2], 1), symbol_index, dtype=np.float32)
+    return np.concatenate([X.astype(np.float32, copy=False), column], axis=2)
+
+
+class FusedCryptoLSTM(CryptoLSTMBase):
+    """
+    CryptoLSTM variant with fused multi-layer LSTMs
+
+    Same inputs, dense head and outputs as CryptoLSTM, but each run of
+    consecutive layers with the same hidden size is one multi-layer
+    nn.LSTM (a single cuDNN call) instead of one module per layer.
+    [128, 128, 128] is one fused stack; [128, 64, 32] keeps one LSTM per
+    layer, so every stacked checkpoint can be converted.
+    """
+
+    def __init__(
+        self,
+        input_size: int = 20,
+        hidden_sizes: list = [128, 64, 32],
+        num_classes: int = 3,
+        dropout: float = 0.2
+    ):
+        """
+        Initialize the FusedCryptoLSTM model
+
+        Args:
+            input_size: Number of features per timestep (default: 20)
+            hidden_sizes: Hidden size per layer (default: [128, 64, 32])
+            num_classes: Number of output classes (default: 3)
+            dropout: Dropout rate after every recurrent layer (default: 0.2)
+        """
+        super(FusedCryptoLSTM, self).__init__()
+
+        self.input_size = input_size
+        self.hidden_sizes = list(hidden_sizes)
+        self.num_classes = num_classes
+        self.dropout = dropout
+
+        # One fused LSTM per run of equal hidden sizes (dropout between its
+        # layers is applied inside nn.LSTM, after it by dropout_layers)
+        self.layer_groups = fused_layer_groups(self.hidden_sizes)
+        self.lstms = nn.ModuleList()
+        self.dropout_layers = nn.ModuleList()
+        group_input = input_size
+        for layers in self.layer_groups:
+            hidden_size = self.hidden_sizes[layers[0]]
+            self.lstms.append(nn.LSTM(
+                input_size=group_input,
+                hidden_size=hidden_size,
+                num_layers=len(layers),
+                batch_first=True,
+                dropout=dropout if len(layers) > 1 else 0
+            ))
+            self.dropout_layers.append(nn.Dropout(dropout))
+            group_input = hidden_size
+
+        # Dense layers
+        self.fc1 = nn.Linear(self.hidden_sizes[-1], 16)
+        self.relu = nn.ReLU()
+        self.fc2 = nn.Linear(16, num_classes)
+        self.softmax = nn.Softmax(dim=1)
+
+    def forward(self, x):
+        """
+        Forward pass through the network
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_size)
+
+        Returns:
+            Output tensor of shape (batch_size, num_classes) with softmax probabilities
+        """
+        out, _ = self.forward_with_state(x)
+        return out
+
+    def forward_with_state(self, x, states: Optional[list] = None) -> tuple:
+        """
+        Forward pass that also takes/returns the recurrent state
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_size)
+            states: Optional list of stacked (h, c) tuples, one per fused
+                LSTM (None starts from zero state)
+
+        Returns:
+            Tuple of (probabilities, states)
+        """
+        states = states or [None] * len(self.lstms)
+
+        out = x
+        new_states = []
+        for lstm, dropout, state in zip(self.lstms, self.dropout_layers, states):
+            out, state = lstm(out, state)
+            out = dropout(out)
+            new_states.append(state)
+
+        out = out[:, -1, :]
+
+        out = self.fc1(out)
+        out = self.relu(out)
+        out = self.fc2(out)
+        out = self.softmax(out)
+
+        return out, new_states
+
+
+def fused_layer_groups(hidden_sizes: List[int]) -> List[List[int]]:
+    """
+    Split layer indices into runs of consecutive equal hidden sizes
+
+    Example: [128, 128, 64] -> [[0, 1], [2]]
+    """
+    groups = []
+    for layer, hidden_size in enumerate(hidden_sizes):
+        if groups and hidden_sizes[groups[-1][-1]] == hidden_size:
+            groups[-1].append(layer)
         else:
-            return "low"
+            groups.append([layer])
+    return groups
 
 
-def create_model(input_size: int = 20, device: Optional[str] = None) -> CryptoLSTM:
+# Architecture registry (checkpoint config['architecture'] -> model class)
+MODEL_ARCHITECTURES = {
+    'stacked': CryptoLSTM,
+    'fused': FusedCryptoLSTM,
+    'multi_horizon': MultiHorizonCryptoLSTM,
+    'global': GlobalCryptoLSTM,
+}
+
+
+def build_model(config: Optional[Dict] = None, input_size: int = 20) -> CryptoLSTMBase:
+    """
+    Build a model from a training/checkpoint config
+
+    Args:
+        config: Config dict with optional 'architecture', 'hidden_sizes',
+            'num_classes' and 'dropout' keys (defaults match CryptoLSTM);
+            'multi_horizon' models also read 'horizons', 'global' models
+            'symbols' and 'embedding_dim'
+        input_size: Number of input features
+
+    Returns:
+        Uninitialized model of the configured architecture
+    """
+    config = config or {}
+    architecture = config.get('architecture', 'stacked')
+
+    if architecture not in MODEL_ARCHITECTURES:
+        raise ValueError(f"Unknown model architecture: {architecture}")
+
+    kwargs = {}
+    if architecture == 'multi_horizon':
+        kwargs['horizons'] = config.get('horizons', [7, 14, 30])
+    elif architecture == 'global':
+        kwargs['symbols'] = config.get('symbols', [])
+        kwargs['embedding_dim'] = config.get('embedding_dim', 8)
+
+    return MODEL_ARCHITECTURES[architecture](
+        input_size=input_size,
+        hidden_sizes=config.get('hidden_sizes', [128, 64, 32]),
+        num_classes=config.get('num_classes', 3),
+        dropout=config.get('dropout', 0.2),
+        **kwargs
+    )
+
+
+def convert_stacked_to_fused(model: CryptoLSTM) -> FusedCryptoLSTM:
+    """
+    Convert a stacked CryptoLSTM into an equivalent FusedCryptoLSTM
+
+    Each stacked layer becomes one layer of the fused LSTM of its group
+    (lstm{k+1} -> lstms.{group}.*_l{index in group}); the dense head is
+    copied as is. Outputs match exactly in eval mode.
+
+    Args:
+        model: Trained CryptoLSTM
+
+    Returns:
+        FusedCryptoLSTM with the converted weights
+    """
+    fused = FusedCryptoLSTM(
+        input_size=model.input_size,
+        hidden_sizes=model.hidden_sizes,
+        num_classes=model.num_classes,
+        dropout=model.dropout
+    )
+
+    stacked_layers = [model.lstm1, model.lstm2, model.lstm3]
+    state = {}
+    for group, layers in enumerate(fused.layer_groups):
+        for index, layer in enumerate(layers):
+            for name, tensor in stacked_layers[layer].state_dict().items():
+                # e.g. weight_ih_l0 -> lstms.{group}.weight_ih_l{index}
+                state[f"lstms.{group}.{name[:-1]}{index}"] = tensor.clone()
+
+    for name in ['fc1', 'fc2']:
+        for param, tensor in getattr(model, name).state_dict().items():
+            state[f"{name}.{param}"] = tensor.clone()
+
+    fused.load_state_dict(state)
+    fused.train(model.training)
+
+    return fused
+
+
+def create_model(
+    input_size: int = 20,
+    device: Optional[str] = None,
+    config: Optional[Dict] = None
+) -> CryptoLSTMBase:
     """
     Factory function to create and initialize a CryptoLSTM model
 
     Args:
         input_size: Number of input features (default: 20)
         device: Device to place model on ('cuda' or 'cpu', auto-detected if None)
+        config: Optional training config selecting the architecture (default: stacked CryptoLSTM)
 
     Returns:
         Initialized CryptoLSTM model
@@ -171,7 +601,7 @@ def create_model(input_size: int = 20, device: Optional[str] = None) -> CryptoLS
     if device is None:
         device = 'cuda' if torch.cuda.is_available() else 'cpu'
 
-    model = CryptoLSTM(input_size=input_size)
+    model = build_model(config, input_size=input_size)
     model = model.to(device)
 
     # Print model summary
@@ -179,7 +609,7 @@ def create_model(input_size: int = 20, device: Optional[str] = None) -> CryptoLS
     print(f"CryptoLSTM model created:")
     print(f"  - Parameters: {num_params:,}")
     print(f"  - Device: {device}")
-    print(f"  - Architecture: {model.hidden_sizes}")
+    print(f"  - Architecture: {type(model).__name__} {model.hidden_sizes}")
 
     return model
 
@@ -0,0 +1,161 @@
+"""
+Stateful Incremental LSTM Inference
+Carries per-symbol LSTM hidden state across new candles
+
+A full prediction runs the whole SEQUENCE_LENGTH window through the model.
+When only one new candle arrived since the previous call, the stored (h, c)
+state of every LSTM layer lets the model advance a single timestep instead.
+
+The incremental path is an approximation of the full-window pass: the state
+keeps context from before the window start and feature normalization is
+frozen at the last sync. A full-window pass therefore re-syncs the state
+every `resync_interval` steps (and whenever the history does not line up).
+The drift grows with the steps since the last sync. On ten random-walk
+daily series, with a sharpened test head, the stacked model's largest
+class-probability difference from the stateless path reached 0.04 after
+6 steps, 0.07 after 12, 0.11 after 16 and 0.20 after 24. The default
+interval of 12 keeps it under 0.1 (tests/test_stateful_inference.py).
+
+Stored state belongs to one model object. Models are told apart by a serial
+number that is never reused (unlike id(), which CPython hands to a new
+object once a hot-reloaded model is freed), so state is never applied to
+different weights.
+"""
+
+import logging
+import itertools
+import weakref
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+from app.models.crypto_lstm import CryptoLSTMBase
+
+logger = logging.getLogger(__name__)
+
+
+class StatefulInferenceCache:
+    """
+    Per-symbol recurrent state cache for streaming predictions
+    """
+
+    def __init__(self, resync_interval: int = 12, max_step: int = 3):
+        """
+        Initialize the cache
+
+        Args:
+            resync_interval: Incremental steps allowed before a full-window re-sync
+            max_step: Most new candles to advance incrementally in one call
+        """
+        self.resync_interval = resync_interval
+        self.max_step = max_step
+        self.entries: Dict[str, Dict] = {}
+        self._model_serials = weakref.WeakKeyDictionary()
+        self._serials = itertools.count(1)
+
+    def predict(
+        self,
+        symbol: str,
+        model: CryptoLSTMBase,
+        features: pd.DataFrame,
+        sequence_length: int
+    ) -> Tuple[np.ndarray, str]:
+        """
+        Predict class probabilities for the latest candle
+
+        Args:
+            symbol: Asset symbol
+            model: Model in eval mode
+            features: Engineered features indexed by time (oldest first)
+            sequence_length: Window length of a full pass
+
+        Returns:
+            Tuple of (probabilities, mode) where mode is 'cached',
+            'incremental' or 'full'
+        """
+        entry = self.entries.get(symbol)
+        last_time = features.index[-1]
+
+        if entry is not None and entry['model_serial'] == self.model_serial(model):
+            if entry['last_time'] == last_time:
+                return entry['probabilities'], 'cached'
+
+            new_rows = features.loc[features.index > entry['last_time']]
+
+            if (
+                entry['last_time'] in features.index
+                and 0 < len(new_rows) <= self.max_step
+                and entry['steps_since_sync'] + len(new_rows) <= self.resync_interval
+            ):
+                return self._advance(symbol, entry, model, new_rows), 'incremental'
+
+        return self._full_pass(symbol, model, features, sequence_length), 'full'
+
+    def model_serial(self, model: CryptoLSTMBase) -> int:
+        """Serial number of a model object, assigned on first use and never reused"""
+        serial = self._model_serials.get(model)
+        if serial is None:
+            serial = self._model_serials[model] = next(self._serials)
+        return serial
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop stored state for one symbol (or all symbols)"""
+        if symbol is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(symbol, None)
+
+    def _full_pass(
+        self,
+        symbol: str,
+        model: CryptoLSTMBase,
+        features: pd.DataFrame,
+        sequence_length: int
+    ) -> np.ndarray:
+        """Run the whole window and store the resulting state"""
+        window = features.tail(sequence_length).values
+
+        # Same per-window normalization as the stateless path; frozen until next sync
+        mean = window.mean(axis=0)
+        std = window.std(axis=0) + 1e-8
+
+        x = model.prepare_input(torch.FloatTensor((window - mean) / std).unsqueeze(0), symbol)
+        with torch.no_grad():
+            output, states = model.forward_with_state(x)
+
+        probabilities = output[0].cpu().numpy()
+
+        self.entries[symbol] = {
+            'model_serial': self.model_serial(model),
+            'states': states,
+            'mean': mean,
+            'std': std,
+            'last_time': features.index[-1],
+            'steps_since_sync': 0,
+            'probabilities': probabilities
+        }
+
+        return probabilities
+
+    def _advance(
+        self,
+        symbol: str,
+        entry: Dict,
+        model: CryptoLSTMBase,
+        new_rows: pd.DataFrame
+    ) -> np.ndarray:
+        """Advance the stored state over the new candles only"""
+        x = model.prepare_input(torch.FloatTensor((new_rows.values - entry['mean']) / entry['std']).unsqueeze(0), symbol)
+        with torch.no_grad():
+            output, states = model.forward_with_state(x, entry['states'])
+
+        entry['states'] = states
+        entry['last_time'] = new_rows.index[-1]
+        entry['steps_since_sync'] += len(new_rows)
+        entry['probabilities'] = output[0].cpu().numpy()
+
+        logger.debug(f"Advanced {symbol} state by {len(new_rows)} step(s)")
+
+        return entry['probabilities']
@@ -2,6 +2,6 @@
 Training module for Coinsphere ML models
 """
 
-from .trainer import ModelTrainer, TRAINING_CONFIG
+from .trainer import ModelTrainer, InMemoryBatchLoader, TRAINING_CONFIG
 
-__all__ = ['ModelTrainer', 'TRAINING_CONFIG']
+__all__ = ['ModelTrainer', 'InMemoryBatchLoader', 'TRAINING_CONFIG']
@@ -0,0 +1,410 @@
+"""
+Walk-Forward Backtesting for CryptoLSTM Checkpoints
+Replays stored price history through a checkpoint and scores every day
+
+Each labelled day is predicted from the feature window that ends before it,
+the same samples build_dataset produces for training, so no prediction sees
+its own future. Windows are normalized one by one like the API normalizes
+its input, and all of them go through the model in a few large batches
+instead of one forward pass per day. Accuracy, rolling accuracy and
+calibration (reliability bins, expected calibration error, Brier score) are
+computed per symbol and horizon with array operations.
+
+A report published next to a checkpoint ({checkpoint}_backtest.json) is
+picked up by the API for the historicalAccuracy of its predictions.
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+from app.models.crypto_lstm import CryptoLSTMBase, build_model
+from app.training.trainer import confusion_matrix_metrics, load_checkpoint
+from app.utils.feature_engineering import (
+    engineer_features,
+    build_dataset,
+    direction_labels,
+    forward_returns
+)
+
+logger = logging.getLogger(__name__)
+
+# Backtest defaults
+BACKTEST_HORIZONS = [7, 14, 30]
+ROLLING_WINDOWS = [30, 90]  # Rolling accuracy windows in labelled days
+CALIBRATION_BINS = 10
+INFERENCE_BATCH_SIZE = 1024
+
+
+def load_ohlcv_file(path: str, symbol: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a local OHLCV file (.csv or .parquet) into the fetch_price_history layout
+
+    The time column may be called 'timestamp', 'time' or 'date'; a 'close'
+    column is accepted in place of 'price'. Files holding several assets
+    need a 'symbol' column and the `symbol` argument.
+
+    Args:
+        path: CSV or parquet file
+        symbol: Asset to select from a multi-asset file
+
+    Returns:
+        DataFrame indexed by timestamp (oldest first)
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+
+    if 'symbol' in df.columns:
+        if symbol is None:
+            raise ValueError(f"{path} holds several symbols; pass the symbol to backtest")
+        df = df[df['symbol'].str.upper() == symbol.upper()].drop(columns='symbol')
+
+    time_column = next((c for c in ['timestamp', 'time', 'date'] if c in df.columns), None)
+    if time_column is None:
+        raise ValueError(f"{path} has no timestamp/time/date column")
+
+    df = df.set_index(pd.to_datetime(df[time_column])).drop(columns=time_column).sort_index()
+    df.index.name = 'timestamp'
+
+    if 'price' not in df.columns and 'close' in df.columns:
+        df = df.rename(columns={'close': 'price'})
+
+    return df
+
+
+def load_backtest_model(checkpoint_path: str, input_size: int = 20) -> Tuple[CryptoLSTMBase, Dict]:
+    """
+    Build a checkpoint's architecture and load its weights in eval mode
+
+    Returns:
+        Tuple of (model, training config)
+    """
+    config = torch.load(checkpoint_path, map_location='cpu').get('config') or {}
+    model = build_model(config, input_size=input_size)
+    load_checkpoint(checkpoint_path, model)
+    model.eval()
+    return model, config
+
+
+def normalize_windows(X: np.ndarray) -> np.ndarray:
+    """Z-score every window over its own timesteps, as the API does for one window"""
+    mean = X.mean(axis=1, keepdims=True)
+    std = X.std(axis=1, keepdims=True) + 1e-8
+    return ((X - mean) / std).astype(np.float32, copy=False)
+
+
+def predict_windows(
+    model: CryptoLSTMBase,
+    X: np.ndarray,
+    symbol: str,
+    batch_size: int = INFERENCE_BATCH_SIZE
+) -> np.ndarray:
+    """
+    Class probabilities for every window in a few batched forward passes
+
+    Args:
+        model: Model in eval mode
+        X: Normalized windows (num_samples, sequence_length, num_features)
+        symbol: Asset symbol (selects the embedding of global models)
+        batch_size: Windows per forward pass
+
+    Returns:
+        Probabilities (num_samples, num_classes), or
+        (num_samples, num_horizons, num_classes) for multi-horizon models
+    """
+    x = torch.from_numpy(X)
+    with torch.no_grad():
+        outputs = [
+            model(model.prepare_input(x[start:start + batch_size], symbol))
+            for start in range(0, len(x), batch_size)
+        ]
+    return torch.cat(outputs).cpu().numpy()
+
+
+def rolling_accuracy(correct: np.ndarray, window: int) -> np.ndarray:
+    """
+    Accuracy over each run of `window` consecutive predictions
+
+    Returns:
+        Array of length len(correct) - window + 1 (empty if too short)
+    """
+    if len(correct) < window:
+        return np.empty(0)
+    cumulative = np.concatenate([[0.0], np.cumsum(correct, dtype=np.float64)])
+    return (cumulative[window:] - cumulative[:-window]) / window
+
+
+def calibration_metrics(probabilities: np.ndarray, labels: np.ndarray, bins: int = CALIBRATION_BINS) -> Dict:
+    """
+    Reliability of the predicted confidence
+
+    The confidence of a prediction is its top class probability. Predictions
+    are bucketed into equal-width confidence bins; a calibrated model's
+    accuracy in each bin matches its mean confidence.
+
+    Args:
+        probabilities: Class probabilities (num_samples, num_classes)
+        labels: True classes (num_samples,)
+        bins: Number of confidence bins
+
+    Returns:
+        Dict with 'expected_calibration_error', 'brier_score' and 'bins'
+        (lower, upper, count, mean_confidence, accuracy of non-empty bins)
+    """
+    confidence = probabilities.max(axis=1)
+    correct = (probabilities.argmax(axis=1) == labels).astype(np.float64)
+
+    bin_ids = np.minimum((confidence * bins).astype(np.int64), bins - 1)
+    counts = np.bincount(bin_ids, minlength=bins)
+    confidence_sums = np.bincount(bin_ids, weights=confidence, minlength=bins)
+    correct_sums = np.bincount(bin_ids, weights=correct, minlength=bins)
+
+    one_hot = np.eye(probabilities.shape[1])[labels]
+    brier = ((probabilities - one_hot) ** 2).sum(axis=1).mean()
+
+    return {
+        'expected_calibration_error': float(np.abs(correct_sums - confidence_sums).sum() / len(labels)),
+        'brier_score': float(brier),
+        'bins': [
+            {
+                'lower': i / bins,
+                'upper': (i + 1) / bins,
+                'count': int(counts[i]),
+                'mean_confidence': float(confidence_sums[i] / counts[i]),
+                'accuracy': float(correct_sums[i] / counts[i])
+            }
+            for i in np.flatnonzero(counts)
+        ]
+    }
+
+
+def score_predictions(
+    probabilities: np.ndarray,
+    labels: np.ndarray,
+    index: pd.Index,
+    rolling_windows: Sequence[int] = ROLLING_WINDOWS
+) -> Dict:
+    """
+    Accuracy, rolling accuracy and calibration of one symbol/horizon
+
+    Args:
+        probabilities: Class probabilities (num_samples, num_classes), oldest first
+        labels: True classes (num_samples,)
+        index: Time of each labelled day
+        rolling_windows: Rolling accuracy window lengths in labelled days
+
+    Returns:
+        Summary dict; 'accuracy_last_{w}' is the accuracy of the latest w days
+    """
+    predictions = probabilities.argmax(axis=1)
+    correct = predictions == labels
+
+    class_metrics = confusion_matrix_metrics(
+        torch.from_numpy(predictions), torch.from_numpy(labels), probabilities.shape[1]
+    )
+
+    summary = {
+        'samples': int(len(labels)),
+        'start': index[0].isoformat(),
+        'end': index[-1].isoformat(),
+        **class_metrics,
+        **calibration_metrics(probabilities, labels)
+    }
+
+    for window in rolling_windows:
+        rolling = rolling_accuracy(correct, window)
+        summary[f"accuracy_last_{window}"] = float(rolling[-1]) if len(rolling) else None
+        summary[f"rolling_{window}"] = {
+            'min': float(rolling.min()),
+            'mean': float(rolling.mean()),
+            'max': float(rolling.max())
+        } if len(rolling) else None
+
+    return summary
+
+
+def backtest_symbol(
+    model: CryptoLSTMBase,
+    df: pd.DataFrame,
+    symbol: str,
+    horizons: Sequence[int] = BACKTEST_HORIZONS,
+    sequence_length: int = 90,
+    threshold: float = 2.0,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+    batch_size: int = INFERENCE_BATCH_SIZE,
+    return_predictions: bool = False
+) -> Dict:
+    """
+    Walk-forward backtest of one symbol over its price history
+
+    Windows are built and run through the model once; every horizon is
+    then scored on the days whose outcome is already known. A single-horizon
+    model is scored against every horizon, as the API serves it for all
+    timeframes; multi-horizon models use the head of each horizon.
+
+    Args:
+        model: Model in eval mode
+        df: OHLCV history (fetch_price_history layout, oldest first)
+        symbol: Asset symbol
+        horizons: Horizons in days to score
+        sequence_length: Window length the model expects
+        threshold: Neutral band in percent (as in training labels)
+        start: Only score labelled days from this time (e.g. after the training cutoff)
+        end: Only score labelled days up to this time
+        batch_size: Windows per forward pass
+        return_predictions: Also return a per-day DataFrame for each horizon
+
+    Returns:
+        Dict with 'symbol' and per-horizon summaries under 'horizons' ('7d', ...);
+        with return_predictions, also 'predictions' {horizon: DataFrame}
+    """
+    features = engineer_features(df)
+
+    # One set of windows (shortest horizon keeps the most days)
+    X, _, index = build_dataset(features, horizon=min(horizons), threshold=threshold, sequence_length=sequence_length)
+
+    in_range = np.ones(len(index), dtype=bool)
+    if start is not None:
+        in_range &= index >= pd.Timestamp(start)
+    if end is not None:
+        in_range &= index <= pd.Timestamp(end)
+    X, index = X[in_range], index[in_range]
+
+    result = {'symbol': symbol, 'sequence_length': sequence_length, 'horizons': {}}
+    if return_predictions:
+        result['predictions'] = {}
+    if len(X) == 0:
+        return result
+
+    probabilities = predict_windows(model, normalize_windows(X), symbol, batch_size)
+
+    price_col = 'close' if 'close' in features.columns else 'price'
+    prices = features[price_col].to_numpy(dtype=np.float64)
+    rows = features.index.get_indexer(index)
+
+    for horizon in horizons:
+        # Outcome of each day, for the days that already have one
+        known = rows + horizon < len(prices)
+        pct_change = forward_returns(prices, horizon)[rows[known]]
+        known[known] = ~np.isnan(pct_change)
+        pct_change = pct_change[~np.isnan(pct_change)]
+        if not known.any():
+            continue
+
+        labels = direction_labels(pct_change, threshold)
+        horizon_probabilities = probabilities
+        if probabilities.ndim == 3:
+            horizon_probabilities = probabilities[:, model.horizon_index(horizon)]
+        horizon_probabilities = horizon_probabilities[known]
+
+        timeframe = f"{horizon}d"
+        result['horizons'][timeframe] = score_predictions(horizon_probabilities, labels, index[known])
+
+        if return_predictions:
+            result['predictions'][timeframe] = pd.DataFrame({
+                'label': labels,
+                'prediction': horizon_probabilities.argmax(axis=1),
+                'confidence': horizon_probabilities.max(axis=1)
+            }, index=index[known])
+
+    return result
+
+
+def backtest_checkpoint(
+    checkpoint_path: str,
+    frames: Dict[str, pd.DataFrame],
+    horizons: Sequence[int] = BACKTEST_HORIZONS,
+    sequence_length: Optional[int] = None,
+    **kwargs
+) -> Dict:
+    """
+    Backtest one checkpoint on the price history of one or more symbols
+
+    Args:
+        checkpoint_path: Checkpoint to replay (per-asset, multi-horizon or global)
+        frames: OHLCV history by symbol
+        horizons: Horizons in days to score
+        sequence_length: Window length (default: the checkpoint's training config)
+        **kwargs: Passed to backtest_symbol (threshold, start, end, batch_size)
+
+    Returns:
+        Report dict with checkpoint details and per-symbol results under 'symbols'
+    """
+    model, config = load_backtest_model(checkpoint_path)
+    sequence_length = sequence_length or config.get('sequence_length', 90)
+
+    report = {
+        'checkpoint': checkpoint_path,
+        'architecture': config.get('architecture', 'stacked'),
+        'created_at': datetime.utcnow().isoformat() + 'Z',
+        'sequence_length': sequence_length,
+        'horizons': list(horizons),
+        'symbols': {}
+    }
+
+    for symbol, df in frames.items():
+        report['symbols'][symbol] = backtest_symbol(
+            model, df, symbol, horizons=horizons, sequence_length=sequence_length, **kwargs
+        )
+        for timeframe, summary in report['symbols'][symbol]['horizons'].items():
+            logger.info(f"{symbol} {timeframe}: accuracy {summary['accuracy']:.2%} over {summary['samples']} days, "
+                        f"ECE {summary['expected_calibration_error']:.3f}")
+
+    return report
+
+
+def backtest_report_path(checkpoint_path: str) -> str:
+    """Path of the published backtest report of a checkpoint (BTC_best.pth -> BTC_best_backtest.json)"""
+    return f"{os.path.splitext(checkpoint_path)[0]}_backtest.json"
+
+
+def publish_report(report: Dict, checkpoint_path: str) -> str:
+    """
+    Write a report next to its checkpoint for the API to read (write-then-rename)
+
+    Returns:
+        Path of the published report
+    """
+    path = backtest_report_path(checkpoint_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_published_report(checkpoint_path: str) -> Optional[Dict]:
+    """Published backtest report of a checkpoint, or None if there is none"""
+    try:
+        with open(backtest_report_path(checkpoint_path)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def backtest_accuracy(report: Optional[Dict], symbol: str, timeframe: str) -> Optional[Dict[str, float]]:
+    """
+    last30Days / last90Days accuracy of a symbol and timeframe from a backtest report
+
+    Returns:
+        Dict for PredictionResponse.historical_accuracy, or None if the
+        report does not cover the symbol/timeframe
+    """
+    summary = ((report or {}).get('symbols', {}).get(symbol, {}).get('horizons', {})).get(timeframe)
+    if not summary or summary.get('accuracy_last_30') is None:
+        return None
+
+    last90 = summary.get('accuracy_last_90')
+    return {
+        'last30Days': round(summary['accuracy_last_30'], 3),
+        'last90Days': round(last90 if last90 is not None else summary['accuracy'], 3)
+    }
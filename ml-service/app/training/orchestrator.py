@@ -0,0 +1,133 @@
+"""
+Parallel Multi-Asset Training Orchestrator
+Runs per-asset training functions across a process pool
+
+Each model is small and CPU-bound, so training assets one after another
+leaves most cores idle. The orchestrator gives every worker process its own
+torch thread budget so the pool as a whole uses the machine without
+oversubscribing it.
+"""
+
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_worker_budget(
+    num_tasks: int,
+    max_workers: Optional[int] = None,
+    threads_per_worker: Optional[int] = None
+) -> tuple:
+    """
+    Work out how many worker processes and torch threads per worker to use
+
+    Args:
+        num_tasks: Number of training tasks
+        max_workers: Requested worker count (default: one per task, capped at CPU count)
+        threads_per_worker: Requested torch threads per worker (default: CPUs / workers)
+
+    Returns:
+        Tuple of (workers, threads_per_worker)
+    """
+    cpu_count = os.cpu_count() or 1
+
+    workers = max_workers or min(num_tasks, cpu_count)
+    workers = max(1, min(workers, num_tasks))
+
+    threads = threads_per_worker or max(1, cpu_count // workers)
+
+    return workers, threads
+
+
+def init_worker_threads(num_threads: int):
+    """Process pool initializer: pin torch to the worker's thread budget"""
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Already initialized in this process
+        pass
+
+
+def _run_training_task(train_fn: Callable, symbol: str, kwargs: Dict) -> Dict:
+    """Run a (possibly async) per-asset training function inside a worker"""
+    result = train_fn(symbol, **kwargs)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+
+    result.setdefault('symbol', symbol)
+    result['worker_pid'] = os.getpid()
+    result['worker_threads'] = torch.get_num_threads()
+
+    return result
+
+
+def train_assets_parallel(
+    train_fn: Callable,
+    assets: List[str],
+    max_workers: Optional[int] = None,
+    threads_per_worker: Optional[int] = None,
+    **train_kwargs
+) -> List[Dict]:
+    """
+    Train one model per asset across a process pool
+
+    Args:
+        train_fn: Per-asset training function taking (symbol, **train_kwargs) and
+            returning a results dict. May be async. Must be importable (module level).
+        assets: Asset symbols to train
+        max_workers: Number of worker processes
+        threads_per_worker: torch.set_num_threads budget for each worker
+        **train_kwargs: Extra keyword arguments passed to train_fn
+
+    Returns:
+        List of results dicts in the same order as assets. Worker crashes are
+        reported as {'status': 'failed'} entries instead of raising.
+    """
+    workers, threads = resolve_worker_budget(len(assets), max_workers, threads_per_worker)
+
+    logger.info(f"Training {len(assets)} assets on {workers} workers x {threads} torch threads")
+
+    results: Dict[int, Dict] = {}
+
+    # spawn avoids forking a parent that already started OpenMP threads
+    context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=init_worker_threads,
+        initargs=(threads,)
+    ) as executor:
+        futures = {
+            executor.submit(_run_training_task, train_fn, symbol, train_kwargs): i
+            for i, symbol in enumerate(assets)
+        }
+
+        for future in as_completed(futures):
+            i = futures[future]
+            symbol = assets[i]
+
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"❌ Worker failed for {symbol}: {str(e)}")
+                result = {
+                    'symbol': symbol,
+                    'status': 'failed',
+                    'error': f"worker error: {str(e)}",
+                    'timestamp': datetime.now().isoformat()
+                }
+
+            logger.info(f"<<< Finished {symbol}: {result.get('status')} ({len(results) + 1}/{len(assets)})")
+            results[i] = result
+
+    return [results[i] for i in range(len(assets))]
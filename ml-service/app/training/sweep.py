@@ -0,0 +1,384 @@
+"""
+Hyperparameter Sweep Runner for CryptoLSTM
+Grid or random search over model/training hyperparameters
+
+Each symbol's feature matrix is engineered once and each distinct
+sequence_length is windowed once; the resulting arrays are written to the
+sweep directory and memory-mapped by every trial. Trials run in parallel
+worker processes, bad trials are pruned early with a median stopping rule on
+the per-epoch val_losses, and a ranked leaderboard is written at the end.
+"""
+
+import os
+import csv
+import json
+import random
+import logging
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import torch
+
+from app.models.crypto_lstm import build_model
+from app.training.trainer import ModelTrainer, TRAINING_CONFIG
+from app.training.orchestrator import resolve_worker_budget, init_worker_threads
+from app.utils.feature_engineering import (
+    engineer_features,
+    build_dataset,
+    split_time_series_data
+)
+
+logger = logging.getLogger(__name__)
+
+# Default search space (keys are TRAINING_CONFIG keys)
+SEARCH_SPACE = {
+    'hidden_sizes': [[128, 64, 32], [256, 128, 64]],
+    'dropout': [0.2, 0.3],
+    'learning_rate': [0.001, 0.0005],
+    'batch_size': [16, 32],
+    'sequence_length': [60, 90],
+}
+
+# Median stopping rule settings
+PRUNING_CONFIG = {
+    'enabled': True,
+    'warmup_epochs': 10,  # Never prune before this epoch
+    'min_reference_trials': 3,  # Need this many other curves to compare against
+}
+
+
+def generate_trials(
+    space: Optional[Dict[str, List]] = None,
+    mode: str = 'grid',
+    num_trials: Optional[int] = None,
+    seed: int = 42
+) -> List[Dict]:
+    """
+    Generate trial parameter sets from a search space
+
+    Args:
+        space: Dict mapping config key to candidate values (default: SEARCH_SPACE)
+        mode: 'grid' (full cartesian product) or 'random' (sampled)
+        num_trials: Number of trials for random mode, or cap for grid mode
+        seed: Random seed
+
+    Returns:
+        List of parameter dicts
+    """
+    space = space or SEARCH_SPACE
+    keys = list(space.keys())
+
+    if mode == 'grid':
+        trials = [dict(zip(keys, values)) for values in itertools.product(*space.values())]
+        if num_trials is not None:
+            trials = trials[:num_trials]
+    elif mode == 'random':
+        rng = random.Random(seed)
+        trials = [
+            {key: rng.choice(space[key]) for key in keys}
+            for _ in range(num_trials or 10)
+        ]
+    else:
+        raise ValueError(f"Unknown sweep mode: {mode}")
+
+    return trials
+
+
+def prepare_sweep_datasets(
+    frames: Dict[str, pd.DataFrame],
+    sequence_lengths: List[int],
+    output_dir: str,
+    horizon: int = 7
+) -> Dict[str, Dict[int, str]]:
+    """
+    Build and cache one normalized sequence dataset per (symbol, sequence_length)
+
+    Args:
+        frames: Dict mapping symbol to raw OHLCV DataFrame
+        sequence_lengths: Distinct sequence lengths used by the trials
+        output_dir: Sweep output directory
+        horizon: Prediction horizon in days
+
+    Returns:
+        Dict mapping symbol -> sequence_length -> dataset directory
+    """
+    paths: Dict[str, Dict[int, str]] = {}
+
+    for symbol, df in frames.items():
+        features = engineer_features(df)
+        paths[symbol] = {}
+
+        for sequence_length in sorted(set(sequence_lengths)):
+            X, y, _ = build_dataset(features, horizon=horizon, sequence_length=sequence_length)
+
+            # Same per-feature normalization as the training scripts
+            mean = X.reshape(-1, X.shape[2]).mean(axis=0)
+            std = X.reshape(-1, X.shape[2]).std(axis=0)
+            X = np.where(std > 0, (X - mean) / np.where(std > 0, std, 1), X).astype(np.float32)
+
+            X_train, X_val, _, y_train, y_val, _ = split_time_series_data(X, y)
+
+            dataset_dir = os.path.join(output_dir, 'datasets', f"{symbol}_L{sequence_length}")
+            os.makedirs(dataset_dir, exist_ok=True)
+            for name, array in [('X_train', X_train), ('y_train', y_train), ('X_val', X_val), ('y_val', y_val)]:
+                np.save(os.path.join(dataset_dir, f"{name}.npy"), np.ascontiguousarray(array))
+
+            paths[symbol][sequence_length] = dataset_dir
+            logger.info(f"Cached {symbol} dataset L={sequence_length}: train={len(X_train)}, val={len(X_val)}")
+
+    return paths
+
+
+def should_prune(val_losses: List[float], reference_curves: List[List[float]], config: Dict) -> bool:
+    """
+    Median stopping rule
+
+    A trial is pruned when its best val_loss so far is worse than the median
+    of the other trials' best val_loss at the same epoch.
+
+    Args:
+        val_losses: This trial's per-epoch validation losses
+        reference_curves: Other trials' per-epoch validation losses
+        config: Pruning configuration
+
+    Returns:
+        True if the trial should stop
+    """
+    epoch = len(val_losses)
+    if not config.get('enabled', True) or epoch < config['warmup_epochs']:
+        return False
+
+    reference = [min(curve[:epoch]) for curve in reference_curves if len(curve) >= epoch]
+    if len(reference) < config['min_reference_trials']:
+        return False
+
+    return min(val_losses) > float(np.median(reference))
+
+
+def _run_trial(
+    trial_id: int,
+    symbol: str,
+    params: Dict,
+    dataset_dir: str,
+    base_config: Dict,
+    curves,
+    pruning_config: Dict,
+    output_dir: str,
+    seed: int
+) -> Dict:
+    """Train a single trial inside a worker process"""
+    torch.manual_seed(seed + trial_id)
+    np.random.seed(seed + trial_id)
+
+    arrays = {
+        name: np.load(os.path.join(dataset_dir, f"{name}.npy"), mmap_mode='r')
+        for name in ['X_train', 'y_train', 'X_val', 'y_val']
+    }
+
+    config = base_config.copy()
+    config.update(params)
+    config['checkpoint_dir'] = os.path.join(output_dir, 'checkpoints', f"trial_{trial_id:04d}")
+    config['snapshot_interval'] = 0  # Trials are short and re-runnable; skip resume snapshots
+
+    model = build_model(config, input_size=arrays['X_train'].shape[2])
+    trainer = ModelTrainer(model, config=config, device='cpu', use_mlflow=False)
+
+    key = f"{symbol}:{trial_id}"
+
+    def on_epoch(epoch: int, metrics: Dict) -> bool:
+        curves[key] = list(trainer.val_losses)
+        reference = [curve for other, curve in curves.items() if other != key and other.startswith(f"{symbol}:")]
+        return should_prune(trainer.val_losses, reference, pruning_config)
+
+    start_time = datetime.now()
+    results = trainer.train(
+        np.asarray(arrays['X_train']),
+        np.asarray(arrays['y_train']),
+        np.asarray(arrays['X_val']),
+        np.asarray(arrays['y_val']),
+        symbol=symbol,
+        verbose=False,
+        epoch_callback=on_epoch
+    )
+
+    return {
+        'trial_id': trial_id,
+        'symbol': symbol,
+        'status': 'pruned' if results['stopped_by_callback'] else 'success',
+        'params': params,
+        'best_val_loss': results['best_val_loss'],
+        'best_val_accuracy': results['best_val_accuracy'],
+        'epochs_trained': results['epochs_trained'],
+        'early_stopped': results['early_stopped'],
+        'val_losses': list(trainer.val_losses),
+        'training_time_seconds': (datetime.now() - start_time).total_seconds(),
+        'checkpoint_path': os.path.join(config['checkpoint_dir'], f"{symbol}_best.pth")
+    }
+
+
+def build_leaderboard(results: List[Dict]) -> List[Dict]:
+    """
+    Rank parameter sets by mean best val_loss across symbols
+
+    Args:
+        results: Per-trial results
+
+    Returns:
+        Ranked list of leaderboard rows
+    """
+    groups: Dict[str, List[Dict]] = {}
+    for result in results:
+        if result['status'] == 'failed':
+            continue
+        groups.setdefault(json.dumps(result['params'], sort_keys=True), []).append(result)
+
+    rows = []
+    for params_key, group in groups.items():
+        rows.append({
+            'params': json.loads(params_key),
+            'mean_best_val_loss': float(np.mean([r['best_val_loss'] for r in group])),
+            'mean_best_val_accuracy': float(np.mean([r['best_val_accuracy'] for r in group])),
+            'symbols': [r['symbol'] for r in group],
+            'pruned': sum(r['status'] == 'pruned' for r in group),
+            'trial_ids': [r['trial_id'] for r in group]
+        })
+
+    rows.sort(key=lambda r: (r['mean_best_val_loss'], -r['mean_best_val_accuracy']))
+    for rank, row in enumerate(rows, 1):
+        row['rank'] = rank
+
+    return rows
+
+
+def write_leaderboard_csv(path: str, leaderboard: List[Dict], param_keys: List[str], base_config: Dict):
+    """
+    Write the leaderboard as CSV with one column per swept parameter
+
+    Args:
+        path: Output CSV path
+        leaderboard: Rows from build_leaderboard()
+        param_keys: Swept parameter names (column order)
+        base_config: Config supplying values a trial did not set
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['rank', 'mean_best_val_loss', 'mean_best_val_accuracy', 'pruned', *param_keys])
+        for row in leaderboard:
+            writer.writerow([
+                row['rank'],
+                f"{row['mean_best_val_loss']:.6f}",
+                f"{row['mean_best_val_accuracy']:.4f}",
+                row['pruned'],
+                *[row['params'].get(key, base_config.get(key)) for key in param_keys]
+            ])
+
+
+def run_sweep(
+    frames: Dict[str, pd.DataFrame],
+    trials: List[Dict],
+    output_dir: str = 'sweeps',
+    base_config: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    threads_per_worker: Optional[int] = None,
+    pruning_config: Optional[Dict] = None,
+    seed: int = 42
+) -> Dict:
+    """
+    Run a hyperparameter sweep
+
+    Args:
+        frames: Dict mapping symbol to raw OHLCV DataFrame
+        trials: Parameter sets from generate_trials()
+        output_dir: Directory for cached datasets, trial checkpoints and leaderboard
+        base_config: Base training config (default: TRAINING_CONFIG)
+        max_workers: Number of worker processes
+        threads_per_worker: torch thread budget per worker
+        pruning_config: Median stopping settings (default: PRUNING_CONFIG)
+        seed: Base random seed
+
+    Returns:
+        Dict with 'results', 'leaderboard' and output file paths
+    """
+    base_config = (base_config or TRAINING_CONFIG).copy()
+    pruning_config = pruning_config or PRUNING_CONFIG
+    os.makedirs(output_dir, exist_ok=True)
+
+    sequence_lengths = [t.get('sequence_length', base_config['sequence_length']) for t in trials]
+    dataset_paths = prepare_sweep_datasets(frames, sequence_lengths, output_dir)
+
+    tasks = [
+        (trial_id, symbol, params)
+        for trial_id, params in enumerate(trials)
+        for symbol in frames
+    ]
+
+    workers, threads = resolve_worker_budget(len(tasks), max_workers, threads_per_worker)
+    logger.info(f"Running {len(trials)} trials x {len(frames)} symbols on {workers} workers x {threads} threads")
+
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    with context.Manager() as manager:
+        curves = manager.dict()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_worker_threads,
+            initargs=(threads,)
+        ) as executor:
+            futures = {}
+            for trial_id, symbol, params in tasks:
+                sequence_length = params.get('sequence_length', base_config['sequence_length'])
+                future = executor.submit(
+                    _run_trial, trial_id, symbol, params,
+                    dataset_paths[symbol][sequence_length],
+                    base_config, curves, pruning_config, output_dir, seed
+                )
+                futures[future] = (trial_id, symbol, params)
+
+            for future in as_completed(futures):
+                trial_id, symbol, params = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Trial {trial_id} ({symbol}) failed: {str(e)}")
+                    result = {
+                        'trial_id': trial_id,
+                        'symbol': symbol,
+                        'status': 'failed',
+                        'params': params,
+                        'error': str(e)
+                    }
+
+                logger.info(
+                    f"Trial {trial_id} ({symbol}) {result['status']}"
+                    + (f": val_loss={result['best_val_loss']:.4f}" if 'best_val_loss' in result else '')
+                )
+                results.append(result)
+
+    results.sort(key=lambda r: (r['trial_id'], r['symbol']))
+    leaderboard = build_leaderboard(results)
+
+    leaderboard_json = os.path.join(output_dir, 'leaderboard.json')
+    with open(leaderboard_json, 'w') as f:
+        json.dump({'leaderboard': leaderboard, 'trials': results}, f, indent=2)
+
+    # Columns follow the parameters this run actually swept (e.g. a --space file)
+    param_keys = list(dict.fromkeys(key for params in trials for key in params))
+    leaderboard_csv = os.path.join(output_dir, 'leaderboard.csv')
+    write_leaderboard_csv(leaderboard_csv, leaderboard, param_keys, base_config)
+
+    logger.info(f"📄 Leaderboard saved to {leaderboard_json} and {leaderboard_csv}")
+
+    return {
+        'results': results,
+        'leaderboard': leaderboard,
+        'leaderboard_json': leaderboard_json,
+        'leaderboard_csv': leaderboard_csv
+    }
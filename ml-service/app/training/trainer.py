@@ -9,18 +9,28 @@ import torch.optim as optim
 from torch.utils.data import DataLoader, TensorDataset
 import numpy as np
 import pandas as pd
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 import os
+import sys
+import copy
 import json
+import time
+import random
 from tqdm import tqdm
 
-from app.models.crypto_lstm import CryptoLSTM
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from app.models.crypto_lstm import CryptoLSTM, CryptoLSTMBase
 
 
 # Training configuration (from ML specification)
 TRAINING_CONFIG = {
     # Model architecture
+    'architecture': 'stacked',  # 'fused' for multi-layer nn.LSTMs over equal-width layers
     'input_size': 20,
     'hidden_sizes': [128, 64, 32],
     'num_classes': 3,
@@ -36,15 +46,20 @@ TRAINING_CONFIG = {
     # Regularization
     'weight_decay': 1e-5,
     'early_stopping_patience': 10,
+    'snapshot_interval': 5,  # Epochs between resumable state snapshots (0 = off)
 
     # Data
     'sequence_length': 90,
     'train_val_test_split': [0.7, 0.15, 0.15],
+    'data_pipeline': 'dataloader',  # 'tensor' for the in-memory fast path
+    'validation_mode': 'batched',  # 'full' for one-pass vectorized validation
+    'precision': 'fp32',  # 'bf16' (CPU/GPU autocast) or 'fp16' (CUDA, loss-scaled)
 }
 
 # IMPROVED Training configuration for better accuracy
 IMPROVED_TRAINING_CONFIG = {
     # Model architecture - Larger capacity
+    'architecture': 'stacked',  # 'fused' for multi-layer nn.LSTMs over equal-width layers
     'input_size': 20,
     'hidden_sizes': [256, 128, 64],  # Increased from [128, 64, 32]
     'num_classes': 3,
@@ -60,6 +75,7 @@ IMPROVED_TRAINING_CONFIG = {
     # Regularization - More aggressive
     'weight_decay': 1e-4,  # Increased from 1e-5
     'early_stopping_patience': 20,  # Increased from 10 to allow more time
+    'snapshot_interval': 5,  # Epochs between resumable state snapshots (0 = off)
 
     # Learning rate scheduling
     'use_lr_scheduler': True,
@@ -70,9 +86,246 @@ IMPROVED_TRAINING_CONFIG = {
     # Data - More historical data
     'sequence_length': 90,
     'train_val_test_split': [0.7, 0.15, 0.15],
+    'data_pipeline': 'dataloader',  # 'tensor' for the in-memory fast path
+    'validation_mode': 'batched',  # 'full' for one-pass vectorized validation
+    'precision': 'fp32',  # 'bf16' (CPU/GPU autocast) or 'fp16' (CUDA, loss-scaled)
 }
 
 
+CLASS_NAMES = ['bearish', 'neutral', 'bullish']
+
+
+def confusion_matrix_metrics(
+    predictions: torch.Tensor,
+    labels: torch.Tensor,
+    num_classes: int = 3
+) -> Dict:
+    """
+    Compute accuracy and per-class metrics from a single confusion matrix
+
+    The confusion matrix is built with one vectorized bincount over
+    (label * num_classes + prediction).
+
+    Args:
+        predictions: Predicted class indices (num_samples,)
+        labels: True class indices (num_samples,)
+        num_classes: Number of classes
+
+    Returns:
+        Dict with 'accuracy', '{class}_accuracy', '{class}_precision' and
+        'confusion_matrix' (rows = true class, columns = predicted class)
+    """
+    labels = labels.reshape(-1).long()
+    predictions = predictions.reshape(-1).long()
+
+    confusion = torch.bincount(
+        labels * num_classes + predictions,
+        minlength=num_classes * num_classes
+    ).reshape(num_classes, num_classes).cpu()
+
+    correct = confusion.diagonal().double()
+    support = confusion.sum(dim=1).double()
+    predicted = confusion.sum(dim=0).double()
+    total = support.sum().item()
+
+    recall = torch.where(support > 0, correct / support.clamp(min=1), torch.zeros_like(correct))
+    precision = torch.where(predicted > 0, correct / predicted.clamp(min=1), torch.zeros_like(correct))
+
+    metrics = {
+        'accuracy': correct.sum().item() / total if total > 0 else 0.0,
+        'confusion_matrix': confusion.tolist()
+    }
+
+    names = CLASS_NAMES if num_classes == len(CLASS_NAMES) else [f"class_{i}" for i in range(num_classes)]
+    for i, name in enumerate(names):
+        metrics[f"{name}_accuracy"] = recall[i].item()
+        metrics[f"{name}_precision"] = precision[i].item()
+
+    return metrics
+
+
+PRECISION_DTYPES = {
+    'bf16': torch.bfloat16,
+    'fp16': torch.float16,
+}
+
+
+def cpu_supports_bf16() -> bool:
+    """
+    Check whether the host CPU has native bfloat16 instructions
+
+    bfloat16 autocast runs on any CPU, but without AVX512-BF16 / AMX it is
+    emulated and usually slower than float32.
+    """
+    try:
+        with open('/proc/cpuinfo') as f:
+            flags = f.read()
+    except OSError:
+        return False
+
+    return 'avx512_bf16' in flags or 'amx_bf16' in flags
+
+
+def resolve_precision(precision: str, device: torch.device) -> str:
+    """
+    Resolve a requested training precision to one the device can run
+
+    Args:
+        precision: 'fp32', 'bf16' or 'fp16'
+        device: Training device
+
+    Returns:
+        Effective precision ('fp32' when the request is not supported)
+    """
+    if precision not in ('fp32', *PRECISION_DTYPES):
+        raise ValueError(f"Unknown precision '{precision}' (expected fp32, bf16 or fp16)")
+
+    if precision == 'bf16':
+        if device.type == 'cuda' and not torch.cuda.is_bf16_supported():
+            print("⚠️  GPU has no bfloat16 support, training in fp32")
+            return 'fp32'
+        if device.type == 'cpu' and not cpu_supports_bf16():
+            print("⚠️  CPU has no native bfloat16 support, training in fp32")
+            return 'fp32'
+
+    if precision == 'fp16' and device.type != 'cuda':
+        print("⚠️  fp16 autocast needs CUDA, training in fp32")
+        return 'fp32'
+
+    return precision
+
+
+def precision_comparison(reference: Dict, candidate: Dict) -> Dict:
+    """
+    Compare a reduced-precision training run against an fp32 reference
+
+    Args:
+        reference: fp32 results from ModelTrainer.train
+        candidate: Reduced-precision results from ModelTrainer.train
+
+    Returns:
+        Dict with epoch-time speedup and validation accuracy/loss deltas
+    """
+    return {
+        'reference_precision': reference['precision'],
+        'precision': candidate['precision'],
+        'speedup': reference['mean_epoch_seconds'] / candidate['mean_epoch_seconds'],
+        'accuracy_delta': candidate['best_val_accuracy'] - reference['best_val_accuracy'],
+        'val_loss_delta': candidate['best_val_loss'] - reference['best_val_loss'],
+        'reference_mean_epoch_seconds': reference['mean_epoch_seconds'],
+        'reference_best_val_accuracy': reference['best_val_accuracy'],
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KB on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def summarize_throughput(epoch_stats: list) -> Dict:
+    """
+    Aggregate per-epoch throughput records of a training run
+
+    Args:
+        epoch_stats: ModelTrainer.epoch_stats entries
+
+    Returns:
+        Dict with mean data/compute seconds, data_fraction (share of train
+        time spent waiting on input batches), mean samples/sec, peak RSS,
+        torch thread count and mean CPU utilization of those threads
+    """
+    if not epoch_stats:
+        return {}
+
+    data_seconds = float(np.mean([e['data_seconds'] for e in epoch_stats]))
+    compute_seconds = float(np.mean([e['compute_seconds'] for e in epoch_stats]))
+    peak_rss = [e['peak_rss_mb'] for e in epoch_stats if e['peak_rss_mb'] is not None]
+
+    return {
+        'mean_data_seconds': data_seconds,
+        'mean_compute_seconds': compute_seconds,
+        'data_fraction': data_seconds / max(data_seconds + compute_seconds, 1e-12),
+        'samples_per_second': float(np.mean([e['samples_per_second'] for e in epoch_stats])),
+        'peak_rss_mb': max(peak_rss) if peak_rss else None,
+        'torch_threads': epoch_stats[-1]['torch_threads'],
+        'mean_cpu_utilization': float(np.mean([e['cpu_utilization'] for e in epoch_stats]))
+    }
+
+
+def atomic_torch_save(obj, path: str):
+    """
+    torch.save to a temporary file in the same directory, then rename
+
+    Readers (and a resumed run after a crash) only ever see the previous
+    complete file or the new complete file, never a partial write.
+
+    Args:
+        obj: Object to save
+        path: Destination path
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            torch.save(obj, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class InMemoryBatchLoader:
+    """
+    Batch iterator over tensors kept fully in memory
+
+    Replaces DataLoader(TensorDataset) for small datasets: shuffling is a
+    single index permutation per epoch and every batch is a sliced view, so
+    there is no per-sample Python collation.
+    """
+
+    def __init__(
+        self,
+        features: torch.Tensor,
+        labels: torch.Tensor,
+        batch_size: int,
+        shuffle: bool = False
+    ):
+        """
+        Initialize the loader
+
+        Args:
+            features: Feature tensor (num_samples, sequence_length, num_features)
+            labels: Label tensor (num_samples,)
+            batch_size: Batch size
+            shuffle: Whether to reshuffle at the start of every epoch
+        """
+        self.features = features.contiguous()
+        self.labels = labels.contiguous()
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+
+    def __len__(self) -> int:
+        return (len(self.labels) + self.batch_size - 1) // self.batch_size
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        features, labels = self.features, self.labels
+
+        if self.shuffle:
+            # One gather per epoch; batches below are views into it
+            perm = torch.randperm(len(labels), device=labels.device)
+            features = features.index_select(0, perm)
+            labels = labels.index_select(0, perm)
+
+        for start in range(0, len(labels), self.batch_size):
+            end = start + self.batch_size
+            yield features[start:end], labels[start:end]
+
+
 class ModelTrainer:
     """
     Trainer class for CryptoLSTM model with early stopping and MLflow tracking
@@ -80,7 +333,7 @@ class ModelTrainer:
 
     def __init__(
         self,
-        model: CryptoLSTM,
+        model: CryptoLSTMBase,
         config: Optional[Dict] = None,
         device: Optional[str] = None,
         use_mlflow: bool = False
@@ -89,7 +342,7 @@ class ModelTrainer:
         Initialize the trainer
 
         Args:
-            model: CryptoLSTM model instance
+            model: CryptoLSTM or FusedCryptoLSTM model instance
             config: Training configuration (uses defaults if None)
             device: Device to train on ('cuda' or 'cpu')
             use_mlflow: Whether to use MLflow tracking
@@ -106,6 +359,11 @@ class ModelTrainer:
 
         self.model = self.model.to(self.device)
 
+        # Mixed precision: weights and optimizer state stay fp32, forward and
+        # backward run under autocast. fp16 needs loss scaling, bf16 does not.
+        self.precision = resolve_precision(self.config.get('precision', 'fp32'), self.device)
+        self.grad_scaler = torch.cuda.amp.GradScaler(enabled=self.precision == 'fp16')
+
         # Loss and optimizer
         self.criterion = nn.CrossEntropyLoss()
         self.optimizer = optim.Adam(
@@ -133,6 +391,9 @@ class ModelTrainer:
         self.train_losses = []
         self.val_losses = []
         self.val_accuracies = []
+        self.epoch_times = []
+        self.epoch_stats = []
+        self.last_epoch_timing: Dict = {}
 
         # MLflow setup
         if self.use_mlflow:
@@ -156,7 +417,7 @@ class ModelTrainer:
 
         Args:
             X_train: Training features (num_samples, sequence_length, num_features)
-            y_train: Training labels (num_samples,)
+            y_train: Training labels (num_samples,) or (num_samples, num_horizons)
             X_val: Validation features
             y_val: Validation labels
             batch_size: Batch size (uses config if None)
@@ -192,12 +453,49 @@ class ModelTrainer:
 
         return train_loader, val_loader
 
+    def prepare_tensor_batches(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+        batch_size: Optional[int] = None
+    ) -> Tuple[InMemoryBatchLoader, InMemoryBatchLoader]:
+        """
+        Create in-memory batch loaders (fast path for small datasets)
+
+        Data is converted and moved to the training device once. The batch
+        size defaults to config['effective_batch_size'] when set, so larger
+        batches can be used without touching config['batch_size'].
+
+        Args:
+            X_train: Training features (num_samples, sequence_length, num_features)
+            y_train: Training labels (num_samples,) or (num_samples, num_horizons)
+            X_val: Validation features
+            y_val: Validation labels
+            batch_size: Batch size (uses config if None)
+
+        Returns:
+            Tuple of (train_loader, val_loader)
+        """
+        batch_size = batch_size or self.config.get('effective_batch_size') or self.config['batch_size']
+
+        X_train_tensor = torch.as_tensor(X_train, dtype=torch.float32, device=self.device)
+        y_train_tensor = torch.as_tensor(y_train, dtype=torch.long, device=self.device)
+        X_val_tensor = torch.as_tensor(X_val, dtype=torch.float32, device=self.device)
+        y_val_tensor = torch.as_tensor(y_val, dtype=torch.long, device=self.device)
+
+        train_loader = InMemoryBatchLoader(X_train_tensor, y_train_tensor, batch_size, shuffle=True)
+        val_loader = InMemoryBatchLoader(X_val_tensor, y_val_tensor, batch_size, shuffle=False)
+
+        return train_loader, val_loader
+
     def train_epoch(self, train_loader: DataLoader) -> float:
         """
         Train for one epoch
 
         Args:
-            train_loader: Training data loader
+            train_loader: Training data loader (DataLoader or InMemoryBatchLoader)
 
         Returns:
             Average training loss for the epoch
@@ -206,77 +504,184 @@ class ModelTrainer:
         total_loss = 0.0
         num_batches = 0
 
+        # Data time: waiting on the loader plus host-to-device copies;
+        # compute time: forward, backward and optimizer step
+        data_seconds = 0.0
+        compute_seconds = 0.0
+        num_samples = 0
+        batch_start = time.perf_counter()
+
         for batch_features, batch_labels in train_loader:
             # Move to device
             batch_features = batch_features.to(self.device)
             batch_labels = batch_labels.to(self.device)
+            data_done = time.perf_counter()
+            data_seconds += data_done - batch_start
 
             # Forward pass
             self.optimizer.zero_grad()
-            outputs = self.model(batch_features)
-            loss = self.criterion(outputs, batch_labels)
+            with self.autocast():
+                outputs = self.model(batch_features)
+                loss = self.compute_loss(outputs, batch_labels)
 
-            # Backward pass
-            loss.backward()
-            self.optimizer.step()
+            # Backward pass (scaler is a pass-through unless precision is fp16)
+            self.grad_scaler.scale(loss).backward()
+            self.grad_scaler.step(self.optimizer)
+            self.grad_scaler.update()
 
+            # loss.item() synchronizes with the device, so the step is complete
             total_loss += loss.item()
             num_batches += 1
+            num_samples += len(batch_labels)
+
+            batch_start = time.perf_counter()
+            compute_seconds += batch_start - data_done
+
+        self.last_epoch_timing = {
+            'data_seconds': data_seconds,
+            'compute_seconds': compute_seconds,
+            'samples': num_samples
+        }
 
         return total_loss / num_batches
 
+    def epoch_throughput(self, epoch: int, epoch_seconds: float, cpu_seconds: float) -> Dict:
+        """
+        Throughput record of the epoch just trained
+
+        Args:
+            epoch: Epoch index
+            epoch_seconds: Wall time of train_epoch
+            cpu_seconds: Process CPU time (all threads) during train_epoch
+
+        Returns:
+            Dict with data/compute seconds, samples/sec, CPU utilization of
+            the torch threads (1.0 = all threads busy) and peak RSS
+        """
+        timing = self.last_epoch_timing
+        threads = torch.get_num_threads()
+
+        return {
+            'epoch': epoch,
+            'epoch_seconds': epoch_seconds,
+            'data_seconds': timing['data_seconds'],
+            'compute_seconds': timing['compute_seconds'],
+            'samples_per_second': timing['samples'] / max(epoch_seconds, 1e-12),
+            'torch_threads': threads,
+            'cpu_utilization': cpu_seconds / max(epoch_seconds * threads, 1e-12),
+            'peak_rss_mb': peak_rss_mb()
+        }
+
+    def compute_loss(self, outputs: torch.Tensor, labels: torch.Tensor) -> torch.Tensor:
+        """
+        Loss for single-horizon or multi-horizon outputs
+
+        Multi-horizon outputs (batch_size, num_horizons, num_classes) with
+        labels (batch_size, num_horizons) are averaged over all horizons.
+        """
+        if outputs.dim() == 3:
+            # CrossEntropyLoss expects the class dimension second
+            return self.criterion(outputs.transpose(1, 2), labels)
+        return self.criterion(outputs, labels)
+
+    def autocast(self):
+        """Autocast context for the configured training precision"""
+        return torch.autocast(
+            device_type=self.device.type,
+            dtype=PRECISION_DTYPES.get(self.precision, torch.bfloat16),
+            enabled=self.precision != 'fp32'
+        )
+
     def validate(self, val_loader: DataLoader) -> Tuple[float, float, Dict]:
         """
         Validate the model
 
+        With config['validation_mode'] == 'full' the whole validation set is
+        evaluated in one forward pass (or a few passes of
+        config['validation_chunk_size'] samples) instead of batch by batch.
+        Validation always runs in fp32, matching how the API serves models.
+
         Args:
-            val_loader: Validation data loader
+            val_loader: Validation data loader (DataLoader or InMemoryBatchLoader)
 
         Returns:
             Tuple of (val_loss, val_accuracy, metrics_dict)
         """
         self.model.eval()
-        total_loss = 0.0
-        num_batches = 0
-        all_predictions = []
-        all_labels = []
+
+        full_tensors = None
+        if self.config.get('validation_mode', 'batched') == 'full':
+            full_tensors = self._loader_tensors(val_loader)
 
         with torch.no_grad():
-            for batch_features, batch_labels in val_loader:
-                # Move to device
-                batch_features = batch_features.to(self.device)
-                batch_labels = batch_labels.to(self.device)
+            if full_tensors is not None:
+                features, labels = full_tensors
+                features = features.to(self.device)
+                labels = labels.to(self.device)
+
+                chunk_size = self.config.get('validation_chunk_size') or len(labels)
+                outputs = torch.cat([
+                    self.model(features[start:start + chunk_size])
+                    for start in range(0, len(labels), chunk_size)
+                ])
+
+                val_loss = self.compute_loss(outputs, labels).item()
+                all_predictions = outputs.argmax(dim=-1)
+                all_labels = labels
+            else:
+                total_loss = 0.0
+                num_batches = 0
+                predictions = []
+                batch_labels_list = []
 
-                # Forward pass
-                outputs = self.model(batch_features)
-                loss = self.criterion(outputs, batch_labels)
+                for batch_features, batch_labels in val_loader:
+                    # Move to device
+                    batch_features = batch_features.to(self.device)
+                    batch_labels = batch_labels.to(self.device)
+
+                    # Forward pass
+                    outputs = self.model(batch_features)
+                    loss = self.compute_loss(outputs, batch_labels)
 
-                total_loss += loss.item()
-                num_batches += 1
+                    total_loss += loss.item()
+                    num_batches += 1
 
-                # Get predictions
-                _, predicted = torch.max(outputs, 1)
-                all_predictions.extend(predicted.cpu().numpy())
-                all_labels.extend(batch_labels.cpu().numpy())
+                    # Get predictions
+                    predictions.append(outputs.argmax(dim=-1))
+                    batch_labels_list.append(batch_labels)
 
-        # Calculate metrics
-        val_loss = total_loss / num_batches
-        val_accuracy = np.mean(np.array(all_predictions) == np.array(all_labels))
+                val_loss = total_loss / num_batches
+                all_predictions = torch.cat(predictions)
+                all_labels = torch.cat(batch_labels_list)
 
-        # Per-class accuracy
-        all_predictions = np.array(all_predictions)
-        all_labels = np.array(all_labels)
+        # Calculate metrics (accuracy and per-class accuracy from one confusion matrix)
+        class_metrics = confusion_matrix_metrics(all_predictions, all_labels, self.model.num_classes)
+        val_accuracy = class_metrics.pop('accuracy')
 
         metrics = {
             'val_loss': val_loss,
             'val_accuracy': val_accuracy,
-            'bearish_accuracy': np.mean(all_predictions[all_labels == 0] == 0) if np.sum(all_labels == 0) > 0 else 0,
-            'neutral_accuracy': np.mean(all_predictions[all_labels == 1] == 1) if np.sum(all_labels == 1) > 0 else 0,
-            'bullish_accuracy': np.mean(all_predictions[all_labels == 2] == 2) if np.sum(all_labels == 2) > 0 else 0,
+            **class_metrics
         }
 
+        # Multi-horizon models: accuracy of each head (val_accuracy is the mean)
+        for i, horizon in enumerate(getattr(self.model, 'horizons', [])):
+            metrics[f"accuracy_{horizon}d"] = (all_predictions[:, i] == all_labels[:, i]).double().mean().item()
+
         return val_loss, val_accuracy, metrics
 
+    @staticmethod
+    def _loader_tensors(loader) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        """Return the (features, labels) tensors behind a loader, if it exposes them"""
+        if isinstance(loader, InMemoryBatchLoader):
+            return loader.features, loader.labels
+
+        dataset = getattr(loader, 'dataset', None)
+        if isinstance(dataset, TensorDataset) and len(dataset.tensors) == 2:
+            return dataset.tensors[0], dataset.tensors[1]
+
+        return None
+
     def train(
         self,
         X_train: np.ndarray,
@@ -284,11 +689,17 @@ class ModelTrainer:
         X_val: np.ndarray,
         y_val: np.ndarray,
         symbol: str = "BTC",
-        verbose: bool = True
+        verbose: bool = True,
+        epoch_callback: Optional[Callable[[int, Dict], bool]] = None,
+        resume: bool = False
     ) -> Dict:
         """
         Train the model with early stopping
 
+        Every config['snapshot_interval'] epochs the full training state is
+        written to {checkpoint_dir}/{symbol}_state.pth. With resume=True an
+        existing snapshot is restored and training continues after its epoch.
+
         Args:
             X_train: Training features
             y_train: Training labels
@@ -296,6 +707,9 @@ class ModelTrainer:
             y_val: Validation labels
             symbol: Asset symbol for logging
             verbose: Whether to print progress
+            epoch_callback: Optional fn(epoch, metrics) called after every epoch;
+                returning True stops training (e.g. sweep pruning)
+            resume: Continue from the last state snapshot if one exists
 
         Returns:
             Training results dictionary
@@ -307,6 +721,7 @@ class ModelTrainer:
             print(f"Training samples: {len(X_train)}")
             print(f"Validation samples: {len(X_val)}")
             print(f"Device: {self.device}")
+            print(f"Precision: {self.precision}")
             print(f"{'='*60}\n")
 
         # Start MLflow run
@@ -319,18 +734,43 @@ class ModelTrainer:
             self.mlflow.log_param("val_samples", len(X_val))
 
         # Prepare data loaders
-        train_loader, val_loader = self.prepare_dataloaders(X_train, y_train, X_val, y_val)
+        if self.config.get('data_pipeline', 'dataloader') == 'tensor':
+            train_loader, val_loader = self.prepare_tensor_batches(X_train, y_train, X_val, y_val)
+        else:
+            train_loader, val_loader = self.prepare_dataloaders(X_train, y_train, X_val, y_val)
+
+        # Restore interrupted run
+        start_epoch = 0
+        previous_time = 0.0
+        stopped_by_callback = False
+        if resume:
+            snapshot = self.load_snapshot(symbol)
+            if snapshot is not None:
+                start_epoch = snapshot['epoch'] + 1
+                previous_time = snapshot['training_time_seconds']
+                stopped_by_callback = snapshot['stopped_by_callback']
+                if verbose:
+                    print(f"♻️  Resuming {symbol} from epoch {start_epoch}")
+                if snapshot['finished']:
+                    start_epoch = self.config['epochs']
 
         # Training loop
         start_time = datetime.now()
+        snapshot_interval = self.config.get('snapshot_interval', 0)
+        epoch = start_epoch - 1
 
-        epochs_range = range(self.config['epochs'])
+        epochs_range = range(start_epoch, self.config['epochs'])
         if verbose:
             epochs_range = tqdm(epochs_range, desc="Training")
 
         for epoch in epochs_range:
             # Train
+            epoch_start = time.perf_counter()
+            cpu_start = time.process_time()
             train_loss = self.train_epoch(train_loader)
+            epoch_seconds = time.perf_counter() - epoch_start
+            self.epoch_times.append(epoch_seconds)
+            self.epoch_stats.append(self.epoch_throughput(epoch, epoch_seconds, time.process_time() - cpu_start))
             self.train_losses.append(train_loss)
 
             # Validate
@@ -345,6 +785,10 @@ class ModelTrainer:
                     'val_loss': val_loss,
                     'val_accuracy': val_accuracy
                 }, step=epoch)
+                self.mlflow.log_metrics({
+                    key: value for key, value in self.epoch_stats[-1].items()
+                    if key not in ('epoch', 'torch_threads') and value is not None
+                }, step=epoch)
 
             # Learning rate scheduling
             if self.scheduler is not None:
@@ -378,8 +822,28 @@ class ModelTrainer:
                         print(f"\n⚠️  Early stopping triggered at epoch {epoch+1}")
                     break
 
+            # External stop request
+            if epoch_callback is not None and epoch_callback(epoch, {'train_loss': train_loss, **val_metrics}):
+                stopped_by_callback = True
+                if verbose:
+                    print(f"\n⚠️  Training stopped by callback at epoch {epoch+1}")
+                break
+
+            # Periodic resumable snapshot
+            if snapshot_interval and (epoch + 1) % snapshot_interval == 0:
+                elapsed = previous_time + (datetime.now() - start_time).total_seconds()
+                self.save_snapshot(symbol, epoch, elapsed)
+
         # Training complete
-        training_time = (datetime.now() - start_time).total_seconds()
+        training_time = previous_time + (datetime.now() - start_time).total_seconds()
+
+        # Final snapshot; an early-stopped run is marked finished so a resume
+        # does not retrain, while reaching the epoch limit can be extended
+        if snapshot_interval and epoch >= start_epoch:
+            finished = stopped_by_callback or self.patience_counter >= self.config['early_stopping_patience']
+            self.save_snapshot(symbol, epoch, training_time, finished=finished, stopped_by_callback=stopped_by_callback)
+
+        throughput = summarize_throughput(self.epoch_stats)
 
         if verbose:
             print(f"\n{'='*60}")
@@ -388,6 +852,10 @@ class ModelTrainer:
             print(f"Best Val Loss: {self.best_val_loss:.4f}")
             print(f"Best Val Accuracy: {self.best_val_accuracy:.4f}")
             print(f"Training Time: {training_time:.2f}s")
+            if throughput:
+                print(f"Throughput: {throughput['samples_per_second']:.0f} samples/s, "
+                      f"data {throughput['data_fraction']:.0%} of train time, "
+                      f"CPU {throughput['mean_cpu_utilization']:.0%} of {throughput['torch_threads']} threads")
             print(f"{'='*60}\n")
 
         # Final metrics
@@ -398,7 +866,13 @@ class ModelTrainer:
             'final_train_loss': self.train_losses[-1],
             'epochs_trained': len(self.train_losses),
             'training_time_seconds': training_time,
-            'early_stopped': self.patience_counter >= self.config['early_stopping_patience']
+            'early_stopped': self.patience_counter >= self.config['early_stopping_patience'],
+            'stopped_by_callback': stopped_by_callback,
+            'precision': self.precision,
+            'mean_epoch_seconds': float(np.mean(self.epoch_times)),
+            'train_samples_per_second': len(X_train) / float(np.mean(self.epoch_times)),
+            'throughput': throughput,
+            'epoch_stats': self.epoch_stats
         }
 
         # Log final metrics to MLflow
@@ -406,7 +880,8 @@ class ModelTrainer:
             self.mlflow.log_metrics({
                 'best_val_loss': self.best_val_loss,
                 'best_val_accuracy': self.best_val_accuracy,
-                'training_time': training_time
+                'training_time': training_time,
+                **{key: value for key, value in throughput.items() if value is not None}
             })
             self.mlflow.pytorch.log_model(self.model, "model")
             self.mlflow.end_run()
@@ -422,7 +897,7 @@ class ModelTrainer:
             epoch: Current epoch
             metrics: Validation metrics
         """
-        checkpoint_dir = "models/checkpoints"
+        checkpoint_dir = self.config.get('checkpoint_dir', 'models/checkpoints')
         os.makedirs(checkpoint_dir, exist_ok=True)
 
         checkpoint = {
@@ -435,8 +910,102 @@ class ModelTrainer:
             'config': self.config
         }
 
+        # Write-then-rename: the serving process may be reading this file
         checkpoint_path = os.path.join(checkpoint_dir, f"{symbol}_best.pth")
-        torch.save(checkpoint, checkpoint_path)
+        atomic_torch_save(checkpoint, checkpoint_path)
+
+    def snapshot_path(self, symbol: str) -> str:
+        """Path of the resumable state snapshot for a symbol"""
+        checkpoint_dir = self.config.get('checkpoint_dir', 'models/checkpoints')
+        return os.path.join(checkpoint_dir, f"{symbol}_state.pth")
+
+    def save_snapshot(
+        self,
+        symbol: str,
+        epoch: int,
+        training_time: float,
+        finished: bool = False,
+        stopped_by_callback: bool = False
+    ):
+        """
+        Atomically save the full training state for resuming
+
+        Args:
+            symbol: Asset symbol
+            epoch: Last completed epoch
+            training_time: Training seconds so far (across resumes)
+            finished: Whether training was stopped early (early stopping or callback)
+            stopped_by_callback: Whether an epoch callback ended training
+        """
+        os.makedirs(os.path.dirname(self.snapshot_path(symbol)) or '.', exist_ok=True)
+
+        snapshot = {
+            'epoch': epoch,
+            'finished': finished,
+            'stopped_by_callback': stopped_by_callback,
+            'training_time_seconds': training_time,
+            'model_state_dict': self.model.state_dict(),
+            'optimizer_state_dict': self.optimizer.state_dict(),
+            'scheduler_state_dict': self.scheduler.state_dict() if self.scheduler is not None else None,
+            'grad_scaler_state_dict': self.grad_scaler.state_dict(),
+            'best_val_loss': self.best_val_loss,
+            'best_val_accuracy': self.best_val_accuracy,
+            'patience_counter': self.patience_counter,
+            'train_losses': self.train_losses,
+            'val_losses': self.val_losses,
+            'val_accuracies': self.val_accuracies,
+            'epoch_times': self.epoch_times,
+            'epoch_stats': self.epoch_stats,
+            'rng_state': {
+                'torch': torch.get_rng_state(),
+                'cuda': torch.cuda.get_rng_state_all() if torch.cuda.is_available() else None,
+                'numpy': np.random.get_state(),
+                'python': random.getstate()
+            },
+            'config': self.config
+        }
+
+        atomic_torch_save(snapshot, self.snapshot_path(symbol))
+
+    def load_snapshot(self, symbol: str) -> Optional[Dict]:
+        """
+        Restore the full training state from a snapshot, if one exists
+
+        Args:
+            symbol: Asset symbol
+
+        Returns:
+            Snapshot dict, or None when there is nothing to resume
+        """
+        path = self.snapshot_path(symbol)
+        if not os.path.exists(path):
+            return None
+
+        snapshot = torch.load(path, map_location=self.device)
+
+        self.model.load_state_dict(snapshot['model_state_dict'])
+        self.optimizer.load_state_dict(snapshot['optimizer_state_dict'])
+        if self.scheduler is not None and snapshot['scheduler_state_dict'] is not None:
+            self.scheduler.load_state_dict(snapshot['scheduler_state_dict'])
+        self.grad_scaler.load_state_dict(snapshot['grad_scaler_state_dict'])
+
+        self.best_val_loss = snapshot['best_val_loss']
+        self.best_val_accuracy = snapshot['best_val_accuracy']
+        self.patience_counter = snapshot['patience_counter']
+        self.train_losses = snapshot['train_losses']
+        self.val_losses = snapshot['val_losses']
+        self.val_accuracies = snapshot['val_accuracies']
+        self.epoch_times = snapshot['epoch_times']
+        self.epoch_stats = snapshot.get('epoch_stats', [])
+
+        rng_state = snapshot['rng_state']
+        torch.set_rng_state(rng_state['torch'].cpu())
+        if rng_state['cuda'] is not None and torch.cuda.is_available():
+            torch.cuda.set_rng_state_all(rng_state['cuda'])
+        np.random.set_state(rng_state['numpy'])
+        random.setstate(rng_state['python'])
+
+        return snapshot
 
     def load_checkpoint(self, checkpoint_path: str):
         """
@@ -457,7 +1026,45 @@ class ModelTrainer:
         print(f"   Val Accuracy: {self.best_val_accuracy:.4f}")
 
 
-def load_checkpoint(checkpoint_path: str, model: CryptoLSTM, device: str = 'cpu') -> Dict:
+def train_precision_reference(
+    initial_model: CryptoLSTMBase,
+    config: Dict,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    symbol: str = "BTC",
+    device: Optional[str] = None
+) -> Dict:
+    """
+    Train an fp32 reference run for a reduced-precision training run
+
+    Uses a copy of the untrained model so both runs start from the same
+    weights. The reference checkpoint goes to a 'fp32_reference'
+    subdirectory so it never replaces the served checkpoint.
+
+    Args:
+        initial_model: Untrained model (copied, not modified)
+        config: Training configuration of the reduced-precision run
+        X_train, y_train, X_val, y_val: Training and validation data
+        symbol: Asset symbol
+        device: Training device
+
+    Returns:
+        fp32 training results dictionary
+    """
+    reference_config = config.copy()
+    reference_config['precision'] = 'fp32'
+    reference_config['checkpoint_dir'] = os.path.join(
+        config.get('checkpoint_dir', 'models/checkpoints'), 'fp32_reference'
+    )
+
+    trainer = ModelTrainer(copy.deepcopy(initial_model), config=reference_config, device=device)
+
+    return trainer.train(X_train, y_train, X_val, y_val, symbol=symbol, verbose=False)
+
+
+def load_checkpoint(checkpoint_path: str, model: CryptoLSTMBase, device: str = 'cpu') -> Dict:
     """
     Load model checkpoint (standalone function for inference)
 
@@ -0,0 +1,325 @@
+"""
+Online Prediction Accuracy Tracking
+Logs every served prediction and scores it once its horizon has passed
+
+Served predictions are buffered in memory and flushed to a compact,
+append-only columnar log (one raw little-endian file per column):
+    {root}/{symbol}/{YYYY-MM}/{writer}/issued_at.bin      int64 ns timestamps
+    {root}/{symbol}/{YYYY-MM}/{writer}/horizon.bin        int16 days
+    {root}/{symbol}/{YYYY-MM}/{writer}/model_version.bin  int64 checkpoint version
+    {root}/{symbol}/{YYYY-MM}/{writer}/price.bin          float64 price at issue
+    {root}/{symbol}/{YYYY-MM}/{writer}/probabilities.bin  float32 (rows, 3)
+
+Each writing process appends to its own segment ({writer} is the pid plus
+a random suffix, new for every process start), so service workers never
+interleave rows and a restarted process never appends behind a torn tail
+left by a crash. A torn tail is dropped on read; a flush that fails part
+way moves the writer to a fresh segment.
+
+A periodic batch job joins the recent log against realised prices and
+keeps rolling accuracy per symbol, timeframe and model version in memory,
+so the API reads live accuracy without any per-request query.
+"""
+
+import os
+import uuid
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.utils.feature_engineering import direction_labels
+
+logger = logging.getLogger(__name__)
+
+# Log configuration
+PREDICTION_LOG_DIR = os.getenv('PREDICTION_LOG_DIR', './data/predictions')
+
+# Column name -> (dtype, per-row shape)
+LOG_COLUMNS = {
+    'issued_at': (np.dtype('<i8'), ()),
+    'horizon': (np.dtype('<i2'), ()),
+    'model_version': (np.dtype('<i8'), ()),
+    'price': (np.dtype('<f8'), ()),
+    'probabilities': (np.dtype('<f4'), (3,))
+}
+
+# Accuracy windows in days (by resolution time) and minimum resolved
+# predictions before a window's accuracy is reported
+ACCURACY_WINDOWS = [30, 90]
+MIN_RESOLVED_PREDICTIONS = 20
+
+# Log history read per resolve: longest window plus the longest served horizon (30d)
+LOOKBACK_DAYS = max(ACCURACY_WINDOWS) + 31
+
+
+class PredictionLog:
+    """
+    Append-only columnar log of served predictions partitioned by symbol and month
+
+    append() only buffers; flush() writes all buffered rows with one write
+    per column file and partition.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the log
+
+        Args:
+            root: Root directory of the log (default: PREDICTION_LOG_DIR)
+        """
+        self.root = root or PREDICTION_LOG_DIR
+        self.writer = _new_writer_id()
+        self._pending: List[Tuple] = []
+        self._lock = threading.Lock()
+
+    def append(
+        self,
+        symbol: str,
+        horizon: int,
+        probabilities: np.ndarray,
+        price: float,
+        model_version: int,
+        issued_at: Optional[datetime] = None
+    ):
+        """Buffer one served prediction (issued_at in UTC, default: now)"""
+        issued_at = pd.Timestamp(issued_at or datetime.utcnow())
+        row = (symbol, issued_at.value, horizon, model_version, price, np.asarray(probabilities, dtype=np.float32))
+        with self._lock:
+            self._pending.append(row)
+
+    def pending(self) -> int:
+        """Number of buffered rows not yet flushed"""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write buffered rows to their partitions
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            rows, self._pending = self._pending, []
+
+        if not rows:
+            return 0
+
+        symbols = np.array([row[0] for row in rows])
+        issued_at = np.array([row[1] for row in rows], dtype=np.int64)
+        months = issued_at.astype('datetime64[ns]').astype('datetime64[M]').astype(str)
+        columns = {
+            'issued_at': issued_at,
+            'horizon': np.array([row[2] for row in rows]),
+            'model_version': np.array([row[3] for row in rows]),
+            'price': np.array([row[4] for row in rows]),
+            'probabilities': np.stack([row[5] for row in rows])
+        }
+
+        partitions = np.char.add(np.char.add(symbols, '/'), months)
+        for partition in np.unique(partitions):
+            mask = partitions == partition
+            segment_dir = os.path.join(self.root, partition, self.writer)
+            os.makedirs(segment_dir, exist_ok=True)
+
+            try:
+                for name, (dtype, _) in LOG_COLUMNS.items():
+                    with open(os.path.join(segment_dir, f"{name}.bin"), 'ab') as f:
+                        f.write(np.ascontiguousarray(columns[name][mask], dtype=dtype).tobytes())
+            except OSError:
+                # Columns of this segment may now differ in length; never append to it again
+                self.writer = _new_writer_id()
+                raise
+
+        return len(rows)
+
+    def read(self, symbol: str, since: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+        """
+        Logged predictions of a symbol, oldest partition first
+
+        Args:
+            symbol: Asset symbol
+            since: Skip month partitions that end before this time
+
+        Returns:
+            Dict of column arrays (probabilities has shape (rows, 3))
+        """
+        blocks = {name: [] for name in LOG_COLUMNS}
+        symbol_dir = os.path.join(self.root, symbol)
+        first_month = pd.Timestamp(since).strftime('%Y-%m') if since is not None else ''
+
+        months = sorted(os.listdir(symbol_dir)) if os.path.isdir(symbol_dir) else []
+        for month in months:
+            if month < first_month:
+                continue
+            month_dir = os.path.join(symbol_dir, month)
+            for writer in sorted(os.listdir(month_dir)):
+                for name, block in _read_segment(os.path.join(month_dir, writer)).items():
+                    blocks[name].append(block)
+
+        return {
+            name: np.concatenate(blocks[name]) if blocks[name] else np.zeros((0,) + shape, dtype=dtype)
+            for name, (dtype, shape) in LOG_COLUMNS.items()
+        }
+
+
+class AccuracyTracker:
+    """
+    Rolling live accuracy per (symbol, timeframe, model version)
+
+    Predictions are recorded into a PredictionLog; resolve() joins the
+    recent log against realised prices in one vectorized pass per symbol and
+    swaps in fresh statistics.
+    """
+
+    def __init__(
+        self,
+        log: Optional[PredictionLog] = None,
+        threshold: float = 2.0,
+        windows: Sequence[int] = ACCURACY_WINDOWS,
+        min_predictions: int = MIN_RESOLVED_PREDICTIONS
+    ):
+        """
+        Initialize the tracker
+
+        Args:
+            log: Prediction log (default: PredictionLog at PREDICTION_LOG_DIR)
+            threshold: Percent move separating bullish/bearish from neutral (as in training)
+            windows: Accuracy windows in days
+            min_predictions: Resolved predictions needed before a window is reported
+        """
+        self.log = log or PredictionLog()
+        self.threshold = threshold
+        self.windows = list(windows)
+        self.min_predictions = min_predictions
+        self._stats: Dict[Tuple[str, str, int], Dict] = {}
+
+    def record(
+        self,
+        symbol: str,
+        timeframe: str,
+        probabilities: np.ndarray,
+        price: float,
+        model_version: Optional[int],
+        issued_at: Optional[datetime] = None
+    ):
+        """Log one served prediction for later scoring"""
+        horizon = int(timeframe.replace('d', ''))
+        self.log.append(symbol, horizon, probabilities, price, model_version or 0, issued_at)
+
+    def flush(self) -> int:
+        """Write buffered predictions to the log"""
+        return self.log.flush()
+
+    def resolve(self, price_histories: Dict[str, pd.DataFrame], now: Optional[datetime] = None) -> Dict:
+        """
+        Score matured predictions against realised prices
+
+        A prediction matures at the first candle at or after issue time plus
+        its horizon; its label is the direction of the move from the price at
+        issue to that candle's price. Windows count predictions that matured
+        within the last N days.
+
+        Args:
+            price_histories: Symbol -> DataFrame indexed by candle time with a 'price' column
+            now: Reference time for the windows (default: now, UTC)
+
+        Returns:
+            Summary dict with 'symbols', 'resolved' and 'resolved_at'
+        """
+        now = pd.Timestamp(now or datetime.utcnow())
+        since = now - timedelta(days=LOOKBACK_DAYS)
+        stats = {key: value for key, value in self._stats.items() if key[0] not in price_histories}
+        resolved = 0
+
+        for symbol, df in price_histories.items():
+            rows = self.log.read(symbol, since=since)
+            if len(rows['issued_at']) == 0 or df.empty:
+                continue
+
+            candle_times = df.index.values.astype('datetime64[ns]').astype(np.int64)
+            prices = df['price'].values.astype(np.float64)
+
+            target = rows['issued_at'] + rows['horizon'].astype(np.int64) * 86_400_000_000_000
+            candle = np.searchsorted(candle_times, target, side='left')
+            matured = candle < len(candle_times)
+            if not matured.any():
+                continue
+
+            candle = candle[matured]
+            price = rows['price'][matured]
+            pct_change = (prices[candle] - price) / price * 100
+            correct = rows['probabilities'][matured].argmax(axis=1) == direction_labels(pct_change, self.threshold)
+            age = now.value - candle_times[candle]
+
+            keys = np.stack([rows['horizon'][matured].astype(np.int64), rows['model_version'][matured]], axis=1)
+            groups, group_ids = np.unique(keys, axis=0, return_inverse=True)
+            group_ids = group_ids.ravel()
+
+            window_counts = {}
+            for window in self.windows:
+                in_window = age <= window * 86_400_000_000_000
+                window_counts[window] = (
+                    np.bincount(group_ids, weights=in_window, minlength=len(groups)),
+                    np.bincount(group_ids, weights=in_window & correct, minlength=len(groups))
+                )
+
+            for g, (horizon, version) in enumerate(groups):
+                entry = {}
+                for window, (counts, hits) in window_counts.items():
+                    entry[f"resolved_{window}d"] = int(counts[g])
+                    entry[f"accuracy_{window}d"] = float(hits[g] / counts[g]) if counts[g] else None
+                stats[(symbol, f"{horizon}d", int(version))] = entry
+
+            resolved += int(matured.sum())
+
+        self._stats = stats
+
+        return {
+            'symbols': len(price_histories),
+            'resolved': resolved,
+            'resolved_at': now.isoformat()
+        }
+
+    def stats(self, symbol: str, timeframe: str, model_version: Optional[int]) -> Optional[Dict]:
+        """Raw window counts and accuracies of one symbol/timeframe/model version"""
+        return self._stats.get((symbol, timeframe, model_version or 0))
+
+    def accuracy(self, symbol: str, timeframe: str, model_version: Optional[int]) -> Optional[Dict[str, float]]:
+        """
+        last30Days / last90Days live accuracy of a symbol, timeframe and model version
+
+        Returns:
+            Dict for PredictionResponse.historical_accuracy, or None until the
+            shortest window has MIN_RESOLVED_PREDICTIONS resolved predictions
+        """
+        entry = self.stats(symbol, timeframe, model_version)
+        shortest, longest = min(self.windows), max(self.windows)
+        if not entry or entry[f"resolved_{shortest}d"] < self.min_predictions:
+            return None
+
+        return {
+            'last30Days': round(entry[f"accuracy_{shortest}d"], 3),
+            'last90Days': round(entry[f"accuracy_{longest}d"], 3)
+        }
+
+
+def _new_writer_id() -> str:
+    """Segment name unique to this process start"""
+    return f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+
+def _read_segment(segment_dir: str) -> Dict[str, np.ndarray]:
+    """Read one writer segment, trimming columns to the rows complete in every file"""
+    columns = {}
+    for name, (dtype, shape) in LOG_COLUMNS.items():
+        path = os.path.join(segment_dir, f"{name}.bin")
+        data = np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.zeros(0, dtype=dtype)
+        width = int(np.prod(shape)) if shape else 1
+        columns[name] = data[:len(data) // width * width].reshape((-1,) + shape)
+
+    rows = min(len(column) for column in columns.values())
+    return {name: column[:rows] for name, column in columns.items()}
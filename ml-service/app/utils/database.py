@@ -12,6 +12,9 @@ from dotenv import load_dotenv
 import logging
 from datetime import datetime, timedelta
 
+from app.utils.metrics import DB_ERRORS
+from app.utils.tracing import span
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -83,6 +86,7 @@ async def get_price_data(symbol: str, days: int = 90) -> np.ndarray:
         return np.array([float(p) for p in prices])
 
     except Exception as e:
+        DB_ERRORS.inc(operation='price_data')
         logger.error(f"Error fetching price data for {symbol}: {str(e)}")
         # Return mock data on error
         return generate_mock_price_data(days)
@@ -124,8 +128,9 @@ async def fetch_price_history(symbol: str, days: int = 90) -> pd.DataFrame:
             ORDER BY pd.time ASC
         """)
 
-        result = session.execute(query, {'symbol': symbol, 'days': days})
-        rows = result.fetchall()
+        with span('db_query'):
+            result = session.execute(query, {'symbol': symbol, 'days': days})
+            rows = result.fetchall()
 
         session.close()
 
@@ -133,22 +138,175 @@ async def fetch_price_history(symbol: str, days: int = 90) -> pd.DataFrame:
             logger.warning(f"No price data found for {symbol}, generating mock data")
             return generate_mock_price_dataframe(days, symbol)
 
-        df = pd.DataFrame(rows, columns=['time', 'price', 'volume_24h', 'market_cap', 'change_1h', 'change_24h', 'high', 'low'])
-        df['time'] = pd.to_datetime(df['time'])
-        df.set_index('time', inplace=True)
+        with span('db_to_frame'):
+            df = pd.DataFrame(rows, columns=['time', 'price', 'volume_24h', 'market_cap', 'change_1h', 'change_24h', 'high', 'low'])
+            df['time'] = pd.to_datetime(df['time'])
+            df.set_index('time', inplace=True)
 
-        # Convert to numeric
-        for col in ['price', 'volume_24h', 'market_cap', 'change_1h', 'change_24h', 'high', 'low']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            # Convert to numeric
+            for col in ['price', 'volume_24h', 'market_cap', 'change_1h', 'change_24h', 'high', 'low']:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
 
         return df
 
     except Exception as e:
+        DB_ERRORS.inc(operation='price_history')
         logger.error(f"Error fetching price history for {symbol}: {str(e)}")
         # Return mock data on error
         return generate_mock_price_dataframe(days, symbol)
 
 
+def query_price_histories(symbols: List[str], days: int = 90) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical price data for many symbols in one query (blocking)
+
+    Unlike load_price_histories there is no mock fallback: symbols without
+    rows are left out and query errors are raised to the caller.
+
+    Args:
+        symbols: Cryptocurrency symbols
+        days: Number of days of historical data
+
+    Returns:
+        Dictionary mapping symbol to a DataFrame shaped like fetch_price_history
+        (only symbols that have rows)
+    """
+    columns = ['price', 'volume_24h', 'market_cap', 'change_1h', 'change_24h', 'high', 'low']
+    histories = {}
+
+    session = get_db_session()
+
+    query = text("""
+        SELECT
+            t.symbol,
+            pd.time,
+            pd.close as price,
+            pd.volume as volume_24h,
+            t.market_cap as market_cap,
+            0 as change_1h,
+            COALESCE(
+                ((pd.close - LAG(pd.close, 1) OVER (PARTITION BY t.symbol ORDER BY pd.time)) /
+                 LAG(pd.close, 1) OVER (PARTITION BY t.symbol ORDER BY pd.time)) * 100,
+                0
+            ) as change_24h,
+            pd.high,
+            pd.low
+        FROM price_data pd
+        JOIN tokens t ON pd.token_id = t.id
+        WHERE t.symbol = ANY(:symbols)
+        AND pd.time >= NOW() - INTERVAL '1 day' * :days
+        ORDER BY t.symbol, pd.time ASC
+    """)
+
+    try:
+        with span('db_query'):
+            result = session.execute(query, {'symbols': list(symbols), 'days': days})
+            rows = result.fetchall()
+    finally:
+        session.close()
+
+    if rows:
+        df = pd.DataFrame(rows, columns=['symbol', 'time'] + columns)
+        df['time'] = pd.to_datetime(df['time'])
+        for col in columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+        for symbol, group in df.groupby('symbol', sort=False):
+            histories[symbol] = group.drop(columns='symbol').set_index('time')
+
+    return histories
+
+
+def load_price_histories(symbols: List[str], days: int = 90) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical price data for many symbols in one query (blocking)
+
+    Args:
+        symbols: Cryptocurrency symbols
+        days: Number of days of historical data
+
+    Returns:
+        Dictionary mapping symbol to a DataFrame shaped like fetch_price_history
+    """
+    histories = {}
+
+    try:
+        histories = query_price_histories(symbols, days)
+    except Exception as e:
+        DB_ERRORS.inc(operation='price_histories')
+        logger.error(f"Error fetching price histories for {len(symbols)} symbols: {str(e)}")
+
+    # Mock data for symbols without rows (development)
+    for symbol in symbols:
+        if symbol not in histories:
+            logger.warning(f"No price data found for {symbol}, generating mock data")
+            histories[symbol] = generate_mock_price_dataframe(days, symbol)
+
+    return {symbol: histories[symbol] for symbol in symbols}
+
+
+async def fetch_price_histories(symbols: List[str], days: int = 90) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical price data for many symbols in one query
+
+    Args:
+        symbols: Cryptocurrency symbols
+        days: Number of days of historical data
+
+    Returns:
+        Dictionary mapping symbol to a DataFrame shaped like fetch_price_history
+    """
+    return load_price_histories(symbols, days)
+
+
+def load_token_symbols() -> List[str]:
+    """
+    Get all symbols from the tokens table (blocking)
+
+    Returns:
+        List of symbols (empty if the database is unavailable)
+    """
+    try:
+        session = get_db_session()
+
+        result = session.execute(text("SELECT symbol FROM tokens ORDER BY symbol"))
+        symbols = [row[0].upper() for row in result if row[0]]
+
+        session.close()
+
+        return symbols
+
+    except Exception as e:
+        DB_ERRORS.inc(operation='token_symbols')
+        logger.error(f"Error fetching token symbols: {str(e)}")
+        return []
+
+
+def load_latest_candle_time() -> Optional[datetime]:
+    """
+    Get the time of the newest row in price_data (blocking)
+
+    Used as an ingestion watermark: it changes whenever new candles arrive.
+
+    Returns:
+        Latest candle time or None if unavailable
+    """
+    try:
+        session = get_db_session()
+
+        result = session.execute(text("SELECT MAX(time) FROM price_data"))
+        row = result.fetchone()
+
+        session.close()
+
+        return row[0] if row else None
+
+    except Exception as e:
+        DB_ERRORS.inc(operation='latest_candle_time')
+        logger.error(f"Error fetching latest candle time: {str(e)}")
+        return None
+
+
 async def get_latest_price(symbol: str) -> Optional[float]:
     """
     Get the latest price for a symbol
@@ -181,6 +339,7 @@ async def get_latest_price(symbol: str) -> Optional[float]:
         return get_mock_current_price(symbol)
 
     except Exception as e:
+        DB_ERRORS.inc(operation='latest_price')
         logger.error(f"Error fetching latest price for {symbol}: {str(e)}")
         return get_mock_current_price(symbol)
 
@@ -357,6 +516,7 @@ async def save_prediction(prediction_data: dict):
         logger.info(f"Saved prediction for {prediction_data['symbol']}")
 
     except Exception as e:
+        DB_ERRORS.inc(operation='save_prediction')
         logger.error(f"Error saving prediction: {str(e)}")
         if session:
             session.rollback()
@@ -11,9 +11,13 @@ Features:
 
 import numpy as np
 import pandas as pd
-from typing import Optional, Dict
+from typing import Optional, Dict, Sequence, Tuple, Union
 import warnings
 
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.utils.tracing import span
+
 warnings.filterwarnings('ignore')
 
 
@@ -161,28 +165,29 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
 
     # ========== Technical Indicators (8) ==========
 
-    # 6. RSI (14-day)
-    features['rsi'] = calculate_rsi(df['price'], period=14)
+    with span('feature_indicators'):
+        # 6. RSI (14-day)
+        features['rsi'] = calculate_rsi(df['price'], period=14)
 
-    # 7-8. MACD and Signal
-    macd, macd_signal, macd_hist = calculate_macd(df['price'])
-    features['macd'] = macd
-    features['macd_signal'] = macd_signal
+        # 7-8. MACD and Signal
+        macd, macd_signal, macd_hist = calculate_macd(df['price'])
+        features['macd'] = macd
+        features['macd_signal'] = macd_signal
 
-    # 9-10. Bollinger Bands (Upper and Lower)
-    bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(df['price'], period=20)
-    features['bb_upper'] = bb_upper
-    features['bb_lower'] = bb_lower
+        # 9-10. Bollinger Bands (Upper and Lower)
+        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(df['price'], period=20)
+        features['bb_upper'] = bb_upper
+        features['bb_lower'] = bb_lower
 
-    # 11-12. EMAs (20-day and 50-day)
-    features['ema_20'] = calculate_ema(df['price'], period=20)
-    features['ema_50'] = calculate_ema(df['price'], period=50)
+        # 11-12. EMAs (20-day and 50-day)
+        features['ema_20'] = calculate_ema(df['price'], period=20)
+        features['ema_50'] = calculate_ema(df['price'], period=50)
 
-    # 13. Volume MA (20-day)
-    if 'volume' in df.columns:
-        features['volume_ma'] = calculate_sma(df['volume'], period=20)
-    else:
-        features['volume_ma'] = 0  # Placeholder if volume not available
+        # 13. Volume MA (20-day)
+        if 'volume' in df.columns:
+            features['volume_ma'] = calculate_sma(df['volume'], period=20)
+        else:
+            features['volume_ma'] = 0  # Placeholder if volume not available
 
     # ========== Volume & Market Data (4) ==========
 
@@ -224,7 +229,8 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     features['sentiment_neg'] = 50.0  # Placeholder
 
     # Drop NaN rows (first ~50 rows due to moving averages)
-    features = features.dropna()
+    with span('feature_dropna'):
+        features = features.dropna()
 
     return features
 
@@ -248,23 +254,91 @@ def create_labels(df: pd.DataFrame, horizon: int = 7, threshold: float = 2.0) ->
     """
     price_col = 'close' if 'close' in df.columns else 'price'
 
-    # Calculate future price (shifted backwards)
-    future_price = df[price_col].shift(-horizon)
-    current_price = df[price_col]
+    # Rows with a future price only (last 'horizon' rows have no label)
+    pct_change = forward_returns(df[price_col].to_numpy(dtype=np.float64), horizon)
+    labels = direction_labels(pct_change, threshold)
 
-    # Calculate percentage change
-    pct_change = (future_price - current_price) / current_price * 100
+    # Undefined returns stay NaN
+    return pd.Series(np.where(np.isnan(pct_change), np.nan, labels), index=df.index[:-horizon])
 
-    # Create labels
-    labels = pd.Series(index=df.index, dtype=int)
-    labels[pct_change < -threshold] = 0  # Bearish
-    labels[(pct_change >= -threshold) & (pct_change <= threshold)] = 1  # Neutral
-    labels[pct_change > threshold] = 2  # Bullish
 
-    # Drop last 'horizon' rows (no future data)
-    labels = labels[:-horizon]
+def forward_returns(prices: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Percentage change from each price to the price `horizon` steps later
+
+    Returns:
+        Array of length len(prices) - horizon
+    """
+    return (prices[horizon:] - prices[:-horizon]) / prices[:-horizon] * 100
+
+
+def direction_labels(pct_change: np.ndarray, threshold: float = 2.0) -> np.ndarray:
+    """
+    Map percentage changes to 0 (bearish, < -threshold), 1 (neutral,
+    within ±threshold inclusive) or 2 (bullish, > threshold)
+
+    NaN changes map to 0; callers mask them.
+    """
+    return (pct_change >= -threshold).astype(np.int64) + (pct_change > threshold)
+
+
+def build_dataset(
+    df: pd.DataFrame,
+    horizon: Union[int, Sequence[int]] = 7,
+    threshold: float = 2.0,
+    sequence_length: int = 90,
+    dtype=np.float32
+) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """
+    Build model inputs and labels in one vectorized pass
+
+    Equivalent to create_labels + create_sequences: sample i is the window
+    of rows [i, i + sequence_length) and its label is the direction of the
+    row right after the window. Windows come from a strided view of one
+    contiguous feature array and labels from a single comparison pass.
+
+    Args:
+        df: Engineered features (with 'close' or 'price')
+        horizon: Days ahead to label, or several horizons at once
+        threshold: Percentage threshold for neutral zone
+        sequence_length: Number of timesteps in each sequence
+        dtype: Dtype of X
+
+    Returns:
+        Tuple of (X, y, index) where:
+        - X: array of shape (num_samples, sequence_length, num_features)
+        - y: int64 array of shape (num_samples,), or (num_samples, num_horizons)
+          when `horizon` is a sequence
+        - index: time of the labelled row of each sample
+        Samples whose label would need a missing or undefined future price
+        are dropped (for several horizons: the longest one decides).
+    """
+    horizons = [horizon] if np.isscalar(horizon) else list(horizon)
+    price_col = 'close' if 'close' in df.columns else 'price'
+
+    values = np.ascontiguousarray(df.to_numpy(dtype=dtype))
+    prices = df[price_col].to_numpy(dtype=np.float64)
+
+    # Labelled rows: sequence_length .. len - max(horizon) - 1
+    num_samples = max(len(df) - max(horizons) - sequence_length, 0)
+    label_rows = np.arange(sequence_length, sequence_length + num_samples)
+
+    y = np.empty((num_samples, len(horizons)), dtype=np.int64)
+    valid = np.ones(num_samples, dtype=bool)
+    for j, h in enumerate(horizons):
+        pct_change = forward_returns(prices, h)[label_rows]
+        y[:, j] = direction_labels(pct_change, threshold)
+        valid &= ~np.isnan(pct_change)
+
+    # (num_windows, num_features, sequence_length) view -> (num_samples, sequence_length, num_features)
+    windows = sliding_window_view(values, sequence_length, axis=0)[:num_samples]
+    X = np.ascontiguousarray(windows.transpose(0, 2, 1)[valid])
+
+    y = y[valid]
+    if np.isscalar(horizon):
+        y = y[:, 0]
 
-    return labels
+    return X, y, df.index[label_rows[valid]]
 
 
 def create_sequences(
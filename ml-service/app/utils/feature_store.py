@@ -0,0 +1,316 @@
+"""
+Local Columnar Store for OHLCV and Engineered Features
+Keeps training inputs on disk so retrains don't start from scratch
+
+Layout (one directory per partition, one .npy file per column block):
+    {root}/ohlcv/{symbol}/{year}/index.npy      int64 nanosecond timestamps
+    {root}/ohlcv/{symbol}/{year}/values.npy     float64 (rows, columns)
+    {root}/ohlcv/{symbol}/{year}/columns.json   column names
+    {root}/features/{symbol}/{content_hash}/... same three files
+
+Partitions are plain NumPy arrays so reads are memory-mapped straight into
+NumPy (np.load(mmap_mode='r')) without any extra dependency. Feature matrices
+are keyed by a content hash of the raw OHLCV input, so unchanged inputs skip
+feature engineering entirely.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Store configuration
+FEATURE_STORE_DIR = os.getenv('FEATURE_STORE_DIR', './data/store')
+
+# Bump when engineer_features() changes so cached matrices are rebuilt
+FEATURE_PIPELINE_VERSION = 'v1'
+
+# Raw OHLCV columns kept in the store (missing columns are skipped)
+OHLCV_COLUMNS = ['open', 'high', 'low', 'price', 'volume', 'market_cap', 'change_1h', 'change_24h']
+
+
+class FeatureStore:
+    """
+    On-disk columnar store partitioned by symbol and date (year)
+
+    Supports incremental appends of raw OHLCV data, memory-mapped reads and
+    content-hash keyed caching of engineered feature matrices.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the store
+
+        Args:
+            root: Root directory of the store (default: FEATURE_STORE_DIR)
+        """
+        self.root = root or FEATURE_STORE_DIR
+
+    # ------------------------------------------------------------------
+    # Raw OHLCV
+    # ------------------------------------------------------------------
+
+    def append_ohlcv(self, symbol: str, df: pd.DataFrame) -> int:
+        """
+        Append OHLCV rows for a symbol
+
+        Rows are merged into their year partitions. Timestamps that already
+        exist are overwritten by the new values, so re-appending an
+        overlapping window is safe.
+
+        Args:
+            symbol: Asset symbol
+            df: DataFrame indexed by timestamp with OHLCV columns
+
+        Returns:
+            Number of rows that were not previously stored
+        """
+        if df.empty:
+            return 0
+
+        df = df.sort_index()
+        columns = [c for c in OHLCV_COLUMNS if c in df.columns]
+        new_rows = 0
+
+        for year, part in df.groupby(df.index.year):
+            partition_dir = os.path.join(self.root, 'ohlcv', symbol, str(year))
+            index = _to_ns(part.index)
+            values = part[columns].to_numpy(dtype=np.float64)
+
+            if os.path.exists(os.path.join(partition_dir, 'index.npy')):
+                old_index, old_values, old_columns = _read_partition(partition_dir, mmap=False)
+
+                if old_columns != columns:
+                    # Align stored columns with the incoming schema
+                    old_frame = pd.DataFrame(old_values, columns=old_columns)
+                    old_values = old_frame.reindex(columns=columns).to_numpy(dtype=np.float64)
+
+                keep = ~np.isin(old_index, index)
+                new_rows += int(len(index) - (len(old_index) - keep.sum()))
+
+                index = np.concatenate([old_index[keep], index])
+                values = np.concatenate([old_values[keep], values])
+                order = np.argsort(index, kind='stable')
+                index, values = index[order], values[order]
+            else:
+                new_rows += len(index)
+
+            _write_partition(partition_dir, index, values, columns)
+
+        logger.info(f"Stored {new_rows} new OHLCV rows for {symbol}")
+        return new_rows
+
+    def read_ohlcv_arrays(
+        self,
+        symbol: str,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Read OHLCV data as NumPy arrays
+
+        A single partition is returned as a read-only memory-mapped view;
+        multiple partitions are concatenated.
+
+        Args:
+            symbol: Asset symbol
+            start: Optional inclusive start timestamp
+            end: Optional inclusive end timestamp
+
+        Returns:
+            Tuple of (index_ns, values, columns)
+        """
+        symbol_dir = os.path.join(self.root, 'ohlcv', symbol)
+        if not os.path.isdir(symbol_dir):
+            return np.empty(0, dtype=np.int64), np.empty((0, 0)), []
+
+        years = sorted(int(y) for y in os.listdir(symbol_dir) if y.isdigit())
+        if start is not None:
+            years = [y for y in years if y >= pd.Timestamp(start).year]
+        if end is not None:
+            years = [y for y in years if y <= pd.Timestamp(end).year]
+
+        indexes, blocks, columns = [], [], []
+        for year in years:
+            index, values, part_columns = _read_partition(os.path.join(symbol_dir, str(year)))
+            if columns and part_columns != columns:
+                values = pd.DataFrame(values, columns=part_columns).reindex(columns=columns).to_numpy()
+            columns = columns or part_columns
+            indexes.append(index)
+            blocks.append(values)
+
+        if not indexes:
+            return np.empty(0, dtype=np.int64), np.empty((0, 0)), []
+
+        if len(indexes) == 1:
+            index, values = indexes[0], blocks[0]
+        else:
+            index, values = np.concatenate(indexes), np.concatenate(blocks)
+
+        lo = 0 if start is None else np.searchsorted(index, _to_ns(pd.DatetimeIndex([start]))[0], side='left')
+        hi = len(index) if end is None else np.searchsorted(index, _to_ns(pd.DatetimeIndex([end]))[0], side='right')
+
+        return index[lo:hi], values[lo:hi], columns
+
+    def read_ohlcv(
+        self,
+        symbol: str,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        """
+        Read OHLCV data as a DataFrame indexed by timestamp
+
+        Args:
+            symbol: Asset symbol
+            start: Optional inclusive start timestamp
+            end: Optional inclusive end timestamp
+
+        Returns:
+            DataFrame with the stored OHLCV columns (empty if nothing stored)
+        """
+        index, values, columns = self.read_ohlcv_arrays(symbol, start, end)
+        df = pd.DataFrame(np.asarray(values), index=pd.to_datetime(index), columns=columns)
+        df.index.name = 'timestamp'
+        return df
+
+    def last_timestamp(self, symbol: str) -> Optional[pd.Timestamp]:
+        """
+        Get the most recent stored timestamp for a symbol
+
+        Returns:
+            Latest timestamp or None if nothing is stored
+        """
+        symbol_dir = os.path.join(self.root, 'ohlcv', symbol)
+        if not os.path.isdir(symbol_dir):
+            return None
+
+        years = sorted(int(y) for y in os.listdir(symbol_dir) if y.isdigit())
+        for year in reversed(years):
+            index = np.load(os.path.join(symbol_dir, str(year), 'index.npy'), mmap_mode='r')
+            if len(index):
+                return pd.Timestamp(int(index[-1]))
+
+        return None
+
+    # ------------------------------------------------------------------
+    # Engineered features
+    # ------------------------------------------------------------------
+
+    def get_or_build_features(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        build_fn: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ) -> pd.DataFrame:
+        """
+        Return the engineered feature matrix for df, building it only if needed
+
+        The cache key is a content hash of the raw input, so identical inputs
+        are served from disk (memory-mapped) without running feature
+        engineering again.
+
+        Args:
+            symbol: Asset symbol
+            df: Raw OHLCV DataFrame
+            build_fn: Feature engineering function (default: engineer_features)
+
+        Returns:
+            Engineered features DataFrame
+        """
+        if build_fn is None:
+            from app.utils.feature_engineering import engineer_features
+            build_fn = engineer_features
+
+        key = content_hash(df)
+        partition_dir = os.path.join(self.root, 'features', symbol, key)
+
+        if os.path.exists(os.path.join(partition_dir, 'index.npy')):
+            index, values, columns = _read_partition(partition_dir)
+            logger.info(f"Feature cache hit for {symbol} ({key[:12]})")
+            return pd.DataFrame(values, index=pd.to_datetime(index), columns=columns)
+
+        logger.info(f"Feature cache miss for {symbol} ({key[:12]}), engineering features")
+        features = build_fn(df)
+
+        # Only the latest matrix per symbol is useful; drop stale ones
+        symbol_dir = os.path.join(self.root, 'features', symbol)
+        if os.path.isdir(symbol_dir):
+            for stale in os.listdir(symbol_dir):
+                shutil.rmtree(os.path.join(symbol_dir, stale), ignore_errors=True)
+
+        _write_partition(
+            partition_dir,
+            _to_ns(features.index),
+            features.to_numpy(dtype=np.float64),
+            features.columns.tolist()
+        )
+
+        return features
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """
+    Compute a stable content hash for a raw OHLCV DataFrame
+
+    Covers the index, column names, values and FEATURE_PIPELINE_VERSION.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    digest.update(FEATURE_PIPELINE_VERSION.encode())
+    digest.update(json.dumps([str(c) for c in df.columns]).encode())
+    digest.update(np.ascontiguousarray(_to_ns(df.index)).tobytes())
+    digest.update(np.ascontiguousarray(df.to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+def _to_ns(index: pd.Index) -> np.ndarray:
+    """Convert a datetime-like index to int64 nanoseconds"""
+    return pd.DatetimeIndex(index).as_unit('ns').asi8.astype(np.int64)
+
+
+def _read_partition(partition_dir: str, mmap: bool = True) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Read a partition's index, values and column names"""
+    mmap_mode = 'r' if mmap else None
+    index = np.load(os.path.join(partition_dir, 'index.npy'), mmap_mode=mmap_mode)
+    values = np.load(os.path.join(partition_dir, 'values.npy'), mmap_mode=mmap_mode)
+
+    with open(os.path.join(partition_dir, 'columns.json')) as f:
+        columns = json.load(f)
+
+    return index, values, columns
+
+
+def _write_partition(partition_dir: str, index: np.ndarray, values: np.ndarray, columns: List[str]):
+    """Write a partition atomically (write to a temp dir, then rename)"""
+    parent = os.path.dirname(partition_dir)
+    os.makedirs(parent, exist_ok=True)
+
+    tmp_dir = f"{partition_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    np.save(os.path.join(tmp_dir, 'index.npy'), np.ascontiguousarray(index, dtype=np.int64))
+    np.save(os.path.join(tmp_dir, 'values.npy'), np.ascontiguousarray(values, dtype=np.float64))
+    with open(os.path.join(tmp_dir, 'columns.json'), 'w') as f:
+        json.dump(columns, f)
+
+    if os.path.exists(partition_dir):
+        old_dir = f"{partition_dir}.old-{os.getpid()}"
+        os.rename(partition_dir, old_dir)
+        os.rename(tmp_dir, partition_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+    else:
+        os.rename(tmp_dir, partition_dir)
@@ -0,0 +1,375 @@
+"""
+Service Metrics
+Minimal Prometheus-compatible counters, gauges and histograms
+
+Metrics live in a process-local registry and are rendered in the Prometheus
+text exposition format (version 0.0.4) at /metrics. Recording is a dict
+lookup plus an add under a lock, so it is cheap enough for every request.
+"""
+
+import time
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.routing import Match
+
+from app.utils.tracing import record_span
+
+# Latency buckets in seconds (sub-millisecond cache hits up to slow DB fetches)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Endpoint (route path) of the request being served, set by the HTTP middleware
+current_endpoint: ContextVar[str] = ContextVar('current_endpoint', default='background')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric(ABC):
+    """Base class: a named metric family with fixed label names"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Sample lines of every label set, in exposition format"""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing counter"""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or is read from a callback at scrape time"""
+
+    metric_type = 'gauge'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        function: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None
+    ):
+        """
+        Args:
+            function: Optional callback returning {label values tuple: value},
+                evaluated on every scrape instead of stored values
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._function = function
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self) -> List[str]:
+        if self._function is not None:
+            items = list(self._function().items())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Histogram(Metric):
+    """Bucketed distribution of observed values (e.g. latencies)"""
+
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(series[0]), series[1]) for key, series in self._series.items()]
+
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), function=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, function))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition of every registered metric"""
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+
+# ============================================================================
+# Service metrics
+# ============================================================================
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'ml_http_request_duration_seconds',
+    'HTTP request latency by route and status',
+    ('endpoint', 'method', 'status')
+)
+HTTP_IN_FLIGHT = registry.gauge(
+    'ml_http_requests_in_flight',
+    'HTTP requests currently being served'
+)
+STAGE_SECONDS = registry.histogram(
+    'ml_stage_duration_seconds',
+    'Latency of request stages (cache_lookup, db_fetch, feature_engineering, normalization, forward, response_build)',
+    ('endpoint', 'stage')
+)
+CACHE_REQUESTS = registry.counter(
+    'ml_cache_requests_total',
+    'Cache lookups by cache and result (hit/miss)',
+    ('cache', 'result')
+)
+MODEL_LOAD_SECONDS = registry.histogram(
+    'ml_model_load_seconds',
+    'Time to build a model from its checkpoint',
+    ('symbol',),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+REDIS_ERRORS = registry.counter(
+    'ml_redis_errors_total',
+    'Redis operation errors',
+    ('operation',)
+)
+DB_ERRORS = registry.counter(
+    'ml_db_errors_total',
+    'Database query errors',
+    ('operation',)
+)
+
+
+def _cache_hit_ratios() -> Dict[Tuple[str, ...], float]:
+    with CACHE_REQUESTS._lock:
+        caches = {key[0] for key in CACHE_REQUESTS._values}
+    ratios = {}
+    for cache in caches:
+        hits = CACHE_REQUESTS.value(cache=cache, result='hit')
+        total = hits + CACHE_REQUESTS.value(cache=cache, result='miss')
+        ratios[(cache,)] = hits / total if total else 0.0
+    return ratios
+
+
+CACHE_HIT_RATIO = registry.gauge(
+    'ml_cache_hit_ratio',
+    'Cache hit ratio since process start',
+    ('cache',),
+    function=_cache_hit_ratios
+)
+
+# Event loop whose default executor (asyncio.to_thread) is reported
+_watched_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def watch_event_loop(loop: asyncio.AbstractEventLoop):
+    """Report the queue depth of this loop's default thread pool executor"""
+    global _watched_loop
+    _watched_loop = loop
+
+
+def _executor_queue_depth() -> Dict[Tuple[str, ...], float]:
+    executor = getattr(_watched_loop, '_default_executor', None)
+    work_queue = getattr(executor, '_work_queue', None)
+    return {(): work_queue.qsize() if work_queue is not None else 0}
+
+
+EXECUTOR_QUEUE_DEPTH = registry.gauge(
+    'ml_executor_queue_depth',
+    'Blocking calls waiting for a worker thread in the default executor',
+    function=_executor_queue_depth
+)
+
+
+@contextmanager
+def time_stage(stage: str):
+    """Record the wall time of a request stage under the current endpoint (and trace span)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, start)
+
+
+def observe_stage(stage: str, started: float):
+    """Record a stage that began at time.perf_counter() value `started`"""
+    seconds = time.perf_counter() - started
+    STAGE_SECONDS.observe(seconds, endpoint=current_endpoint.get(), stage=stage)
+    record_span(stage, seconds)
+
+
+def record_cache(cache: str, hit: bool):
+    """Count a cache lookup"""
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def route_template(scope) -> str:
+    """Route path template of a request (e.g. /models/{symbol}), bounded label cardinality"""
+    app = scope.get('app')
+    for route in getattr(app, 'routes', ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, 'path', scope['path'])
+    return 'unmatched'
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency and the current endpoint
+
+    Plain ASGI (not BaseHTTPMiddleware) so the per-request cost stays at a
+    route match and two perf_counter calls.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        endpoint = route_template(scope)
+        token = current_endpoint.set(endpoint)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                endpoint=endpoint,
+                method=scope['method'],
+                status=str(status_code)
+            )
+            current_endpoint.reset(token)
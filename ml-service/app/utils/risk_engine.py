@@ -0,0 +1,423 @@
+"""
+Vectorized Risk Scoring Engine
+Computes degen risk scores for many symbols at once from (S, T) arrays
+
+Rows are symbols, columns are days (oldest first). Histories shorter than T
+are left-padded with NaN so every factor is computed with NaN-aware
+reductions over the same matrix. The trend slope uses the closed-form
+least-squares solution instead of a per-symbol np.polyfit.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Composite score weights
+RISK_WEIGHTS = {
+    'volatility': 0.4,
+    'priceSwings': 0.3,
+    'volumeVolatility': 0.2,
+    'trendStrength': 0.1,
+}
+
+# Factor value -> 0-100 score multipliers
+SCORE_MULTIPLIERS = {
+    'volatility': 200,
+    'priceSwings': 150,
+    'volumeVolatility': 100,
+    'trendStrength': 500,
+}
+
+VOLATILITY_WINDOW = 30
+SWING_WINDOW = 7
+MIN_HISTORY_DAYS = 30
+RISK_CACHE_HOURS = 2
+
+
+def stack_histories(
+    frames: Dict[str, pd.DataFrame],
+    length: int = 90
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Align per-symbol price histories into (S, T) price and volume matrices
+
+    Args:
+        frames: Symbol -> DataFrame with 'price' and 'volume_24h' columns
+        length: Number of most recent days to keep (T)
+
+    Returns:
+        Tuple of (symbols, prices, volumes); shorter histories are NaN-padded
+        on the left
+    """
+    symbols = list(frames)
+    prices = np.full((len(symbols), length), np.nan)
+    volumes = np.full((len(symbols), length), np.nan)
+
+    for i, symbol in enumerate(symbols):
+        df = frames[symbol].tail(length)
+        n = len(df)
+        if n:
+            prices[i, length - n:] = df['price'].to_numpy(dtype=float)
+            volumes[i, length - n:] = df['volume_24h'].to_numpy(dtype=float)
+
+    return symbols, prices, volumes
+
+
+def history_lengths(prices: np.ndarray) -> np.ndarray:
+    """Number of valid (non-NaN) days per symbol"""
+    return (~np.isnan(prices)).sum(axis=1)
+
+
+def compute_risk_factors(prices: np.ndarray, volumes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute raw risk factors, factor scores and the composite score
+
+    Args:
+        prices: (S, T) daily prices, oldest first, NaN-padded on the left
+        volumes: (S, T) daily volumes aligned with prices
+
+    Returns:
+        Dict of (S,) arrays: factor values, '{factor}_score' and 'risk_score'
+    """
+    prices = np.atleast_2d(np.asarray(prices, dtype=float))
+    volumes = np.atleast_2d(np.asarray(volumes, dtype=float))
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Volatility (30-day coefficient of variation)
+        recent = prices[:, -VOLATILITY_WINDOW:]
+        recent_mean = np.nanmean(recent, axis=1)
+        volatility = np.nanstd(recent, axis=1) / recent_mean
+
+        # Price swings (7-day max swing)
+        week = prices[:, -SWING_WINDOW:]
+        max_swing = (np.nanmax(week, axis=1) - np.nanmin(week, axis=1)) / np.nanmean(week, axis=1)
+
+        # Volume volatility (std of day-over-day relative changes)
+        volume_changes = np.diff(volumes, axis=1) / (volumes[:, :-1] + 1)
+        volume_volatility = np.nanstd(volume_changes, axis=1)
+
+        # Trend strength: closed-form OLS slope over the 30-day window
+        x = np.arange(recent.shape[1], dtype=float)
+        x_centered = x - x.mean()
+        slope = (recent - recent_mean[:, None]) @ x_centered / (x_centered ** 2).sum()
+        trend_slope = np.abs(slope / recent_mean)
+
+    values = {
+        'volatility': volatility,
+        'priceSwings': max_swing,
+        'volumeVolatility': np.nan_to_num(volume_volatility),
+        'trendStrength': trend_slope,
+    }
+
+    factors: Dict[str, np.ndarray] = {}
+    risk_score = np.zeros(prices.shape[0])
+
+    for name, value in values.items():
+        # Truncate toward zero like int(), then cap at 100
+        score = np.minimum(100, np.trunc(np.nan_to_num(value) * SCORE_MULTIPLIERS[name])).astype(int)
+        factors[name] = value
+        factors[f"{name}_score"] = score
+        risk_score += score * RISK_WEIGHTS[name]
+
+    factors['risk_score'] = np.clip(np.trunc(risk_score), 0, 100).astype(int)
+
+    return factors
+
+
+def risk_level(score: int) -> str:
+    """Map a 0-100 risk score to a risk level"""
+    if score < 30:
+        return 'low'
+    elif score < 60:
+        return 'medium'
+    elif score < 80:
+        return 'high'
+    return 'extreme'
+
+
+def factor_risk(score: int) -> str:
+    """Map a 0-100 factor score to a factor risk label"""
+    return 'high' if score > 60 else 'medium' if score > 30 else 'low'
+
+
+def build_risk_breakdowns(
+    symbols: List[str],
+    factors: Dict[str, np.ndarray],
+    analyzed_at: datetime = None
+) -> List[Dict]:
+    """
+    Turn vectorized factor arrays into per-symbol risk score payloads
+
+    Args:
+        symbols: Symbols in row order
+        factors: Output of compute_risk_factors
+        analyzed_at: Analysis timestamp (default: now, UTC)
+
+    Returns:
+        List of dicts shaped like RiskScoreResponse
+    """
+    analyzed_at = analyzed_at or datetime.utcnow()
+    cache_expires_at = analyzed_at + timedelta(hours=RISK_CACHE_HOURS)
+
+    breakdowns = []
+    for i, symbol in enumerate(symbols):
+        score = int(factors['risk_score'][i])
+        volatility = float(factors['volatility'][i])
+        max_swing = float(factors['priceSwings'][i])
+
+        risk_factors = {
+            'volatility': {
+                'value': round(volatility, 4),
+                'score': int(factors['volatility_score'][i]),
+            },
+            'priceSwings': {
+                'value': round(max_swing, 4),
+                'score': int(factors['priceSwings_score'][i]),
+            },
+            'volumeVolatility': {
+                'value': round(float(factors['volumeVolatility'][i]), 4),
+                'score': int(factors['volumeVolatility_score'][i]),
+            },
+            'trendStrength': {
+                'value': round(float(factors['trendStrength'][i]), 6),
+                'score': int(factors['trendStrength_score'][i]),
+            },
+        }
+        for factor in risk_factors.values():
+            factor['risk'] = factor_risk(factor['score'])
+
+        # Generate warnings
+        warnings = []
+        if risk_factors['volatility']['score'] > 70:
+            warnings.append(f"High volatility detected ({volatility * 100:.1f}% daily stddev)")
+        if risk_factors['priceSwings']['score'] > 70:
+            warnings.append(f"Large price swings in last 7 days ({max_swing * 100:.1f}%)")
+        if score > 80:
+            warnings.append("EXTREME RISK: This asset is highly volatile and speculative")
+
+        breakdowns.append({
+            'symbol': symbol,
+            'risk_score': score,
+            'risk_level': risk_level(score),
+            'risk_factors': risk_factors,
+            'warnings': warnings if warnings else ["No major risk warnings"],
+            'analyzed_at': analyzed_at.isoformat() + 'Z',
+            'cache_expires_at': cache_expires_at.isoformat() + 'Z',
+        })
+
+    return breakdowns
+
+
+def score_histories(frames: Dict[str, pd.DataFrame], length: int = 90) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Score many symbols in one vectorized pass
+
+    Args:
+        frames: Symbol -> price history DataFrame
+        length: Days of history to use
+
+    Returns:
+        Tuple of (breakdowns for scorable symbols, {symbol: error} for the rest)
+    """
+    symbols, prices, volumes = stack_histories(frames, length)
+
+    lengths = history_lengths(prices)
+    valid = lengths >= MIN_HISTORY_DAYS
+    errors = {
+        symbol: f"Insufficient data for risk scoring (need {MIN_HISTORY_DAYS}+ days)"
+        for symbol, ok in zip(symbols, valid) if not ok
+    }
+
+    if not valid.any():
+        return [], errors
+
+    scored_symbols = [s for s, ok in zip(symbols, valid) if ok]
+    factors = compute_risk_factors(prices[valid], volumes[valid])
+
+    return build_risk_breakdowns(scored_symbols, factors), errors
+
+
+# Portfolio risk: composite weights and score multipliers
+PORTFOLIO_RISK_WEIGHTS = {
+    'volatility': 0.5,
+    'concentration': 0.25,
+    'correlation': 0.25,
+}
+PORTFOLIO_VOLATILITY_MULTIPLIER = 1500  # 4% daily portfolio stddev -> 60
+TRADING_DAYS_PER_YEAR = 365
+
+
+def align_returns(frames: Dict[str, pd.DataFrame], length: int = 90) -> Tuple[List[str], np.ndarray]:
+    """
+    Build an (S, T-1) matrix of daily returns over the days all symbols share
+
+    Histories are aligned by calendar day (not by position), so a symbol with
+    a gap does not shift the others.
+
+    Args:
+        frames: Symbol -> DataFrame with a 'price' column and a time index
+        length: Number of most recent shared days to keep
+
+    Returns:
+        Tuple of (symbols, returns)
+    """
+    symbols = list(frames)
+    columns = []
+    for symbol in symbols:
+        price = frames[symbol]['price'].astype(float)
+        # Daily candles: key by calendar day, keep the last price of each day
+        price.index = pd.DatetimeIndex(price.index).normalize()
+        columns.append(price[~price.index.duplicated(keep='last')])
+
+    aligned = pd.concat(columns, axis=1, join='inner').sort_index().tail(length)
+    prices = aligned.to_numpy().T
+
+    returns = prices[:, 1:] / prices[:, :-1] - 1
+
+    return symbols, returns
+
+
+def compute_portfolio_risk(weights: np.ndarray, returns: np.ndarray) -> Dict:
+    """
+    Portfolio volatility, concentration and correlation risk from one covariance matrix
+
+    Args:
+        weights: (S,) allocation weights summing to 1
+        returns: (S, N) aligned daily returns
+
+    Returns:
+        Dict with portfolio metrics and per-asset arrays
+    """
+    weights = np.asarray(weights, dtype=float)
+    num_assets = len(weights)
+
+    covariance = np.atleast_2d(np.cov(returns))
+    asset_volatility = np.sqrt(np.diag(covariance))
+
+    # Portfolio variance and each asset's share of it
+    marginal = covariance @ weights
+    variance = float(weights @ marginal)
+    volatility = np.sqrt(variance)
+    risk_contribution = weights * marginal / variance if variance > 0 else weights.copy()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = covariance / np.outer(asset_volatility, asset_volatility)
+    correlation = np.nan_to_num(correlation)
+
+    # Weighted average pairwise correlation (off-diagonal)
+    pair_weights = np.outer(weights, weights)
+    np.fill_diagonal(pair_weights, 0)
+    pair_total = pair_weights.sum()
+    avg_correlation = float((pair_weights * correlation).sum() / pair_total) if pair_total > 0 else 1.0
+
+    # Concentration: Herfindahl index rescaled to 0 (equal weights) .. 1 (single asset)
+    hhi = float((weights ** 2).sum())
+    if num_assets > 1:
+        concentration = (hhi - 1 / num_assets) / (1 - 1 / num_assets)
+    else:
+        concentration = 1.0
+
+    diversification_ratio = float(weights @ asset_volatility / volatility) if volatility > 0 else 1.0
+
+    scores = {
+        'volatility': int(min(100, np.trunc(volatility * PORTFOLIO_VOLATILITY_MULTIPLIER))),
+        'concentration': int(min(100, np.trunc(max(0.0, concentration) * 100))),
+        'correlation': int(min(100, np.trunc(max(0.0, avg_correlation) * 100))),
+    }
+    risk_score = int(np.clip(np.trunc(sum(scores[k] * w for k, w in PORTFOLIO_RISK_WEIGHTS.items())), 0, 100))
+
+    return {
+        'risk_score': risk_score,
+        'scores': scores,
+        'daily_volatility': float(volatility),
+        'annualized_volatility': float(volatility * np.sqrt(TRADING_DAYS_PER_YEAR)),
+        'herfindahl_index': hhi,
+        'effective_assets': 1 / hhi,
+        'avg_correlation': avg_correlation,
+        'diversification_ratio': diversification_ratio,
+        'asset_volatility': asset_volatility,
+        'risk_contribution': risk_contribution,
+        'correlation': correlation,
+    }
+
+
+def build_portfolio_breakdown(
+    symbols: List[str],
+    weights: np.ndarray,
+    returns: np.ndarray,
+    analyzed_at: datetime = None
+) -> Dict:
+    """
+    Portfolio risk payload shaped like PortfolioRiskResponse
+
+    Args:
+        symbols: Symbols in row order
+        weights: (S,) allocation weights summing to 1
+        returns: (S, N) aligned daily returns
+        analyzed_at: Analysis timestamp (default: now, UTC)
+
+    Returns:
+        Portfolio risk dict
+    """
+    analyzed_at = analyzed_at or datetime.utcnow()
+    risk = compute_portfolio_risk(weights, returns)
+    scores = risk['scores']
+
+    metrics = {
+        'volatility': {
+            'daily': round(risk['daily_volatility'], 4),
+            'annualized': round(risk['annualized_volatility'], 4),
+            'score': scores['volatility'],
+            'risk': factor_risk(scores['volatility']),
+        },
+        'concentration': {
+            'herfindahlIndex': round(risk['herfindahl_index'], 4),
+            'effectiveAssets': round(risk['effective_assets'], 2),
+            'maxWeight': round(float(weights.max()), 4),
+            'score': scores['concentration'],
+            'risk': factor_risk(scores['concentration']),
+        },
+        'correlation': {
+            'average': round(risk['avg_correlation'], 4),
+            'diversificationRatio': round(risk['diversification_ratio'], 4),
+            'score': scores['correlation'],
+            'risk': factor_risk(scores['correlation']),
+        },
+    }
+
+    assets = {
+        symbol: {
+            'weight': round(float(weights[i]), 4),
+            'dailyVolatility': round(float(risk['asset_volatility'][i]), 4),
+            'riskContribution': round(float(risk['risk_contribution'][i]), 4),
+        }
+        for i, symbol in enumerate(symbols)
+    }
+
+    correlation_matrix = {
+        symbol: {other: round(float(risk['correlation'][i, j]), 4) for j, other in enumerate(symbols)}
+        for i, symbol in enumerate(symbols)
+    }
+
+    # Generate warnings
+    warnings = []
+    if scores['volatility'] > 70:
+        warnings.append(f"High portfolio volatility ({risk['daily_volatility'] * 100:.1f}% daily stddev)")
+    if scores['concentration'] > 60:
+        top = symbols[int(np.argmax(weights))]
+        warnings.append(f"Concentrated portfolio ({weights.max() * 100:.0f}% in {top})")
+    if scores['correlation'] > 70 and len(symbols) > 1:
+        warnings.append(f"Holdings are highly correlated (avg {risk['avg_correlation']:.2f}); little diversification")
+
+    return {
+        'portfolio_risk_score': risk['risk_score'],
+        'risk_level': risk_level(risk['risk_score']),
+        'metrics': metrics,
+        'assets': assets,
+        'correlation_matrix': correlation_matrix,
+        'observations': int(returns.shape[1]),
+        'warnings': warnings if warnings else ["No major risk warnings"],
+        'analyzed_at': analyzed_at.isoformat() + 'Z',
+    }
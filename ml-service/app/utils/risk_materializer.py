@@ -0,0 +1,176 @@
+"""
+Risk Score Materializer
+Precomputes risk scores for every token and stores them in a Redis hash
+
+Risk scores only change when a new daily candle arrives. The materializer
+recomputes the whole token universe with the vectorized risk engine when
+the price_data watermark moves, and writes one compact JSON entry per
+symbol into a single Redis hash. /risk-score then becomes a single HGET.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.utils.database import query_price_histories, load_token_symbols, load_latest_candle_time
+from app.utils.metrics import DB_ERRORS
+from app.utils.risk_engine import score_histories
+
+logger = logging.getLogger(__name__)
+
+RISK_TABLE_KEY = 'risk_scores'
+RISK_TABLE_META_KEY = 'risk_scores:meta'
+
+# Symbols per bulk history query
+MATERIALIZE_CHUNK_SIZE = 250
+
+# Entries older than this are ignored by lookups (materializer stalled)
+MATERIALIZED_MAX_AGE = timedelta(hours=26)
+
+
+def materialize_risk_scores(
+    redis_client,
+    symbols: List[str],
+    days: int = 90,
+    chunk_size: int = MATERIALIZE_CHUNK_SIZE,
+    watermark: Optional[datetime] = None
+) -> Dict:
+    """
+    Recompute risk scores for all symbols and write them to the Redis hash
+
+    Only real candles are scored: symbols without price rows are dropped
+    from the table, and a failing history query aborts the refresh so the
+    remaining entries keep their last good scores.
+
+    Args:
+        redis_client: Redis client
+        symbols: Symbols to materialize
+        days: Days of history per symbol
+        chunk_size: Symbols per bulk history query / engine pass
+        watermark: Latest candle time the scores were computed from
+
+    Returns:
+        Summary dict with counts, errors and refresh time
+
+    Raises:
+        Exception: The history query failed (database unavailable)
+    """
+    started = datetime.utcnow()
+    scored = 0
+    errors: Dict[str, str] = {}
+
+    for start in range(0, len(symbols), chunk_size):
+        chunk = symbols[start:start + chunk_size]
+
+        try:
+            frames = query_price_histories(chunk, days)
+        except Exception:
+            DB_ERRORS.inc(operation='price_histories')
+            raise
+
+        breakdowns, chunk_errors = score_histories(frames, length=days) if frames else ([], {})
+        chunk_errors.update({symbol: 'No price data' for symbol in chunk if symbol not in frames})
+        errors.update(chunk_errors)
+
+        # Lookups serve an entry until MATERIALIZED_MAX_AGE, so it expires then
+        for breakdown in breakdowns:
+            analyzed_at = datetime.fromisoformat(breakdown['analyzed_at'].rstrip('Z'))
+            breakdown['cache_expires_at'] = (analyzed_at + MATERIALIZED_MAX_AGE).isoformat() + 'Z'
+
+        if breakdowns:
+            redis_client.hset(
+                RISK_TABLE_KEY,
+                mapping={b['symbol']: json.dumps(b, separators=(',', ':')) for b in breakdowns}
+            )
+            scored += len(breakdowns)
+
+        # Drop entries that can no longer be scored
+        if chunk_errors:
+            redis_client.hdel(RISK_TABLE_KEY, *chunk_errors)
+
+    summary = {
+        'symbols': len(symbols),
+        'scored': scored,
+        'errors': errors,
+        'watermark': watermark.isoformat() if watermark else None,
+        'refreshed_at': datetime.utcnow().isoformat() + 'Z',
+        'duration_seconds': (datetime.utcnow() - started).total_seconds()
+    }
+
+    redis_client.set(RISK_TABLE_META_KEY, json.dumps(summary))
+
+    logger.info(f"Materialized risk scores for {scored}/{len(symbols)} symbols in {summary['duration_seconds']:.2f}s")
+
+    return summary
+
+
+def get_materialized_risk_score(redis_client, symbol: str, now: Optional[datetime] = None) -> Optional[Dict]:
+    """
+    Look up a precomputed risk score
+
+    Args:
+        redis_client: Redis client
+        symbol: Asset symbol
+        now: Current time (default: now, UTC)
+
+    Returns:
+        RiskScoreResponse-shaped dict, or None if missing or stale
+    """
+    raw = redis_client.hget(RISK_TABLE_KEY, symbol)
+    if raw is None:
+        return None
+
+    entry = json.loads(raw)
+
+    analyzed_at = datetime.fromisoformat(entry['analyzed_at'].rstrip('Z'))
+    if (now or datetime.utcnow()) - analyzed_at > MATERIALIZED_MAX_AGE:
+        return None
+
+    return entry
+
+
+class RiskMaterializer:
+    """
+    Refreshes the risk score table whenever new candles are ingested
+    """
+
+    def __init__(self, redis_client, fallback_symbols: List[str], days: int = 90):
+        """
+        Initialize the materializer
+
+        Args:
+            redis_client: Redis client
+            fallback_symbols: Symbols to score when the tokens table is unavailable
+            days: Days of history per symbol
+        """
+        self.redis_client = redis_client
+        self.fallback_symbols = fallback_symbols
+        self.days = days
+        self.last_watermark: Optional[datetime] = None
+        self.last_summary: Optional[Dict] = None
+
+    def refresh(self, force: bool = False) -> Optional[Dict]:
+        """
+        Recompute the table if the price_data watermark moved (blocking)
+
+        Args:
+            force: Recompute even if no new candles arrived
+
+        Returns:
+            Materialization summary, or None if nothing changed
+        """
+        watermark = load_latest_candle_time()
+
+        # Without a watermark (no database) every refresh recomputes
+        if not force and watermark is not None and watermark == self.last_watermark:
+            return None
+
+        symbols = load_token_symbols() or self.fallback_symbols
+
+        self.last_summary = materialize_risk_scores(
+            self.redis_client, symbols, days=self.days, watermark=watermark
+        )
+        self.last_watermark = watermark
+
+        return self.last_summary
@@ -0,0 +1,196 @@
+"""
+Request Tracing
+Per-request stage spans, Server-Timing headers and sampled profiling
+
+Each HTTP request gets a trace (a list of (name, seconds) spans) held in a
+context variable, so spans recorded anywhere in the call stack - including
+code run via asyncio.to_thread - land in the right request. The breakdown
+is returned in the standard Server-Timing response header, which browser
+dev tools and most HTTP clients can display.
+
+Sampled profiling runs cProfile on every Nth request and writes a .prof
+file (readable with pstats or snakeviz). cProfile only sees the event loop
+thread, and concurrent requests interleave on it, so profiles are for
+finding hot spots rather than exact per-request attribution.
+"""
+
+import os
+import time
+import cProfile
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Spans of the request being served (None outside a traced request)
+current_trace: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar('current_trace', default=None)
+
+
+def record_span(name: str, seconds: float):
+    """Add a finished span to the current request's trace (no-op outside a request)"""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.append((name, seconds))
+
+
+@contextmanager
+def span(name: str):
+    """Time a block as a span of the current request"""
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.append((name, time.perf_counter() - start))
+
+
+def format_server_timing(trace: List[Tuple[str, float]], total: float) -> str:
+    """
+    Render spans as a Server-Timing header value
+
+    Repeated span names (e.g. one forward pass per ensemble variant) are summed.
+
+    Args:
+        trace: (name, seconds) spans in recording order
+        total: Whole request duration in seconds
+
+    Returns:
+        Header value like 'db_fetch;dur=12.1, forward;dur=3.4, total;dur=17.9'
+    """
+    durations = {}
+    for name, seconds in trace:
+        durations[name] = durations.get(name, 0.0) + seconds
+
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in durations.items()]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ', '.join(entries)
+
+
+class RequestProfiler:
+    """
+    Profiles every Nth request with cProfile and dumps stats to disk
+    """
+
+    def __init__(self, sample_every: int = 0, output_dir: str = './profiles'):
+        """
+        Initialize the profiler
+
+        Args:
+            sample_every: Profile one in this many requests (0 disables)
+            output_dir: Directory for .prof files
+        """
+        self.sample_every = sample_every
+        self.output_dir = output_dir
+        self.request_count = 0
+        self._active = False
+        self._lock = threading.Lock()
+
+    def start(self) -> Optional[cProfile.Profile]:
+        """Return a running profiler if this request is sampled, else None"""
+        if self.sample_every <= 0:
+            return None
+
+        with self._lock:
+            self.request_count += 1
+            # cProfile allows one active profiler per thread
+            if self.request_count % self.sample_every != 0 or self._active:
+                return None
+            self._active = True
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def finish(self, profiler: cProfile.Profile, endpoint: str, duration: float) -> str:
+        """
+        Stop a sampled profiler and write its stats
+
+        Returns:
+            Path of the written .prof file
+        """
+        profiler.disable()
+        with self._lock:
+            self._active = False
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        name = endpoint.strip('/').replace('/', '_').replace('{', '').replace('}', '') or 'root'
+        path = os.path.join(
+            self.output_dir,
+            f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}_{name}_{duration * 1000:.0f}ms.prof"
+        )
+        profiler.dump_stats(path)
+
+        logger.info(f"Wrote request profile {path}")
+        return path
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that traces each request
+
+    Adds a Server-Timing header with the stage breakdown, logs the
+    breakdown of requests slower than `slow_request_seconds`, and runs
+    the sampled profiler.
+    """
+
+    def __init__(
+        self,
+        app,
+        profiler: Optional[RequestProfiler] = None,
+        slow_request_seconds: float = 0.0,
+        server_timing: bool = True
+    ):
+        """
+        Args:
+            app: ASGI app
+            profiler: Sampled request profiler (None disables profiling)
+            slow_request_seconds: Log stage breakdown above this duration (0 disables)
+            server_timing: Add the Server-Timing response header
+        """
+        self.app = app
+        self.profiler = profiler
+        self.slow_request_seconds = slow_request_seconds
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        trace: List[Tuple[str, float]] = []
+        token = current_trace.set(trace)
+        start = time.perf_counter()
+        profiler = self.profiler.start() if self.profiler is not None else None
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start' and self.server_timing:
+                header = format_server_timing(trace, time.perf_counter() - start)
+                message.setdefault('headers', [])
+                message['headers'] = list(message['headers']) + [(b'server-timing', header.encode('latin-1'))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            current_trace.reset(token)
+
+            if profiler is not None:
+                try:
+                    self.profiler.finish(profiler, scope['path'], duration)
+                except Exception as e:
+                    logger.warning(f"Could not write request profile: {e}")
+
+            if self.slow_request_seconds and duration > self.slow_request_seconds:
+                logger.warning(
+                    f"Slow request {scope['method']} {scope['path']} ({duration * 1000:.0f}ms): "
+                    f"{format_server_timing(trace, duration)}"
+                )
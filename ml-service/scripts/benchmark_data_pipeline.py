@@ -0,0 +1,112 @@
+"""
+Data Pipeline Benchmark
+Compares epoch wall time of the DataLoader(TensorDataset) path against the
+in-memory tensor batch path in ModelTrainer
+
+Usage:
+    python scripts/benchmark_data_pipeline.py --samples 600 --epochs 5
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+from typing import Dict, List
+
+import numpy as np
+import torch
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import CryptoLSTM
+from app.training.trainer import ModelTrainer, TRAINING_CONFIG
+
+
+def time_epochs(pipeline: str, X: np.ndarray, y: np.ndarray, config: Dict, epochs: int) -> List[float]:
+    """
+    Time training epochs for one data pipeline
+
+    Args:
+        pipeline: 'dataloader' or 'tensor'
+        X: Feature array
+        y: Label array
+        config: Training configuration
+        epochs: Number of epochs to time
+
+    Returns:
+        List of epoch wall times in seconds
+    """
+    torch.manual_seed(42)
+    model = CryptoLSTM(input_size=X.shape[2], hidden_sizes=config['hidden_sizes'], dropout=config['dropout'])
+    trainer = ModelTrainer(model, config=config, device='cpu')
+
+    if pipeline == 'tensor':
+        train_loader, _ = trainer.prepare_tensor_batches(X, y, X[:1], y[:1])
+    else:
+        train_loader, _ = trainer.prepare_dataloaders(X, y, X[:1], y[:1])
+
+    times = []
+    for _ in range(epochs):
+        start = time.perf_counter()
+        trainer.train_epoch(train_loader)
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ModelTrainer data pipelines')
+    parser.add_argument('--samples', type=int, default=600, help='Training samples (default: 600)')
+    parser.add_argument('--sequence-length', type=int, default=90, help='Sequence length (default: 90)')
+    parser.add_argument('--epochs', type=int, default=5, help='Epochs to time per pipeline (default: 5)')
+    parser.add_argument('--batch-size', type=int, default=TRAINING_CONFIG['batch_size'], help='Batch size')
+    parser.add_argument('--effective-batch-size', type=int, default=None, help='Larger batch size for the tensor path')
+    parser.add_argument('--output', type=str, default=None, help='Optional JSON output file')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((args.samples, args.sequence_length, 20)).astype(np.float32)
+    y = rng.integers(0, 3, args.samples)
+
+    config = TRAINING_CONFIG.copy()
+    config['batch_size'] = args.batch_size
+
+    runs = [('dataloader', config), ('tensor', config)]
+    if args.effective_batch_size:
+        large = config.copy()
+        large['effective_batch_size'] = args.effective_batch_size
+        runs.append((f"tensor_bs{args.effective_batch_size}", large))
+
+    print(f"Samples: {args.samples}, sequence length: {args.sequence_length}, batch size: {args.batch_size}")
+    print(f"torch threads: {torch.get_num_threads()}\n")
+
+    results = {}
+    for name, run_config in runs:
+        pipeline = 'tensor' if name.startswith('tensor') else 'dataloader'
+        times = time_epochs(pipeline, X, y, run_config, args.epochs)
+        # First epoch includes warm-up; report the rest when possible
+        steady = times[1:] if len(times) > 1 else times
+        results[name] = {
+            'epoch_times_seconds': times,
+            'mean_epoch_seconds': float(np.mean(steady)),
+            'samples_per_second': float(args.samples / np.mean(steady))
+        }
+        print(f"{name:<20} {results[name]['mean_epoch_seconds']:.4f}s/epoch  "
+              f"{results[name]['samples_per_second']:.0f} samples/s")
+
+    baseline = results['dataloader']['mean_epoch_seconds']
+    print()
+    for name, result in results.items():
+        result['speedup_vs_dataloader'] = baseline / result['mean_epoch_seconds']
+        print(f"{name:<20} {result['speedup_vs_dataloader']:.2f}x vs dataloader")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'params': vars(args), 'results': results}, f, indent=2)
+        print(f"\n📄 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
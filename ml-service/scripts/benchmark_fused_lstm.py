@@ -0,0 +1,128 @@
+"""
+Fused vs Stacked LSTM Benchmark
+Compares forward/backward speed and accuracy of the stacked CryptoLSTM and
+the fused FusedCryptoLSTM architectures
+
+Usage:
+    python scripts/benchmark_fused_lstm.py --hidden-size 128 --train-epochs 10
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+from typing import Dict
+
+import numpy as np
+import torch
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import build_model, convert_stacked_to_fused
+from app.training.trainer import ModelTrainer, TRAINING_CONFIG
+
+
+def time_model(model: torch.nn.Module, x: torch.Tensor, repeats: int, backward: bool) -> float:
+    """
+    Time forward (and optionally backward) passes
+
+    Returns:
+        Mean seconds per pass
+    """
+    model.train(backward)
+    # Warm-up
+    for _ in range(2):
+        out = model(x)
+        if backward:
+            out.sum().backward()
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        if backward:
+            model.zero_grad()
+            model(x).sum().backward()
+        else:
+            with torch.no_grad():
+                model(x)
+
+    return (time.perf_counter() - start) / repeats
+
+
+def train_and_score(config: Dict, X: np.ndarray, y: np.ndarray, seed: int) -> Dict:
+    """Train a model on synthetic data and return accuracy and time"""
+    torch.manual_seed(seed)
+    split = int(len(X) * 0.8)
+
+    model = build_model(config, input_size=X.shape[2])
+    trainer = ModelTrainer(model, config=config, device='cpu')
+
+    results = trainer.train(X[:split], y[:split], X[split:], y[split:], symbol='BENCH', verbose=False)
+
+    return {
+        'best_val_accuracy': float(results['best_val_accuracy']),
+        'best_val_loss': float(results['best_val_loss']),
+        'training_time_seconds': results['training_time_seconds'],
+        'epochs_trained': results['epochs_trained']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark fused vs stacked CryptoLSTM')
+    parser.add_argument('--hidden-size', type=int, default=128, help='Hidden size per layer (default: 128)')
+    parser.add_argument('--hidden-sizes', type=int, nargs=3, default=None,
+                        help='Per-layer hidden sizes, e.g. 128 64 32 (overrides --hidden-size)')
+    parser.add_argument('--batch-size', type=int, default=32, help='Batch size (default: 32)')
+    parser.add_argument('--sequence-length', type=int, default=90, help='Sequence length (default: 90)')
+    parser.add_argument('--repeats', type=int, default=20, help='Timed passes (default: 20)')
+    parser.add_argument('--train-epochs', type=int, default=0, help='Also train both models for N epochs (default: 0)')
+    parser.add_argument('--output', type=str, default=None, help='Optional JSON output file')
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    hidden_sizes = args.hidden_sizes or [args.hidden_size] * 3
+    stacked = build_model({'architecture': 'stacked', 'hidden_sizes': hidden_sizes})
+    fused = convert_stacked_to_fused(stacked)
+
+    x = torch.randn(args.batch_size, args.sequence_length, 20)
+
+    stacked.eval()
+    fused.eval()
+    with torch.no_grad():
+        max_diff = (stacked(x) - fused(x)).abs().max().item()
+
+    results = {'hidden_sizes': hidden_sizes, 'conversion_max_abs_diff': max_diff}
+    for name, backward in [('forward', False), ('forward_backward', True)]:
+        stacked_time = time_model(stacked, x, args.repeats, backward)
+        fused_time = time_model(fused, x, args.repeats, backward)
+        results[name] = {
+            'stacked_seconds': stacked_time,
+            'fused_seconds': fused_time,
+            'speedup': stacked_time / fused_time
+        }
+        print(f"{name:<17} stacked {stacked_time * 1000:8.2f}ms  fused {fused_time * 1000:8.2f}ms  "
+              f"speedup {stacked_time / fused_time:.2f}x")
+
+    print(f"Conversion max |diff|: {max_diff:.2e}")
+
+    if args.train_epochs:
+        rng = np.random.default_rng(0)
+        X = rng.standard_normal((500, args.sequence_length, 20)).astype(np.float32)
+        y = rng.integers(0, 3, 500)
+
+        for architecture in ['stacked', 'fused']:
+            config = dict(TRAINING_CONFIG, architecture=architecture, hidden_sizes=hidden_sizes,
+                          epochs=args.train_epochs, checkpoint_dir=os.path.join('models', 'benchmark'))
+            results[f"train_{architecture}"] = train_and_score(config, X, y, seed=0)
+            print(f"train {architecture:<8} val_acc {results[f'train_{architecture}']['best_val_accuracy']:.4f}  "
+                  f"time {results[f'train_{architecture}']['training_time_seconds']:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Hot Path Microbenchmarks
+Times engineer_features, create_labels, normalize_features, create_sequences,
+build_dataset and the CryptoLSTM forward pass across history lengths, batch sizes and
+architectures, and checks them against a stored baseline
+
+Every case uses fixed seeds and synthetic data. Each case is timed for
+several rounds (at least --min-time seconds) and reports min / median /
+mean / stddev like pytest-benchmark. The median is compared to the
+baseline; a case more than --threshold slower fails the run (exit code 1).
+
+Baselines are machine-specific: regenerate with --update-baseline when the
+benchmark machine changes.
+
+Usage:
+    python scripts/benchmark_hot_paths.py                      # compare to baseline
+    python scripts/benchmark_hot_paths.py --update-baseline    # record new baseline
+    python scripts/benchmark_hot_paths.py --filter forward --threshold 0.1
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import statistics
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import build_model
+from app.utils.feature_engineering import (
+    engineer_features,
+    build_dataset,
+    create_labels,
+    create_sequences,
+    normalize_features
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'baseline.json')
+
+HISTORY_LENGTHS = [120, 365, 1095, 2190]
+SEQUENCE_LENGTH = 90
+BATCH_SIZES = [1, 32, 256]
+ARCHITECTURES = {
+    'h128-64-32': [128, 64, 32],
+    'h256-128-64': [256, 128, 64],
+}
+
+
+def synthetic_prices(days: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk OHLCV frame shaped like fetch_price_history output"""
+    rng = np.random.default_rng(seed)
+    price = 50000 * np.cumprod(1 + rng.normal(0.001, 0.02, days))
+    volume = np.maximum(rng.normal(1e9, 2e8, days), 1e8)
+
+    return pd.DataFrame({
+        'price': price,
+        'high': price * rng.uniform(1.0, 1.03, days),
+        'low': price * rng.uniform(0.97, 1.0, days),
+        'volume': volume,
+        'market_cap': price * rng.normal(1.9e7, 1e6, days),
+        'change_1h': rng.normal(0, 0.5, days),
+        'change_24h': rng.normal(0, 2.0, days)
+    }, index=pd.date_range(end='2025-01-01', periods=days, freq='D'))
+
+
+def build_cases() -> List[Tuple[str, Callable[[], object]]]:
+    """(name, zero-argument callable) for every benchmark case"""
+    cases = []
+
+    for days in HISTORY_LENGTHS:
+        df = synthetic_prices(days)
+        features = engineer_features(df)
+        labels = create_labels(features)
+
+        cases.append((f"engineer_features[days={days}]", lambda df=df: engineer_features(df)))
+        cases.append((f"create_labels[days={days}]", lambda f=features: create_labels(f)))
+        cases.append((f"normalize_features[days={days}]", lambda f=features: normalize_features(f)))
+        if len(features) > SEQUENCE_LENGTH:
+            cases.append((
+                f"create_sequences[days={days}]",
+                lambda f=features, l=labels: create_sequences(f, l, SEQUENCE_LENGTH)
+            ))
+            cases.append((
+                f"build_dataset[days={days}]",
+                lambda f=features: build_dataset(f, horizon=7, sequence_length=SEQUENCE_LENGTH)
+            ))
+
+    for arch_name, hidden_sizes in ARCHITECTURES.items():
+        torch.manual_seed(0)
+        model = build_model({'architecture': 'stacked', 'hidden_sizes': hidden_sizes})
+        model.eval()
+
+        for batch_size in BATCH_SIZES:
+            x = torch.randn(batch_size, SEQUENCE_LENGTH, 20, generator=torch.Generator().manual_seed(0))
+
+            def forward(model=model, x=x):
+                with torch.no_grad():
+                    return model(x)
+
+            cases.append((f"forward[{arch_name},batch={batch_size}]", forward))
+
+    return cases
+
+
+def time_case(fn: Callable[[], object], min_time: float, min_rounds: int, max_rounds: int) -> Dict:
+    """
+    Time a callable for at least `min_time` seconds / `min_rounds` rounds
+
+    Returns:
+        Stats dict in seconds: min, median, mean, stddev, rounds
+    """
+    fn()  # Warm-up
+
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_rounds and (len(timings) < min_rounds or time.perf_counter() - started < min_time):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'stddev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'rounds': len(timings)
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    Print median change per case and return the cases beyond the threshold
+
+    Args:
+        results: Current stats by case name
+        baseline: Baseline stats by case name
+        threshold: Allowed relative slowdown of the median (0.25 = 25%)
+
+    Returns:
+        Names of regressed cases
+    """
+    regressions = []
+
+    print(f"\n{'case':<42} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, stats in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<42} {'-':>10} {stats['median'] * 1000:9.3f}ms {'new':>8}")
+            continue
+
+        change = stats['median'] / previous['median'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  ❌ regression'
+        print(f"{name:<42} {previous['median'] * 1000:9.3f}ms {stats['median'] * 1000:9.3f}ms {change:+7.1%}{flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Microbenchmarks for feature engineering, windowing and forward passes')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='Baseline JSON file')
+    parser.add_argument('--update-baseline', action='store_true', help='Write results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed median slowdown (default: 0.25 = 25%%)')
+    parser.add_argument('--filter', type=str, default=None, help='Only run cases containing this substring')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Minimum seconds per case (default: 0.5)')
+    parser.add_argument('--min-rounds', type=int, default=5, help='Minimum rounds per case (default: 5)')
+    parser.add_argument('--max-rounds', type=int, default=1000, help='Maximum rounds per case (default: 1000)')
+    parser.add_argument('--threads', type=int, default=1, help='torch intra-op threads (default: 1)')
+    parser.add_argument('--output', type=str, default=None, help='Optional JSON output file')
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+
+    results = {}
+    for name, fn in build_cases():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = time_case(fn, args.min_time, args.min_rounds, args.max_rounds)
+        stats = results[name]
+        print(f"{name:<42} median {stats['median'] * 1000:9.3f}ms  min {stats['min'] * 1000:9.3f}ms  "
+              f"stddev {stats['stddev'] * 1000:8.3f}ms  rounds {stats['rounds']}")
+
+    report = {
+        'created_at': datetime.utcnow().isoformat() + 'Z',
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'torch': torch.__version__,
+            'torch_threads': args.threads,
+            'machine': platform.machine(),
+            'processor': platform.processor()
+        },
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Results saved to {args.output}")
+
+    if args.update_baseline:
+        baseline = {'results': {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        # Filtered runs only replace the cases they ran
+        report['results'] = {**baseline.get('results', {}), **results}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Baseline updated: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline['results'], args.threshold)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,488 @@
+"""
+End-to-End Service Benchmark
+Drives /predict, /predict/ensemble and /risk-score of the ml-service app
+in-process and reports throughput and latency percentiles
+
+Scenarios:
+    cold       empty model cache and response caches (first request per symbol)
+    warm       models in memory, response cache bypassed (full inference path)
+    cache_hit  responses served from the Redis cache
+
+By default the service runs against local stand-ins so no infrastructure is
+needed: a SQLite file seeded with generate_mock_price_dataframe serves price
+history, an in-process dict replaces Redis, and randomly initialized
+checkpoints are written for every symbol. Pass --database-url / --redis-url
+to benchmark against real Postgres and Redis instead (the database must
+already contain price data).
+
+Usage:
+    python scripts/benchmark_service.py --concurrency 8 --requests 200
+    python scripts/benchmark_service.py --baseline models/benchmark/e2e_previous.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import asyncio
+import argparse
+import logging
+import platform
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import torch
+import httpx
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ENDPOINTS = {
+    'predict': ('/predict', lambda symbol: {'symbol': symbol, 'timeframe': '7d'}),
+    'ensemble': ('/predict/ensemble', lambda symbol: {'symbol': symbol, 'timeframe': '7d', 'ensemble_method': 'weighted_average'}),
+    'risk_score': ('/risk-score', lambda symbol: {'symbol': symbol}),
+}
+
+SCENARIOS = ['cold', 'warm', 'cache_hit']
+
+
+class InMemoryRedis:
+    """
+    In-process stand-in for the Redis commands used by the service
+    """
+
+    def __init__(self):
+        self.store: Dict[str, bytes] = {}
+        self.hashes: Dict[str, Dict[str, bytes]] = {}
+        self.streams: Dict[str, List] = {}
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value):
+        self.store[key] = value if isinstance(value, bytes) else str(value).encode()
+
+    def setex(self, key, ttl, value):
+        self.set(key, value)
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += self.store.pop(key, None) is not None
+            removed += self.hashes.pop(key, None) is not None
+            removed += self.streams.pop(key, None) is not None
+        return removed
+
+    def hget(self, name, key):
+        return self.hashes.get(name, {}).get(key)
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        entries = dict(mapping or {})
+        if key is not None:
+            entries[key] = value
+        self.hashes.setdefault(name, {}).update(
+            {k: v if isinstance(v, bytes) else str(v).encode() for k, v in entries.items()}
+        )
+
+    def hdel(self, name, *keys):
+        for key in keys:
+            self.hashes.get(name, {}).pop(key, None)
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        stream = self.streams.setdefault(name, [])
+        entry_id = f"{int(stream[-1][0].split(b'-')[0]) + 1 if stream else 1}-0".encode()
+        stream.append((entry_id, {k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in fields.items()}))
+        if maxlen is not None:
+            del stream[:-maxlen]
+        return entry_id
+
+    def xrange(self, name):
+        return list(self.streams.get(name, []))
+
+    def pipeline(self):
+        return InMemoryPipeline(self)
+
+    def close(self):
+        pass
+
+
+class InMemoryPipeline:
+    """Buffered commands executed on execute()"""
+
+    def __init__(self, client: InMemoryRedis):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+class WriteDroppingRedis:
+    """Wraps a Redis client so cache writes are discarded (every read misses)"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def set(self, *args, **kwargs):
+        pass
+
+    def setex(self, *args, **kwargs):
+        pass
+
+    def hset(self, *args, **kwargs):
+        pass
+
+    def pipeline(self):
+        return InMemoryPipeline(self)
+
+
+class SQLitePriceStore:
+    """
+    SQLite stand-in for the price_data / tokens tables
+    """
+
+    def __init__(self, path: str):
+        self.engine = create_engine(f"sqlite:///{path}")
+
+    def seed(self, symbols: List[str], days: int, seed: int = 0):
+        """Fill tokens and price_data with synthetic OHLCV from generate_mock_price_dataframe"""
+        from app.utils.database import generate_mock_price_dataframe
+
+        random.seed(seed)
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS price_data"))
+            conn.execute(text("DROP TABLE IF EXISTS tokens"))
+            conn.execute(text("CREATE TABLE tokens (id INTEGER PRIMARY KEY, symbol TEXT UNIQUE, market_cap REAL)"))
+            conn.execute(text(
+                "CREATE TABLE price_data (token_id INTEGER, time TIMESTAMP, open REAL, high REAL, "
+                "low REAL, close REAL, volume REAL)"
+            ))
+            conn.execute(text("CREATE INDEX idx_price_data_token_time ON price_data (token_id, time)"))
+
+            for token_id, symbol in enumerate(symbols, start=1):
+                df = generate_mock_price_dataframe(days, symbol)
+                conn.execute(
+                    text("INSERT INTO tokens (id, symbol, market_cap) VALUES (:id, :symbol, :market_cap)"),
+                    {'id': token_id, 'symbol': symbol, 'market_cap': float(df['market_cap'].iloc[-1])}
+                )
+                conn.execute(
+                    text("INSERT INTO price_data VALUES (:token_id, :time, :open, :high, :low, :close, :volume)"),
+                    [
+                        {
+                            'token_id': token_id,
+                            'time': t.to_pydatetime(),
+                            'open': float(row.price),
+                            'high': float(row.high),
+                            'low': float(row.low),
+                            'close': float(row.price),
+                            'volume': float(row.volume_24h)
+                        }
+                        for t, row in df.iterrows()
+                    ]
+                )
+
+    def load_history(self, symbol: str, days: int) -> pd.DataFrame:
+        """Same columns as database.fetch_price_history, from SQLite"""
+        query = text("""
+            SELECT
+                pd.time,
+                pd.close as price,
+                pd.volume as volume_24h,
+                t.market_cap as market_cap,
+                0 as change_1h,
+                COALESCE(
+                    ((pd.close - LAG(pd.close, 1) OVER (ORDER BY pd.time)) /
+                     LAG(pd.close, 1) OVER (ORDER BY pd.time)) * 100,
+                    0
+                ) as change_24h,
+                pd.high,
+                pd.low
+            FROM price_data pd
+            JOIN tokens t ON pd.token_id = t.id
+            WHERE t.symbol = :symbol
+            AND pd.time >= :since
+            ORDER BY pd.time ASC
+        """)
+        with self.engine.connect() as conn:
+            rows = conn.execute(query, {'symbol': symbol, 'since': datetime.now() - timedelta(days=days)}).fetchall()
+
+        df = pd.DataFrame(rows, columns=['time', 'price', 'volume_24h', 'market_cap', 'change_1h', 'change_24h', 'high', 'low'])
+        df['time'] = pd.to_datetime(df['time'])
+        df.set_index('time', inplace=True)
+        return df.apply(pd.to_numeric, errors='coerce')
+
+    async def fetch_price_history(self, symbol: str, days: int = 90) -> pd.DataFrame:
+        return self.load_history(symbol, days)
+
+    async def fetch_price_histories(self, symbols: List[str], days: int = 90) -> Dict[str, pd.DataFrame]:
+        return {symbol: self.load_history(symbol, days) for symbol in symbols}
+
+
+def write_checkpoints(checkpoint_dir: str, symbols: List[str], variants: List[str]):
+    """Write randomly initialized checkpoints so every symbol has a servable model"""
+    from app.models.crypto_lstm import build_model
+    from app.training.trainer import TRAINING_CONFIG, atomic_torch_save
+
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    torch.manual_seed(0)
+    config = dict(TRAINING_CONFIG)
+
+    for symbol in symbols:
+        for variant in variants:
+            model = build_model(config, input_size=config['input_size'])
+            atomic_torch_save({
+                'epoch': 0,
+                'model_state_dict': model.state_dict(),
+                'best_val_loss': 1.0,
+                'best_val_accuracy': 0.5,
+                'config': config,
+                'metadata': {'model_version': 'benchmark'}
+            }, os.path.join(checkpoint_dir, f"{symbol}_{variant}.pth"))
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    """Parse 'name;dur=1.2, other;dur=3.4' into {name: ms}"""
+    stages = {}
+    for entry in (header or '').split(','):
+        name, _, duration = entry.strip().partition(';dur=')
+        if name and duration:
+            stages[name] = float(duration)
+    return stages
+
+
+def summarize(latencies: List[float], errors: int, wall_seconds: float, stages: List[Dict[str, float]]) -> Dict:
+    """Throughput, latency percentiles (ms) and mean stage breakdown of one run"""
+    ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    stage_names = sorted({name for s in stages for name in s if name != 'total'})
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': len(latencies) / wall_seconds if wall_seconds > 0 else 0.0,
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max()),
+        'stage_mean_ms': {name: float(np.mean([s.get(name, 0.0) for s in stages])) for name in stage_names}
+    }
+
+
+async def drive(client: httpx.AsyncClient, endpoint: str, symbols: List[str], concurrency: int) -> Dict:
+    """
+    Send one request per entry of `symbols` with at most `concurrency` in flight
+
+    Returns:
+        Dict with 'latencies' (seconds), 'errors', 'wall_seconds' and 'stages'
+        (parsed Server-Timing of each successful request)
+    """
+    path, payload = ENDPOINTS[endpoint]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, stages = [], []
+    errors = 0
+
+    async def one(symbol: str):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(path, json=payload(symbol))
+            elapsed = time.perf_counter() - start
+        if response.status_code != 200:
+            errors += 1
+            return
+        latencies.append(elapsed)
+        stages.append(parse_server_timing(response.headers.get('server-timing')))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(symbol) for symbol in symbols))
+    return {'latencies': latencies, 'errors': errors, 'wall_seconds': time.perf_counter() - start, 'stages': stages}
+
+
+def summarize_runs(runs: List[Dict]) -> Dict:
+    """Pool the raw samples of one or more runs into a summary"""
+    return summarize(
+        [latency for run in runs for latency in run['latencies']],
+        sum(run['errors'] for run in runs),
+        sum(run['wall_seconds'] for run in runs),
+        [stage for run in runs for stage in run['stages']]
+    )
+
+
+def reset_caches(main, redis_client, symbols: List[str], models: bool):
+    """Drop response caches (and optionally in-memory models) for the benchmark symbols"""
+    from app.utils.risk_materializer import RISK_TABLE_KEY
+
+    for symbol in symbols:
+        main.invalidate_prediction_cache(symbol)
+        redis_client.delete(main.get_cache_key(symbol, '7d', 'risk_score'))
+    redis_client.hdel(RISK_TABLE_KEY, *symbols)
+
+    if models:
+        main.model_cache.clear()
+        main.variant_model_cache.clear()
+        main.checkpoint_versions.clear()
+        main.stateful_cache.invalidate()
+
+
+def set_redis(main, client):
+    """Point the service (and its risk materializer) at a Redis client"""
+    main.redis_client = client
+    main.risk_materializer.redis_client = client
+    main.temporal_ensemble.history.redis_client = client
+
+
+async def run_benchmark(main, redis_client, symbols: List[str], args) -> Dict:
+    """Run every scenario for every endpoint"""
+    transport = httpx.ASGITransport(app=main.app)
+    results = {scenario: {} for scenario in SCENARIOS}
+
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=300) as client:
+        workload = [symbols[i % len(symbols)] for i in range(args.requests)]
+
+        for endpoint in args.endpoints:
+            # Cold: every round starts without models or cached responses
+            cold_runs = []
+            for _ in range(args.cold_rounds):
+                set_redis(main, redis_client)
+                reset_caches(main, redis_client, symbols, models=True)
+                cold_runs.append(await drive(client, endpoint, symbols, args.concurrency))
+            results['cold'][endpoint] = summarize_runs(cold_runs)
+
+            # Warm: models loaded, cache writes dropped so every request computes
+            reset_caches(main, redis_client, symbols, models=False)
+            set_redis(main, WriteDroppingRedis(redis_client))
+            results['warm'][endpoint] = summarize_runs([await drive(client, endpoint, workload, args.concurrency)])
+
+            # Cache hit: prime one response per symbol, then measure
+            set_redis(main, redis_client)
+            await drive(client, endpoint, symbols, args.concurrency)
+            results['cache_hit'][endpoint] = summarize_runs([await drive(client, endpoint, workload, args.concurrency)])
+
+            for scenario in SCENARIOS:
+                r = results[scenario][endpoint]
+                print(f"{endpoint:<11} {scenario:<10} {r['throughput_rps']:8.1f} req/s  "
+                      f"p50 {r['p50_ms']:8.2f}ms  p95 {r['p95_ms']:8.2f}ms  p99 {r['p99_ms']:8.2f}ms  "
+                      f"errors {r['errors']}")
+
+    return results
+
+
+def compare_to_baseline(results: Dict, baseline_path: str):
+    """Print latency and throughput ratios against a previous results file"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+
+    print(f"\nComparison to {baseline_path} (current / baseline):")
+    for scenario, endpoints in results.items():
+        for endpoint, current in endpoints.items():
+            previous = baseline.get(scenario, {}).get(endpoint)
+            if not previous or not previous['p50_ms'] or not previous['throughput_rps']:
+                continue
+            print(f"{endpoint:<11} {scenario:<10} p50 {current['p50_ms'] / previous['p50_ms']:5.2f}x  "
+                  f"p95 {current['p95_ms'] / max(previous['p95_ms'], 1e-9):5.2f}x  "
+                  f"throughput {current['throughput_rps'] / previous['throughput_rps']:5.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end ml-service benchmark')
+    parser.add_argument('--concurrency', type=int, default=4, help='Requests in flight (default: 4)')
+    parser.add_argument('--requests', type=int, default=100, help='Requests per warm/cache-hit run (default: 100)')
+    parser.add_argument('--cold-rounds', type=int, default=2, help='Cold passes over all symbols (default: 2)')
+    parser.add_argument('--symbols', type=str, nargs='+', default=None, help='Symbols (default: all supported)')
+    parser.add_argument('--endpoints', type=str, nargs='+', default=list(ENDPOINTS), choices=list(ENDPOINTS),
+                        help='Endpoints to drive (default: all)')
+    parser.add_argument('--history-days', type=int, default=150, help='Days of synthetic history to seed (default: 150)')
+    parser.add_argument('--database-url', type=str, default=None, help='Use this database instead of the SQLite stand-in')
+    parser.add_argument('--redis-url', type=str, default=None, help='Use this Redis instead of the in-process stand-in')
+    parser.add_argument('--output', type=str, default=None, help='JSON output file (default: models/benchmark/e2e_<time>.json)')
+    parser.add_argument('--baseline', type=str, default=None, help='Previous results file to compare against')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='ml-bench-')
+    checkpoint_dir = os.path.join(workdir, 'checkpoints')
+
+    # Service configuration is read at import time
+    os.environ['MODEL_CHECKPOINT_DIR'] = checkpoint_dir
+    os.environ.setdefault('MODEL_RELOAD_INTERVAL', '0')
+    os.environ.setdefault('RISK_MATERIALIZE_INTERVAL', '0')
+    os.environ.setdefault('SLOW_REQUEST_SECONDS', '0')
+    os.environ.setdefault('PREDICTION_LOG_DIR', os.path.join(workdir, 'predictions'))
+    if args.database_url:
+        os.environ['DATABASE_URL'] = args.database_url
+
+    import redis
+    import app.main as service
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    symbols = [s.upper() for s in (args.symbols or service.SUPPORTED_SYMBOLS)]
+
+    print("🔧 Writing benchmark checkpoints...")
+    write_checkpoints(checkpoint_dir, symbols, service.ENSEMBLE_MODEL_VARIANTS)
+
+    if args.database_url:
+        database = args.database_url.split('@')[-1]
+    else:
+        store = SQLitePriceStore(os.path.join(workdir, 'prices.db'))
+        print(f"🔧 Seeding SQLite stand-in with {args.history_days} days x {len(symbols)} symbols...")
+        store.seed(symbols, args.history_days)
+        service.fetch_price_history = store.fetch_price_history
+        service.fetch_price_histories = store.fetch_price_histories
+        database = 'sqlite'
+
+    redis_client = redis.Redis.from_url(args.redis_url) if args.redis_url else InMemoryRedis()
+
+    print(f"🚀 Benchmarking {', '.join(args.endpoints)} (concurrency {args.concurrency})\n")
+    results = asyncio.run(run_benchmark(service, redis_client, symbols, args))
+
+    report = {
+        'created_at': datetime.utcnow().isoformat() + 'Z',
+        'config': {
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'cold_rounds': args.cold_rounds,
+            'symbols': symbols,
+            'history_days': args.history_days,
+            'database': database,
+            'redis': 'external' if args.redis_url else 'in-process',
+            'stateful_inference': service.STATEFUL_INFERENCE
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'torch': torch.__version__,
+            'torch_threads': torch.get_num_threads(),
+            'machine': platform.machine()
+        },
+        'results': results
+    }
+
+    output = args.output or os.path.join('models', 'benchmark', f"e2e_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results saved to {output}")
+
+    if args.baseline:
+        compare_to_baseline(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Checkpoint Conversion Script
+Converts a stacked CryptoLSTM checkpoint into a fused-architecture checkpoint
+
+Only checkpoints trained with equal hidden sizes (e.g. [128, 128, 128]) can be
+converted exactly; the converted model produces the same outputs.
+
+Usage:
+    python scripts/convert_to_fused.py models/checkpoints/BTC_best.pth models/checkpoints/BTC_fused.pth
+"""
+
+import sys
+import os
+import argparse
+
+import torch
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import build_model, convert_stacked_to_fused
+from app.training.trainer import atomic_torch_save
+
+
+def convert_checkpoint(src_path: str, dst_path: str, input_size: int = 20) -> float:
+    """
+    Convert a stacked checkpoint to the fused architecture
+
+    Args:
+        src_path: Source checkpoint (config['architecture'] == 'stacked')
+        dst_path: Destination checkpoint path
+        input_size: Number of input features
+
+    Returns:
+        Max absolute output difference between the two models on random input
+    """
+    checkpoint = torch.load(src_path, map_location='cpu')
+    config = dict(checkpoint.get('config') or {})
+
+    if config.get('architecture', 'stacked') != 'stacked':
+        raise ValueError(f"{src_path} is not a stacked checkpoint")
+
+    stacked = build_model(config, input_size=input_size)
+    stacked.load_state_dict(checkpoint['model_state_dict'])
+    stacked.eval()
+
+    fused = convert_stacked_to_fused(stacked)
+    fused.eval()
+
+    # Verify the conversion on random input
+    x = torch.randn(8, config.get('sequence_length', 90), input_size)
+    with torch.no_grad():
+        max_diff = (stacked(x) - fused(x)).abs().max().item()
+
+    config['architecture'] = 'fused'
+    converted = dict(checkpoint)
+    converted['config'] = config
+    converted['model_state_dict'] = fused.state_dict()
+    # Optimizer state refers to the old parameter layout
+    converted.pop('optimizer_state_dict', None)
+
+    atomic_torch_save(converted, dst_path)
+
+    return max_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert a stacked CryptoLSTM checkpoint to fused')
+    parser.add_argument('src', help='Source checkpoint path')
+    parser.add_argument('dst', help='Destination checkpoint path')
+    args = parser.parse_args()
+
+    max_diff = convert_checkpoint(args.src, args.dst)
+    print(f"✅ Converted {args.src} -> {args.dst}")
+    print(f"   Max output difference: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
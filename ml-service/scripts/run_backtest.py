@@ -0,0 +1,155 @@
+"""
+Walk-Forward Backtest Script
+Replays local price history through stored checkpoints and reports accuracy,
+rolling accuracy and calibration per symbol and horizon
+
+History comes from a local OHLCV file (--ohlcv, CSV or parquet) or from the
+local feature store; no network or database access is needed. With
+--publish the report is written next to each checkpoint
+({checkpoint}_backtest.json), where the API reads historicalAccuracy from
+on the next model load.
+
+Usage:
+    python scripts/run_backtest.py --symbols BTC ETH --ohlcv data/prices.csv
+    python scripts/run_backtest.py --symbols BTC --start 2025-01-01 --publish
+    python scripts/run_backtest.py --symbols BTC ETH SOL --global-model --predictions-dir backtests/days
+"""
+
+import sys
+import os
+import json
+import logging
+import argparse
+from datetime import datetime
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import GLOBAL_MODEL_NAME
+from app.training.backtest import (
+    BACKTEST_HORIZONS,
+    INFERENCE_BATCH_SIZE,
+    backtest_checkpoint,
+    load_ohlcv_file,
+    publish_report
+)
+from app.utils.feature_store import FeatureStore
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def load_frames(symbols, ohlcv_path=None, store_dir=None):
+    """OHLCV history by symbol from a local file or the feature store"""
+    frames = {}
+    store = None if ohlcv_path else FeatureStore(store_dir)
+
+    for symbol in symbols:
+        if ohlcv_path:
+            df = load_ohlcv_file(ohlcv_path, symbol)
+        else:
+            df = store.read_ohlcv(symbol)
+
+        if df.empty:
+            logger.warning(f"⚠️  No history for {symbol}, skipping")
+            continue
+        frames[symbol] = df
+
+    return frames
+
+
+def print_summary(report):
+    """Print one line per symbol and horizon"""
+    print(f"\n{'symbol':<8} {'horizon':<8} {'days':>6} {'accuracy':>9} {'last30':>8} {'last90':>8} {'ECE':>7} {'Brier':>7}")
+    for symbol, result in report['symbols'].items():
+        for timeframe, summary in result['horizons'].items():
+            last30 = summary['accuracy_last_30']
+            last90 = summary['accuracy_last_90']
+            print(f"{symbol:<8} {timeframe:<8} {summary['samples']:>6} {summary['accuracy']:>9.2%} "
+                  f"{f'{last30:.2%}' if last30 is not None else '-':>8} "
+                  f"{f'{last90:.2%}' if last90 is not None else '-':>8} "
+                  f"{summary['expected_calibration_error']:>7.3f} {summary['brier_score']:>7.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Walk-forward backtest of stored CryptoLSTM checkpoints')
+    parser.add_argument('--symbols', nargs='+', default=['BTC'], help='Symbols to backtest (default: BTC)')
+    parser.add_argument('--ohlcv', type=str, default=None,
+                        help='Local OHLCV file (.csv/.parquet); multi-symbol files need a symbol column')
+    parser.add_argument('--store-dir', type=str, default=None, help='Feature store root when --ohlcv is not given')
+    parser.add_argument('--checkpoint-dir', type=str, default='models/checkpoints', help='Checkpoint directory')
+    parser.add_argument('--variant', type=str, default='best', help='Checkpoint variant: {symbol}_{variant}.pth (default: best)')
+    parser.add_argument('--global-model', action='store_true', help=f'Backtest {GLOBAL_MODEL_NAME}_best.pth for all symbols')
+    parser.add_argument('--horizons', nargs='+', type=int, default=BACKTEST_HORIZONS, help='Horizons in days (default: 7 14 30)')
+    parser.add_argument('--sequence-length', type=int, default=None, help="Window length (default: checkpoint's training config)")
+    parser.add_argument('--start', type=str, default=None, help='Only score days from this date (e.g. after the training cutoff)')
+    parser.add_argument('--end', type=str, default=None, help='Only score days up to this date')
+    parser.add_argument('--batch-size', type=int, default=INFERENCE_BATCH_SIZE, help='Windows per forward pass')
+    parser.add_argument('--publish', action='store_true', help='Write each report next to its checkpoint for the API')
+    parser.add_argument('--predictions-dir', type=str, default=None, help='Also write per-day predictions as CSV files')
+    parser.add_argument('--output', type=str, default=None, help='JSON output file (default: models/backtest/backtest_<time>.json)')
+    args = parser.parse_args()
+
+    frames = load_frames(args.symbols, args.ohlcv, args.store_dir)
+    if not frames:
+        logger.error("❌ No price history to backtest")
+        sys.exit(1)
+
+    # One checkpoint for all symbols (global model) or one per symbol
+    if args.global_model:
+        jobs = {os.path.join(args.checkpoint_dir, f"{GLOBAL_MODEL_NAME}_best.pth"): frames}
+    else:
+        jobs = {
+            os.path.join(args.checkpoint_dir, f"{symbol}_{args.variant}.pth"): {symbol: df}
+            for symbol, df in frames.items()
+        }
+
+    reports = []
+    for checkpoint_path, checkpoint_frames in jobs.items():
+        if not os.path.exists(checkpoint_path):
+            logger.warning(f"⚠️  Checkpoint not found: {checkpoint_path}")
+            continue
+
+        logger.info(f"Backtesting {checkpoint_path} on {', '.join(checkpoint_frames)}...")
+        report = backtest_checkpoint(
+            checkpoint_path,
+            checkpoint_frames,
+            horizons=args.horizons,
+            sequence_length=args.sequence_length,
+            start=pd.Timestamp(args.start) if args.start else None,
+            end=pd.Timestamp(args.end) if args.end else None,
+            batch_size=args.batch_size,
+            return_predictions=bool(args.predictions_dir)
+        )
+
+        if args.predictions_dir:
+            os.makedirs(args.predictions_dir, exist_ok=True)
+            for symbol, result in report['symbols'].items():
+                for timeframe, predictions in result.pop('predictions').items():
+                    predictions.to_csv(os.path.join(args.predictions_dir, f"{symbol}_{timeframe}.csv"), index_label='timestamp')
+
+        if args.publish:
+            logger.info(f"📄 Published {publish_report(report, checkpoint_path)}")
+
+        print_summary(report)
+        reports.append(report)
+
+    if not reports:
+        logger.error("❌ No checkpoint could be backtested")
+        sys.exit(1)
+
+    output = args.output or os.path.join('models', 'backtest', f"backtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(reports, f, indent=2)
+    print(f"\n📄 Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Hyperparameter Sweep Script
+Runs a grid or random search over CryptoLSTM hyperparameters and writes a
+ranked leaderboard (leaderboard.json / leaderboard.csv)
+
+Usage:
+    python scripts/run_sweep.py --assets BTC ETH --mode random --trials 12 --workers 8
+"""
+
+import sys
+import os
+import json
+import asyncio
+import logging
+import argparse
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.train_initial_models import load_historical_data
+from app.training.trainer import TRAINING_CONFIG, IMPROVED_TRAINING_CONFIG
+from app.training.sweep import SEARCH_SPACE, PRUNING_CONFIG, generate_trials, run_sweep
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Run a CryptoLSTM hyperparameter sweep')
+    parser.add_argument('--assets', nargs='+', default=['BTC'], help='Assets to sweep (default: BTC)')
+    parser.add_argument('--mode', choices=['grid', 'random'], default='grid', help='Search mode (default: grid)')
+    parser.add_argument('--trials', type=int, default=None, help='Number of random trials / grid cap')
+    parser.add_argument('--space', type=str, default=None, help='JSON file overriding the search space')
+    parser.add_argument('--base', choices=['default', 'improved'], default='default', help='Base training config')
+    parser.add_argument('--epochs', type=int, default=None, help='Override max epochs per trial')
+    parser.add_argument('--historical-days', type=int, default=1095, help='Days of history (default: 1095)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--threads-per-worker', type=int, default=None, help='torch threads per worker')
+    parser.add_argument('--no-prune', action='store_true', help='Disable median-stopping pruning')
+    parser.add_argument('--output-dir', type=str, default='sweeps/latest', help='Output directory')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    space = SEARCH_SPACE
+    if args.space:
+        with open(args.space) as f:
+            space = json.load(f)
+
+    base_config = (IMPROVED_TRAINING_CONFIG if args.base == 'improved' else TRAINING_CONFIG).copy()
+    if args.epochs:
+        base_config['epochs'] = args.epochs
+
+    pruning_config = dict(PRUNING_CONFIG, enabled=not args.no_prune)
+
+    trials = generate_trials(space, mode=args.mode, num_trials=args.trials, seed=args.seed)
+    logger.info(f"Generated {len(trials)} trials ({args.mode})")
+
+    frames = {}
+    for symbol in args.assets:
+        frames[symbol] = await load_historical_data(symbol, args.historical_days)
+
+    sweep = run_sweep(
+        frames,
+        trials,
+        output_dir=args.output_dir,
+        base_config=base_config,
+        max_workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        pruning_config=pruning_config,
+        seed=args.seed
+    )
+
+    logger.info(f"\n{'#'*80}")
+    logger.info(f"SWEEP LEADERBOARD (top 5)")
+    logger.info(f"{'#'*80}")
+    for row in sweep['leaderboard'][:5]:
+        logger.info(
+            f"  #{row['rank']}: val_loss={row['mean_best_val_loss']:.4f} "
+            f"val_acc={row['mean_best_val_accuracy']:.2%} params={row['params']}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -14,14 +14,28 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the original training script components
-from scripts.train_initial_models import train_model_for_asset, save_training_summary, fetch_historical_data_cryptocompare
+from scripts.train_initial_models import (
+    train_model_for_asset,
+    save_training_summary,
+    fetch_historical_data_cryptocompare,
+    load_historical_data
+)
+import copy
 import asyncio
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import numpy as np
 
-from app.models.crypto_lstm import CryptoLSTM
-from app.training.trainer import IMPROVED_TRAINING_CONFIG
+from app.models.crypto_lstm import build_model
+from app.training.trainer import (
+    IMPROVED_TRAINING_CONFIG,
+    precision_comparison,
+    train_precision_reference
+)
+from app.training.orchestrator import train_assets_parallel
+from app.utils.feature_store import FeatureStore
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +57,7 @@ IMPROVED_TRAINING_PARAMS = {
     'sequence_length': 90,
     'historical_days': 1095,  # 3 years instead of 2
     'prediction_horizon': 7,
+    'use_feature_store': True,
 }
 
 
@@ -51,27 +66,33 @@ def create_improved_model(input_size: int = 20):
     hidden_sizes = IMPROVED_TRAINING_CONFIG['hidden_sizes']
     dropout = IMPROVED_TRAINING_CONFIG['dropout']
 
-    model = CryptoLSTM(
-        input_size=input_size,
-        hidden_sizes=hidden_sizes,
-        dropout=dropout
-    )
+    model = build_model(IMPROVED_TRAINING_CONFIG, input_size=input_size)
 
     num_params = model.get_num_parameters()
     logger.info(f"✨ Improved CryptoLSTM model created:")
     logger.info(f"  - Parameters: {num_params:,}")
-    logger.info(f"  - Architecture: {hidden_sizes}")
+    logger.info(f"  - Architecture: {IMPROVED_TRAINING_CONFIG.get('architecture', 'stacked')} {hidden_sizes}")
     logger.info(f"  - Dropout: {dropout}")
 
     return model
 
 
-async def train_improved_model(symbol: str) -> Dict:
+async def train_improved_model(
+    symbol: str,
+    precision: str = 'fp32',
+    compare_precision: bool = False,
+    resume: bool = False,
+    use_feature_store: bool = True
+) -> Dict:
     """
     Train a model with improved hyperparameters
 
     Args:
         symbol: Cryptocurrency symbol
+        precision: Training precision ('fp32', 'bf16' or 'fp16')
+        compare_precision: Also train an fp32 reference and record speedup/accuracy delta
+        resume: Continue from the last training state snapshot if one exists
+        use_feature_store: Reuse stored OHLCV/features (False refetches everything)
 
     Returns:
         Training results dictionary
@@ -93,41 +114,43 @@ async def train_improved_model(symbol: str) -> Dict:
     try:
         from app.utils.feature_engineering import (
             engineer_features,
-            create_labels,
-            create_sequences,
+            build_dataset,
             split_time_series_data
         )
         from app.training.trainer import ModelTrainer
 
         # Step 1: Fetch 3 years of historical data
         logger.info(f"Fetching {IMPROVED_TRAINING_PARAMS['historical_days']} days of historical data for {symbol}...")
-        df = await fetch_historical_data_cryptocompare(
-            symbol,
-            days=IMPROVED_TRAINING_PARAMS['historical_days']
-        )
+        if use_feature_store:
+            store = FeatureStore()
+            df = await load_historical_data(symbol, IMPROVED_TRAINING_PARAMS['historical_days'], store)
+        else:
+            store = None
+            df = await fetch_historical_data_cryptocompare(
+                symbol,
+                days=IMPROVED_TRAINING_PARAMS['historical_days']
+            )
 
         if len(df) < 200:
             raise ValueError(f"Insufficient data: {len(df)} days")
 
         # Step 2: Engineer features
         logger.info(f"Engineering features for {symbol}...")
-        features = engineer_features(df)
+        if store is not None and not df.attrs.get('synthetic'):
+            features = store.get_or_build_features(symbol, df)
+        else:
+            features = engineer_features(df)
         logger.info(f"✅ Engineered {len(features.columns)} features")
 
-        # Step 3: Create labels
-        logger.info(f"Creating labels (7-day prediction horizon)...")
-        labels = create_labels(features, horizon=IMPROVED_TRAINING_PARAMS['prediction_horizon'])
-        logger.info(f"✅ Created {len(labels)} labels")
-        logger.info(f"   Distribution: {labels.value_counts().to_dict()}")
-
-        # Step 4: Create sequences
-        logger.info(f"Creating sequences (90-day lookback)...")
-        X, y = create_sequences(
+        # Step 3-4: Create labels and sequences in one vectorized pass
+        logger.info(f"Creating labels and sequences (7-day prediction horizon, 90-day lookback)...")
+        X, y, _ = build_dataset(
             features,
-            labels,
+            horizon=IMPROVED_TRAINING_PARAMS['prediction_horizon'],
             sequence_length=IMPROVED_TRAINING_PARAMS['sequence_length']
         )
         logger.info(f"✅ Created sequences: X={X.shape}, y={y.shape}")
+        logger.info(f"   Distribution: {dict(zip(*np.unique(y, return_counts=True)))}")
 
         # Step 5: Normalize features
         logger.info(f"Normalizing features...")
@@ -155,6 +178,10 @@ async def train_improved_model(symbol: str) -> Dict:
         # Step 7: Create improved model
         logger.info(f"Creating improved LSTM model...")
         model = create_improved_model(input_size=20)
+        config = dict(IMPROVED_TRAINING_CONFIG, precision=precision)
+
+        # Keep the untrained weights so an fp32 reference starts from the same point
+        initial_model = copy.deepcopy(model) if compare_precision and precision != 'fp32' else None
 
         # Step 8: Create trainer with improved config
         logger.info(f"Creating trainer with improved configuration...")
@@ -163,7 +190,7 @@ async def train_improved_model(symbol: str) -> Dict:
         logger.info(f"  - Scheduler factor: 0.5x")
         trainer = ModelTrainer(
             model=model,
-            config=IMPROVED_TRAINING_CONFIG,
+            config=config,
             use_mlflow=False
         )
 
@@ -175,7 +202,8 @@ async def train_improved_model(symbol: str) -> Dict:
             X_val=X_val,
             y_val=y_val,
             symbol=symbol,
-            verbose=True
+            verbose=True,
+            resume=resume
         )
 
         # Step 10: Evaluate on test set
@@ -191,6 +219,15 @@ async def train_improved_model(symbol: str) -> Dict:
         logger.info(f"   Neutral Accuracy: {test_metrics['neutral_accuracy']:.4f}")
         logger.info(f"   Bullish Accuracy: {test_metrics['bullish_accuracy']:.4f}")
 
+        # Step 11: Optional fp32 reference for the precision speedup/accuracy delta
+        comparison = None
+        if initial_model is not None:
+            logger.info(f"Training fp32 reference for {results['precision']} comparison...")
+            reference = train_precision_reference(initial_model, config, X_train, y_train, X_val, y_val, symbol)
+            comparison = precision_comparison(reference, results)
+            logger.info(f"✅ {results['precision']} speedup: {comparison['speedup']:.2f}x, "
+                        f"val accuracy delta: {comparison['accuracy_delta']:+.2%}")
+
         # Calculate training time
         training_time = (datetime.now() - start_time).total_seconds()
 
@@ -217,6 +254,10 @@ async def train_improved_model(symbol: str) -> Dict:
             'epochs_trained': results['epochs_trained'],
             'early_stopped': results['early_stopped'],
             'training_time_seconds': training_time,
+            'precision': results['precision'],
+            'mean_epoch_seconds': results['mean_epoch_seconds'],
+            'throughput': results['throughput'],
+            'precision_comparison': comparison,
             'model_parameters': model.get_num_parameters(),
             'checkpoint_path': f"models/checkpoints/{symbol}_best.pth",
             'timestamp': datetime.now().isoformat()
@@ -248,8 +289,27 @@ async def train_improved_model(symbol: str) -> Dict:
         }
 
 
-async def train_all_improved_models(assets: List[str]) -> List[Dict]:
-    """Train improved models for all specified assets"""
+async def train_all_improved_models(
+    assets: List[str],
+    workers: int = 1,
+    threads_per_worker: Optional[int] = None,
+    precision: str = 'fp32',
+    compare_precision: bool = False,
+    resume: bool = False,
+    use_feature_store: bool = True
+) -> List[Dict]:
+    """
+    Train improved models for all specified assets
+
+    Args:
+        assets: Assets to train
+        workers: Number of parallel worker processes (1 = sequential)
+        threads_per_worker: torch thread budget per worker (default: CPUs / workers)
+        precision: Training precision ('fp32', 'bf16' or 'fp16')
+        compare_precision: Also train fp32 references and record speedup/accuracy delta
+        resume: Continue interrupted runs from their last state snapshots
+        use_feature_store: Reuse stored OHLCV/features (passed to every worker)
+    """
     logger.info(f"\n{'#'*80}")
     logger.info(f"🚀 IMPROVED MODEL TRAINING SESSION")
     logger.info(f"{'#'*80}")
@@ -263,18 +323,38 @@ async def train_all_improved_models(assets: List[str]) -> List[Dict]:
     logger.info(f"  - Max epochs: {IMPROVED_TRAINING_CONFIG['epochs']}")
     logger.info(f"  - Early stopping patience: {IMPROVED_TRAINING_CONFIG['early_stopping_patience']}")
     logger.info(f"  - Learning rate scheduling: ENABLED")
+    logger.info(f"  - Precision: {precision}")
     logger.info(f"{'#'*80}\n")
 
     all_results = []
 
-    for i, symbol in enumerate(assets, 1):
-        logger.info(f"\n>>> Training {i}/{len(assets)}: {symbol}")
-
-        result = await train_improved_model(symbol)
-        all_results.append(result)
-
-        if i < len(assets):
-            await asyncio.sleep(2)
+    if workers > 1 and len(assets) > 1:
+        all_results = await asyncio.to_thread(
+            train_assets_parallel,
+            train_improved_model,
+            assets,
+            max_workers=workers,
+            threads_per_worker=threads_per_worker,
+            precision=precision,
+            compare_precision=compare_precision,
+            resume=resume,
+            use_feature_store=use_feature_store
+        )
+    else:
+        for i, symbol in enumerate(assets, 1):
+            logger.info(f"\n>>> Training {i}/{len(assets)}: {symbol}")
+
+            result = await train_improved_model(
+                symbol,
+                precision=precision,
+                compare_precision=compare_precision,
+                resume=resume,
+                use_feature_store=use_feature_store
+            )
+            all_results.append(result)
+
+            if i < len(assets):
+                await asyncio.sleep(2)
 
     # Summary
     logger.info(f"\n{'#'*80}")
@@ -321,11 +401,55 @@ async def main():
         default=['BTC'],
         help='Assets to train (default: BTC)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Parallel training processes (default: 1, sequential)'
+    )
+    parser.add_argument(
+        '--threads-per-worker',
+        type=int,
+        default=None,
+        help='torch threads per worker (default: CPU count / workers)'
+    )
+    parser.add_argument(
+        '--no-store',
+        action='store_true',
+        help='Bypass the local feature store and refetch all data'
+    )
+    parser.add_argument(
+        '--precision',
+        choices=['fp32', 'bf16', 'fp16'],
+        default='fp32',
+        help='Training precision (default: fp32; bf16 needs a CPU with AVX512-BF16/AMX)'
+    )
+    parser.add_argument(
+        '--compare-precision',
+        action='store_true',
+        help='Also train an fp32 reference and record speedup and accuracy delta'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume interrupted training from models/checkpoints/{symbol}_state.pth'
+    )
 
     args = parser.parse_args()
 
+    # Passed explicitly: spawned workers re-import this module with the defaults
+    use_feature_store = IMPROVED_TRAINING_PARAMS['use_feature_store'] and not args.no_store
+
     # Train all models
-    results = await train_all_improved_models(args.assets)
+    results = await train_all_improved_models(
+        args.assets,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        precision=args.precision,
+        compare_precision=args.compare_precision,
+        resume=args.resume,
+        use_feature_store=use_feature_store
+    )
 
     # Exit with status code
     failed_count = sum(1 for r in results if r['status'] == 'failed')
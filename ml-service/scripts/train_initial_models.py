@@ -12,25 +12,32 @@ This script:
 
 import sys
 import os
+import copy
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.models.crypto_lstm import CryptoLSTM, create_model
-from app.training.trainer import ModelTrainer, TRAINING_CONFIG
+from app.models.crypto_lstm import GLOBAL_MODEL_NAME, CryptoLSTM, add_symbol_column, create_model
+from app.training.trainer import (
+    ModelTrainer,
+    TRAINING_CONFIG,
+    precision_comparison,
+    train_precision_reference
+)
 from app.utils.feature_engineering import (
     engineer_features,
-    create_labels,
-    create_sequences,
+    build_dataset,
     normalize_features,
     split_time_series_data
 )
+from app.utils.feature_store import FeatureStore
+from app.training.orchestrator import train_assets_parallel
 
 # Configure logging
 logging.basicConfig(
@@ -55,6 +62,7 @@ TRAINING_PARAMS = {
     'sequence_length': 90,
     'historical_days': 730,  # 2 years
     'prediction_horizon': 7,  # 7-day predictions
+    'use_feature_store': True,  # Reuse stored OHLCV/features between runs
 }
 
 
@@ -158,16 +166,137 @@ def generate_synthetic_data(symbol: str, days: int) -> pd.DataFrame:
 
     df = df.set_index('timestamp')
 
+    # Flag synthetic data so it never gets persisted to the feature store
+    df.attrs['synthetic'] = True
+
     return df
 
 
-async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
+async def load_historical_data(symbol: str, days: int, store: Optional[FeatureStore] = None) -> pd.DataFrame:
+    """
+    Load historical OHLCV data through the local feature store
+
+    Only the days missing since the last stored candle are fetched from
+    CryptoCompare; everything else is read back from disk.
+
+    Args:
+        symbol: Asset symbol
+        days: Number of days of historical data
+        store: FeatureStore instance (default store if None)
+
+    Returns:
+        DataFrame with the most recent `days` rows
+    """
+    store = store or FeatureStore()
+    last_stored = store.last_timestamp(symbol)
+    stored_rows = len(store.read_ohlcv_arrays(symbol)[0]) if last_stored is not None else 0
+
+    today = pd.Timestamp(datetime.utcnow().date())
+    if stored_rows >= days and last_stored >= today - timedelta(days=1):
+        logger.info(f"✅ Using {days} stored days for {symbol} (up to {last_stored.date()})")
+        return store.read_ohlcv(symbol).tail(days)
+
+    # Fetch only the gap when the stored history is already long enough
+    fetch_days = days
+    if stored_rows >= days:
+        fetch_days = max(2, (today - last_stored).days + 1)
+
+    df = await fetch_historical_data_cryptocompare(symbol, days=fetch_days)
+
+    if df.attrs.get('synthetic'):
+        return df
+
+    store.append_ohlcv(symbol, df)
+    return store.read_ohlcv(symbol).tail(days)
+
+
+async def prepare_asset_data(
+    symbol: str,
+    horizons: Optional[List[int]] = None,
+    use_feature_store: bool = True
+) -> Tuple[pd.DataFrame, pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fetch, engineer and window one asset's history (training steps 1-5)
+
+    Args:
+        symbol: Asset symbol
+        horizons: Multi-horizon labels for these horizons in days
+            (default: TRAINING_PARAMS['prediction_horizon'])
+        use_feature_store: Reuse stored OHLCV/features (False refetches everything)
+
+    Returns:
+        Tuple of (price history, features, X, X_normalized, y)
+    """
+    # Step 1: Fetch historical data
+    if use_feature_store:
+        store = FeatureStore()
+        df = await load_historical_data(symbol, TRAINING_PARAMS['historical_days'], store)
+    else:
+        store = None
+        df = await fetch_historical_data_cryptocompare(
+            symbol,
+            days=TRAINING_PARAMS['historical_days']
+        )
+
+    if len(df) < TRAINING_PARAMS['sequence_length'] + 50:
+        raise ValueError(f"Insufficient data: {len(df)} days (need at least {TRAINING_PARAMS['sequence_length'] + 50})")
+
+    # Step 2: Engineer features
+    logger.info(f"Engineering features for {symbol}...")
+    if store is not None and not df.attrs.get('synthetic'):
+        features = store.get_or_build_features(symbol, df)
+    else:
+        features = engineer_features(df)
+    logger.info(f"✅ Engineered {len(features.columns)} features")
+    logger.info(f"   Features: {', '.join(features.columns.tolist())}")
+
+    # Step 3-4: Create labels and sequences in one vectorized pass
+    horizon = horizons or TRAINING_PARAMS['prediction_horizon']
+    logger.info(f"Creating labels and sequences ({horizon}-day prediction horizon, 90-day lookback)...")
+    X, y, _ = build_dataset(
+        features,
+        horizon=horizon,
+        sequence_length=TRAINING_PARAMS['sequence_length']
+    )
+    logger.info(f"✅ Created sequences: X={X.shape}, y={y.shape}")
+    logger.info(f"   Distribution: {dict(zip(*np.unique(y, return_counts=True)))}")
+
+    # Step 5: Normalize features
+    logger.info(f"Normalizing features...")
+    X_normalized = X.copy()
+    # Normalize each feature across the time dimension
+    for i in range(X.shape[2]):  # For each feature
+        feature_data = X[:, :, i].reshape(-1)
+        mean = feature_data.mean()
+        std = feature_data.std()
+        if std > 0:
+            X_normalized[:, :, i] = (X[:, :, i] - mean) / std
+    logger.info(f"✅ Features normalized")
+
+    return df, features, X, X_normalized, y
+
+
+async def train_model_for_asset(
+    symbol: str,
+    use_mlflow: bool = False,
+    precision: str = 'fp32',
+    compare_precision: bool = False,
+    resume: bool = False,
+    horizons: Optional[List[int]] = None,
+    use_feature_store: bool = True
+) -> Dict:
     """
     Train LSTM model for a single asset
 
     Args:
         symbol: Asset symbol (BTC, ETH, SOL)
         use_mlflow: Whether to use MLflow tracking
+        precision: Training precision ('fp32', 'bf16' or 'fp16')
+        compare_precision: Also train an fp32 reference and record speedup/accuracy delta
+        resume: Continue from the last training state snapshot if one exists
+        horizons: Train one multi-horizon model for these horizons in days
+            (default: single TRAINING_PARAMS['prediction_horizon'] model)
+        use_feature_store: Reuse stored OHLCV/features (False refetches everything)
 
     Returns:
         Training results dictionary
@@ -179,47 +308,8 @@ async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
     start_time = datetime.now()
 
     try:
-        # Step 1: Fetch historical data
-        df = await fetch_historical_data_cryptocompare(
-            symbol,
-            days=TRAINING_PARAMS['historical_days']
-        )
-
-        if len(df) < TRAINING_PARAMS['sequence_length'] + 50:
-            raise ValueError(f"Insufficient data: {len(df)} days (need at least {TRAINING_PARAMS['sequence_length'] + 50})")
-
-        # Step 2: Engineer features
-        logger.info(f"Engineering features for {symbol}...")
-        features = engineer_features(df)
-        logger.info(f"✅ Engineered {len(features.columns)} features")
-        logger.info(f"   Features: {', '.join(features.columns.tolist())}")
-
-        # Step 3: Create labels
-        logger.info(f"Creating labels (7-day prediction horizon)...")
-        labels = create_labels(features, horizon=TRAINING_PARAMS['prediction_horizon'])
-        logger.info(f"✅ Created {len(labels)} labels")
-        logger.info(f"   Distribution: {labels.value_counts().to_dict()}")
-
-        # Step 4: Create sequences
-        logger.info(f"Creating sequences (90-day lookback)...")
-        X, y = create_sequences(
-            features,
-            labels,
-            sequence_length=TRAINING_PARAMS['sequence_length']
-        )
-        logger.info(f"✅ Created sequences: X={X.shape}, y={y.shape}")
-
-        # Step 5: Normalize features
-        logger.info(f"Normalizing features...")
-        X_normalized = X.copy()
-        # Normalize each feature across the time dimension
-        for i in range(X.shape[2]):  # For each feature
-            feature_data = X[:, :, i].reshape(-1)
-            mean = feature_data.mean()
-            std = feature_data.std()
-            if std > 0:
-                X_normalized[:, :, i] = (X[:, :, i] - mean) / std
-        logger.info(f"✅ Features normalized")
+        # Steps 1-5: Fetch data, engineer features, build and normalize sequences
+        df, features, X, X_normalized, y = await prepare_asset_data(symbol, horizons, use_feature_store)
 
         # Step 6: Split data
         logger.info(f"Splitting data (70/15/15)...")
@@ -235,14 +325,20 @@ async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
 
         # Step 7: Create model
         logger.info(f"Creating LSTM model...")
-        model = create_model(input_size=20)
+        config = dict(TRAINING_CONFIG, precision=precision)
+        if horizons:
+            config.update(architecture='multi_horizon', horizons=list(horizons))
+        model = create_model(input_size=20, config=config)
         logger.info(f"✅ Model created with {model.get_num_parameters():,} parameters")
 
+        # Keep the untrained weights so an fp32 reference starts from the same point
+        initial_model = copy.deepcopy(model) if compare_precision and precision != 'fp32' else None
+
         # Step 8: Create trainer
         logger.info(f"Creating trainer with early stopping (patience=10)...")
         trainer = ModelTrainer(
             model=model,
-            config=TRAINING_CONFIG,
+            config=config,
             use_mlflow=use_mlflow
         )
 
@@ -254,7 +350,8 @@ async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
             X_val=X_val,
             y_val=y_val,
             symbol=symbol,
-            verbose=True
+            verbose=True,
+            resume=resume
         )
 
         # Step 10: Evaluate on test set
@@ -270,6 +367,15 @@ async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
         logger.info(f"   Neutral Accuracy: {test_metrics['neutral_accuracy']:.4f}")
         logger.info(f"   Bullish Accuracy: {test_metrics['bullish_accuracy']:.4f}")
 
+        # Step 11: Optional fp32 reference for the precision speedup/accuracy delta
+        comparison = None
+        if initial_model is not None:
+            logger.info(f"Training fp32 reference for {results['precision']} comparison...")
+            reference = train_precision_reference(initial_model, config, X_train, y_train, X_val, y_val, symbol)
+            comparison = precision_comparison(reference, results)
+            logger.info(f"✅ {results['precision']} speedup: {comparison['speedup']:.2f}x, "
+                        f"val accuracy delta: {comparison['accuracy_delta']:+.2%}")
+
         # Calculate training time
         training_time = (datetime.now() - start_time).total_seconds()
 
@@ -290,9 +396,16 @@ async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
             'test_bearish_accuracy': test_metrics['bearish_accuracy'],
             'test_neutral_accuracy': test_metrics['neutral_accuracy'],
             'test_bullish_accuracy': test_metrics['bullish_accuracy'],
+            'test_horizon_accuracy': {
+                key: value for key, value in test_metrics.items() if key.startswith('accuracy_')
+            },
             'epochs_trained': results['epochs_trained'],
             'early_stopped': results['early_stopped'],
             'training_time_seconds': training_time,
+            'precision': results['precision'],
+            'mean_epoch_seconds': results['mean_epoch_seconds'],
+            'throughput': results['throughput'],
+            'precision_comparison': comparison,
             'model_parameters': model.get_num_parameters(),
             'checkpoint_path': f"models/checkpoints/{symbol}_best.pth",
             'timestamp': datetime.now().isoformat()
@@ -322,12 +435,178 @@ async def train_model_for_asset(symbol: str, use_mlflow: bool = False) -> Dict:
         }
 
 
-async def train_all_models(use_mlflow: bool = False) -> List[Dict]:
+async def train_global_model(
+    symbols: List[str],
+    use_mlflow: bool = False,
+    precision: str = 'fp32',
+    resume: bool = False,
+    use_feature_store: bool = True
+) -> Dict:
+    """
+    Train one global model with a symbol embedding on all assets at once
+
+    Each asset is windowed, normalized and split 70/15/15 on its own time
+    axis; the splits are then concatenated so every epoch mixes all assets.
+    The checkpoint is saved as GLOBAL_best.pth and serves every symbol in
+    `symbols` (GLOBAL_MODEL=true in the API).
+
+    Args:
+        symbols: Assets to train on (embedding order)
+        use_mlflow: Whether to use MLflow tracking
+        precision: Training precision ('fp32', 'bf16' or 'fp16')
+        resume: Continue from the last training state snapshot if one exists
+        use_feature_store: Reuse stored OHLCV/features (False refetches everything)
+
+    Returns:
+        Training results dictionary with per-asset test accuracy
+    """
+    logger.info(f"\n{'='*80}")
+    logger.info(f"TRAINING GLOBAL MODEL FOR {', '.join(symbols)}")
+    logger.info(f"{'='*80}\n")
+
+    start_time = datetime.now()
+
+    try:
+        # Steps 1-6 per asset, tagging every window with its symbol index
+        splits = {'train': ([], []), 'val': ([], []), 'test': {}}
+        trained_symbols = []
+        data_points = 0
+
+        for symbol in symbols:
+            try:
+                df, _, _, X_normalized, y = await prepare_asset_data(symbol, use_feature_store=use_feature_store)
+            except Exception as e:
+                logger.warning(f"⚠️  Skipping {symbol} in global model: {e}")
+                continue
+
+            X_symbol = add_symbol_column(X_normalized, len(trained_symbols))
+            trained_symbols.append(symbol)
+            data_points += len(df)
+
+            X_train, X_val, X_test, y_train, y_val, y_test = split_time_series_data(
+                X_symbol, y,
+                train_pct=0.7,
+                val_pct=0.15
+            )
+            splits['train'][0].append(X_train)
+            splits['train'][1].append(y_train)
+            splits['val'][0].append(X_val)
+            splits['val'][1].append(y_val)
+            splits['test'][symbol] = (X_test, y_test)
+
+        if not trained_symbols:
+            raise ValueError("No asset had enough data for the global model")
+
+        X_train, y_train = np.concatenate(splits['train'][0]), np.concatenate(splits['train'][1])
+        X_val, y_val = np.concatenate(splits['val'][0]), np.concatenate(splits['val'][1])
+        logger.info(f"✅ Global dataset: {len(trained_symbols)} assets, "
+                    f"train {len(X_train)}, val {len(X_val)} samples")
+
+        # Step 7: Create model
+        config = dict(TRAINING_CONFIG, precision=precision, architecture='global', symbols=trained_symbols)
+        model = create_model(input_size=20, config=config)
+        logger.info(f"✅ Model created with {model.get_num_parameters():,} parameters")
+
+        # Steps 8-9: Train on all assets at once
+        trainer = ModelTrainer(model=model, config=config, use_mlflow=use_mlflow)
+        results = trainer.train(
+            X_train=X_train,
+            y_train=y_train,
+            X_val=X_val,
+            y_val=y_val,
+            symbol=GLOBAL_MODEL_NAME,
+            verbose=True,
+            resume=resume
+        )
+
+        # Step 10: Evaluate on each asset's test period
+        per_asset_accuracy = {}
+        for symbol, (X_test, y_test) in splits['test'].items():
+            _, accuracy, _ = trainer.validate(trainer.prepare_dataloaders(X_test, y_test, X_test, y_test)[1])
+            per_asset_accuracy[symbol] = accuracy
+            logger.info(f"   {symbol} Test Accuracy: {accuracy:.4f} ({accuracy*100:.2f}%)")
+
+        X_test = np.concatenate([X for X, _ in splits['test'].values()])
+        y_test = np.concatenate([y for _, y in splits['test'].values()])
+        test_loss, test_accuracy, test_metrics = trainer.validate(
+            trainer.prepare_dataloaders(X_test, y_test, X_test, y_test)[1]
+        )
+
+        training_time = (datetime.now() - start_time).total_seconds()
+
+        final_results = {
+            'symbol': GLOBAL_MODEL_NAME,
+            'status': 'success',
+            'symbols': trained_symbols,
+            'data_points': data_points,
+            'train_samples': len(X_train),
+            'val_samples': len(X_val),
+            'test_samples': len(X_test),
+            'best_val_loss': results['best_val_loss'],
+            'best_val_accuracy': results['best_val_accuracy'],
+            'test_loss': test_loss,
+            'test_accuracy': test_accuracy,
+            'test_bearish_accuracy': test_metrics['bearish_accuracy'],
+            'test_neutral_accuracy': test_metrics['neutral_accuracy'],
+            'test_bullish_accuracy': test_metrics['bullish_accuracy'],
+            'per_asset_test_accuracy': per_asset_accuracy,
+            'epochs_trained': results['epochs_trained'],
+            'early_stopped': results['early_stopped'],
+            'training_time_seconds': training_time,
+            'precision': results['precision'],
+            'mean_epoch_seconds': results['mean_epoch_seconds'],
+            'throughput': results['throughput'],
+            'model_parameters': model.get_num_parameters(),
+            'checkpoint_path': f"models/checkpoints/{GLOBAL_MODEL_NAME}_best.pth",
+            'timestamp': datetime.now().isoformat()
+        }
+
+        logger.info(f"\n{'='*80}")
+        logger.info(f"✅ GLOBAL MODEL TRAINING COMPLETE!")
+        logger.info(f"{'='*80}")
+        logger.info(f"Best Val Accuracy: {results['best_val_accuracy']:.2%}")
+        logger.info(f"Test Accuracy: {test_accuracy:.2%}")
+        logger.info(f"Training Time: {training_time:.2f}s")
+        logger.info(f"Checkpoint: models/checkpoints/{GLOBAL_MODEL_NAME}_best.pth")
+        logger.info(f"{'='*80}\n")
+
+        return final_results
+
+    except Exception as e:
+        logger.error(f"❌ Global model training failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+        return {
+            'symbol': GLOBAL_MODEL_NAME,
+            'status': 'failed',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }
+
+
+async def train_all_models(
+    use_mlflow: bool = False,
+    workers: int = 1,
+    threads_per_worker: Optional[int] = None,
+    precision: str = 'fp32',
+    compare_precision: bool = False,
+    resume: bool = False,
+    horizons: Optional[List[int]] = None,
+    use_feature_store: bool = True
+) -> List[Dict]:
     """
     Train models for all assets (BTC, ETH, SOL)
 
     Args:
         use_mlflow: Whether to use MLflow tracking
+        workers: Number of parallel worker processes (1 = sequential)
+        threads_per_worker: torch thread budget per worker (default: CPUs / workers)
+        precision: Training precision ('fp32', 'bf16' or 'fp16')
+        compare_precision: Also train fp32 references and record speedup/accuracy delta
+        resume: Continue interrupted runs from their last state snapshots
+        horizons: Train multi-horizon models for these horizons in days
+        use_feature_store: Reuse stored OHLCV/features (passed to every worker)
 
     Returns:
         List of training results
@@ -342,15 +621,38 @@ async def train_all_models(use_mlflow: bool = False) -> List[Dict]:
 
     all_results = []
 
-    for i, symbol in enumerate(ASSETS, 1):
-        logger.info(f"\n>>> Training {i}/{len(ASSETS)}: {symbol}")
-
-        result = await train_model_for_asset(symbol, use_mlflow=use_mlflow)
-        all_results.append(result)
-
-        # Small delay between trainings
-        if i < len(ASSETS):
-            await asyncio.sleep(2)
+    if workers > 1 and len(ASSETS) > 1:
+        all_results = await asyncio.to_thread(
+            train_assets_parallel,
+            train_model_for_asset,
+            list(ASSETS),
+            max_workers=workers,
+            threads_per_worker=threads_per_worker,
+            use_mlflow=use_mlflow,
+            precision=precision,
+            compare_precision=compare_precision,
+            resume=resume,
+            horizons=horizons,
+            use_feature_store=use_feature_store
+        )
+    else:
+        for i, symbol in enumerate(ASSETS, 1):
+            logger.info(f"\n>>> Training {i}/{len(ASSETS)}: {symbol}")
+
+            result = await train_model_for_asset(
+                symbol,
+                use_mlflow=use_mlflow,
+                precision=precision,
+                compare_precision=compare_precision,
+                resume=resume,
+                horizons=horizons,
+                use_feature_store=use_feature_store
+            )
+            all_results.append(result)
+
+            # Small delay between trainings
+            if i < len(ASSETS):
+                await asyncio.sleep(2)
 
     # Summary
     logger.info(f"\n{'#'*80}")
@@ -397,6 +699,31 @@ def save_training_summary(results: List[Dict]):
 
     logger.info(f"📄 Training summary saved to {summary_file}")
 
+    # Training throughput: slow or input-bound runs stand out here
+    for result in results:
+        throughput = result.get('throughput')
+        if throughput:
+            peak_rss = throughput['peak_rss_mb']
+            logger.info(
+                f"   {result['symbol']}: {result['mean_epoch_seconds']:.2f}s/epoch, "
+                f"{throughput['samples_per_second']:.0f} samples/s, "
+                f"data {throughput['data_fraction']:.0%} / compute {1 - throughput['data_fraction']:.0%}, "
+                f"CPU {throughput['mean_cpu_utilization']:.0%} of {throughput['torch_threads']} threads, "
+                f"peak RSS {f'{peak_rss:.0f} MB' if peak_rss is not None else 'n/a'}"
+            )
+            if throughput['data_fraction'] > 0.3:
+                logger.warning(f"   ⚠️  {result['symbol']} spent {throughput['data_fraction']:.0%} of train time waiting on input batches")
+
+    # Mixed-precision runs: report speedup and accuracy delta against fp32
+    for result in results:
+        comparison = result.get('precision_comparison')
+        if comparison:
+            logger.info(
+                f"   {result['symbol']} {comparison['precision']} vs fp32: "
+                f"{comparison['speedup']:.2f}x faster per epoch, "
+                f"val accuracy {comparison['accuracy_delta']:+.2%}"
+            )
+
 
 async def main():
     """Main entry point"""
@@ -414,16 +741,87 @@ async def main():
         default=ASSETS,
         help='Specific assets to train (default: BTC ETH SOL)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Parallel training processes (default: 1, sequential)'
+    )
+    parser.add_argument(
+        '--threads-per-worker',
+        type=int,
+        default=None,
+        help='torch threads per worker (default: CPU count / workers)'
+    )
+    parser.add_argument(
+        '--no-store',
+        action='store_true',
+        help='Bypass the local feature store and refetch all data'
+    )
+    parser.add_argument(
+        '--precision',
+        choices=['fp32', 'bf16', 'fp16'],
+        default='fp32',
+        help='Training precision (default: fp32; bf16 needs a CPU with AVX512-BF16/AMX)'
+    )
+    parser.add_argument(
+        '--compare-precision',
+        action='store_true',
+        help='Also train an fp32 reference and record speedup and accuracy delta'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume interrupted training from models/checkpoints/{symbol}_state.pth'
+    )
+    parser.add_argument(
+        '--global-model',
+        action='store_true',
+        help='Train one shared model with a symbol embedding on all assets (saved as GLOBAL_best.pth)'
+    )
+    parser.add_argument(
+        '--horizons',
+        nargs='+',
+        type=int,
+        default=None,
+        help='Train one multi-horizon model per asset, e.g. --horizons 7 14 30 (default: 7-day only)'
+    )
 
     args = parser.parse_args()
 
+    if args.global_model and args.horizons:
+        parser.error('--global-model trains a single-horizon model; drop --horizons')
+
+    # Passed explicitly: spawned workers re-import this module with the defaults
+    use_feature_store = TRAINING_PARAMS['use_feature_store'] and not args.no_store
+
     # Update global ASSETS list if specified
     if args.assets:
         ASSETS.clear()
         ASSETS.extend(args.assets)
 
+    if args.global_model:
+        results = [await train_global_model(
+            list(ASSETS),
+            use_mlflow=args.mlflow,
+            precision=args.precision,
+            resume=args.resume,
+            use_feature_store=use_feature_store
+        )]
+        save_training_summary(results)
+        sys.exit(0 if results[0]['status'] == 'success' else 1)
+
     # Train all models
-    results = await train_all_models(use_mlflow=args.mlflow)
+    results = await train_all_models(
+        use_mlflow=args.mlflow,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        precision=args.precision,
+        compare_precision=args.compare_precision,
+        resume=args.resume,
+        horizons=args.horizons,
+        use_feature_store=use_feature_store
+    )
 
     # Exit with status code
     failed_count = sum(1 for r in results if r['status'] == 'failed')
@@ -10,9 +10,11 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import List
+import numpy as np
 
 from app.models.lstm_predictor import LSTMPredictor
 from app.utils.database import get_price_data, generate_mock_price_data
+from app.utils.feature_store import FeatureStore
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +54,13 @@ async def fetch_training_data(symbol: str) -> tuple:
     try:
         logger.info(f"Fetching historical data for {symbol}...")
 
+        # Try the local feature store first (populated by the ML-002 scripts)
+        index, values, columns = FeatureStore().read_ohlcv_arrays(symbol)
+        if 'price' in columns and len(index) >= TRAINING_CONFIG['historical_days']:
+            price_data = np.asarray(values[-TRAINING_CONFIG['historical_days']:, columns.index('price')])
+            logger.info(f"✓ Loaded {len(price_data)} data points from feature store for {symbol}")
+            return price_data, 'feature_store'
+
         # Try to fetch from database
         price_data = await get_price_data(symbol, days=TRAINING_CONFIG['historical_days'])
 
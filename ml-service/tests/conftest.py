@@ -0,0 +1,28 @@
+"""Shared fixtures for the ml-service tests."""
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def price_history():
+    """Factory for deterministic random-walk daily OHLCV histories."""
+    def make(
+        days: int = 300,
+        seed: int = 0,
+        drift: float = 0.0,
+        volatility: float = 0.02,
+        start: str = '2023-01-01'
+    ) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        prices = 100 * np.cumprod(1 + rng.normal(drift, volatility, days))
+        return pd.DataFrame({
+            'open': prices,
+            'high': prices * 1.01,
+            'low': prices * 0.99,
+            'price': prices,
+            'volume': rng.uniform(1e6, 2e6, days),
+            'market_cap': prices * 1e6,
+        }, index=pd.date_range(start, periods=days, freq='D'))
+
+    return make
@@ -0,0 +1,85 @@
+"""Test cases for the prediction log and live accuracy tracking."""
+import sys
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.main as main
+from app.utils.accuracy_tracker import AccuracyTracker, PredictionLog
+
+BULLISH = np.array([0.1, 0.2, 0.7])
+BEARISH = np.array([0.7, 0.2, 0.1])
+
+
+def test_log_roundtrip_partitions_and_torn_tail(tmp_path):
+    """Flushed rows come back per symbol across month partitions; a torn tail is dropped."""
+    log = PredictionLog(str(tmp_path))
+    log.append('BTC', 7, BULLISH, 100.0, 1, issued_at=datetime(2025, 1, 31))
+    log.append('BTC', 30, BEARISH, 101.0, 1, issued_at=datetime(2025, 2, 1))
+    log.append('ETH', 7, BULLISH, 10.0, 2, issued_at=datetime(2025, 2, 1))
+
+    assert log.flush() == 3 and log.pending() == 0
+    assert sorted(os.listdir(tmp_path / 'BTC')) == ['2025-01', '2025-02']
+
+    # Simulate a crash in the middle of writing the next row
+    with open(tmp_path / 'BTC' / '2025-02' / log.writer / 'issued_at.bin', 'ab') as f:
+        f.write(np.int64(0).tobytes())
+
+    # A restarted process (even with a reused pid) writes a new segment
+    restarted = PredictionLog(str(tmp_path))
+    assert restarted.writer != log.writer
+    restarted.append('BTC', 14, BULLISH, 102.0, 1, issued_at=datetime(2025, 2, 2))
+    restarted.flush()
+
+    rows = log.read('BTC')
+    order = np.argsort(rows['issued_at'])
+    assert list(rows['horizon'][order]) == [7, 30, 14]
+    assert list(rows['price'][order]) == [100.0, 101.0, 102.0]
+    assert np.allclose(rows['probabilities'][order][1], BEARISH)
+    assert len(log.read('BTC', since=datetime(2025, 2, 15))['price']) == 2
+
+
+def test_resolve_scores_matured_predictions_per_model_version(tmp_path, monkeypatch):
+    """Predictions are scored against the realised move once their horizon passes."""
+    now = datetime(2025, 3, 1)
+    days = pd.date_range(end=now, periods=60, freq='D')
+    prices = pd.DataFrame({'price': 100 * 1.01 ** np.arange(60)}, index=days)  # +7.2% per week
+
+    tracker = AccuracyTracker(PredictionLog(str(tmp_path)), min_predictions=20)
+    for day in days[:50]:
+        tracker.record('BTC', '7d', BULLISH, prices.loc[day, 'price'], model_version=1, issued_at=day)
+        tracker.record('BTC', '7d', BEARISH if day.day % 4 else BULLISH, prices.loc[day, 'price'], model_version=2, issued_at=day)
+    tracker.record('BTC', '7d', BULLISH, prices['price'].iloc[-1], model_version=1, issued_at=now)
+    tracker.flush()
+
+    summary = tracker.resolve({'BTC': prices}, now=now)
+    assert summary['resolved'] == 100  # the prediction issued today has not matured
+
+    assert tracker.accuracy('BTC', '7d', 1) == {'last30Days': 1.0, 'last90Days': 1.0}
+    stats = tracker.stats('BTC', '7d', 2)
+    assert 0 < stats['accuracy_30d'] < 0.5 and stats['resolved_90d'] == 50
+    assert tracker.accuracy('BTC', '14d', 1) is None
+
+    # The API prefers live accuracy of the served checkpoint over metadata
+    monkeypatch.setattr(main, 'accuracy_tracker', tracker)
+    model_info = {'metadata': {'test_accuracy': 0.6, 'val_accuracy': 0.6}, 'checkpoint_version': 1}
+    assert main.historical_accuracy('BTC', '7d', model_info)['last30Days'] == 1.0
+    assert main.historical_accuracy('BTC', '7d', dict(model_info, checkpoint_version=3))['last30Days'] == 0.6
+
+    # A failed price query or a symbol without candles keeps the previous statistics
+    def fail(symbols, days):
+        raise ConnectionError('database unavailable')
+
+    monkeypatch.setattr(main, 'query_price_histories', fail)
+    with pytest.raises(ConnectionError):
+        main.resolve_live_accuracy()
+
+    monkeypatch.setattr(main, 'query_price_histories', lambda symbols, days: {})
+    main.resolve_live_accuracy()
+    assert tracker.accuracy('BTC', '7d', 1) == {'last30Days': 1.0, 'last90Days': 1.0}
@@ -0,0 +1,58 @@
+"""Test cases for walk-forward backtesting."""
+import sys
+import os
+
+import numpy as np
+import torch
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import CryptoLSTM
+from app.training.backtest import (
+    backtest_accuracy,
+    backtest_symbol,
+    calibration_metrics,
+    rolling_accuracy
+)
+from app.utils.feature_engineering import engineer_features
+
+
+def test_rolling_accuracy_and_calibration():
+    """Rolling accuracy uses exact windows; calibration bins compare confidence to accuracy."""
+    correct = np.array([1, 0, 1, 1, 0, 1], dtype=bool)
+    assert np.allclose(rolling_accuracy(correct, 3), [2 / 3, 2 / 3, 2 / 3, 2 / 3])
+    assert len(rolling_accuracy(correct, 10)) == 0
+
+    probabilities = np.array([[0.9, 0.05, 0.05], [0.9, 0.05, 0.05], [0.2, 0.5, 0.3], [0.2, 0.3, 0.5]])
+    labels = np.array([0, 1, 1, 0])
+    calibration = calibration_metrics(probabilities, labels)
+
+    # Bin 0.9: confidence 0.9, accuracy 0.5; bin 0.5: confidence 0.5, accuracy 0.5
+    assert np.isclose(calibration['expected_calibration_error'], (2 * 0.4 + 0) / 4)
+    assert [b['count'] for b in calibration['bins']] == [2, 2]
+
+
+def test_batched_backtest_matches_single_window_inference(price_history):
+    """Every scored day equals a one-window forward pass on the history up to that day."""
+    torch.manual_seed(0)
+    model = CryptoLSTM(hidden_sizes=[16, 8, 4]).eval()
+    df = price_history(drift=0.001, volatility=0.03)
+
+    result = backtest_symbol(model, df, 'BTC', horizons=[7, 30], sequence_length=30, return_predictions=True)
+    days = result['predictions']['7d']
+    assert result['horizons']['30d']['samples'] == result['horizons']['7d']['samples'] - 23
+    assert np.isclose(result['horizons']['7d']['accuracy'], (days['label'] == days['prediction']).mean())
+
+    # The sample labelled at day t uses the window that ends the day before
+    features = engineer_features(df)
+    day = days.index[-1]
+    window = features.loc[:day].iloc[-31:-1].values
+    x = torch.FloatTensor((window - window.mean(axis=0)) / (window.std(axis=0) + 1e-8)).unsqueeze(0)
+    with torch.no_grad():
+        assert np.isclose(model(x)[0].max().item(), days['confidence'].iloc[-1], atol=1e-5)
+
+    report = {'symbols': {'BTC': result}}
+    accuracy = backtest_accuracy(report, 'BTC', '7d')
+    assert accuracy['last30Days'] == round(result['horizons']['7d']['accuracy_last_30'], 3)
+    assert backtest_accuracy(report, 'ETH', '7d') is None
@@ -0,0 +1,147 @@
+"""Test cases for ensemble combination."""
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ensemble import (
+    ENSEMBLE_CLASSES,
+    ENSEMBLE_METHODS,
+    ModelPrediction,
+    PredictionEnsemble,
+    PredictionHistoryBuffer,
+    RedisPredictionHistory,
+    TemporalEnsemble,
+    combine_probability_tensor
+)
+
+
+class StreamRedis:
+    """Minimal in-process stand-in for the Redis stream commands used."""
+
+    def __init__(self):
+        self.streams = {}
+        self.last_id = 0
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.last_id += 1
+        entry_id = f"{self.last_id}-0".encode()
+        stream = self.streams.setdefault(name, [])
+        stream.append((entry_id, {k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in fields.items()}))
+        # Approximate trimming only drops whole radix tree nodes (100 entries by default)
+        if maxlen is not None and (not approximate or len(stream) >= maxlen + 100):
+            del stream[:-maxlen]
+        return entry_id
+
+    def xrange(self, name):
+        return sorted(self.streams.get(name, []), key=lambda entry: int(entry[0].split(b'-')[0]))
+
+    def delete(self, *names):
+        for name in names:
+            self.streams.pop(name, None)
+
+    def scan_iter(self, match):
+        return [name for name in self.streams if name.startswith(match.rstrip('*'))]
+
+
+@pytest.mark.parametrize("method", ENSEMBLE_METHODS)
+def test_tensor_api_matches_per_symbol_ensemble(method):
+    """Vectorized combination agrees with PredictionEnsemble symbol by symbol."""
+    rng = np.random.default_rng(0)
+    num_models, num_symbols = 4, 200
+    probs = rng.dirichlet([1, 1, 1], (num_models, num_symbols))
+    weights = rng.uniform(0.4, 0.7, num_models)
+    available = rng.random((num_models, num_symbols)) > 0.3
+
+    combined = combine_probability_tensor(probs, weights, available, min_confidence=0.5)[method]
+
+    for s in range(num_symbols):
+        predictions = [
+            ModelPrediction('X', probs[m, s], ENSEMBLE_CLASSES[probs[m, s].argmax()],
+                            float(probs[m, s].max()), f"m{m}", weights[m])
+            for m in range(num_models) if available[m, s]
+        ]
+        if not predictions:
+            continue
+
+        expected_probs, direction, confidence, _ = PredictionEnsemble(method).combine_predictions(predictions, 0.5)
+
+        assert np.allclose(combined['probabilities'][s], expected_probs)
+        assert ENSEMBLE_CLASSES[combined['direction'][s]] == direction
+        assert np.isclose(combined['confidence'][s], confidence)
+
+
+def test_history_buffer_keeps_latest_in_order():
+    """Ring buffer returns the newest `capacity` predictions oldest first."""
+    rng = np.random.default_rng(1)
+    probs = rng.dirichlet([1, 1, 1], 25)
+    ensemble = TemporalEnsemble(decay_factor=0.8, history=PredictionHistoryBuffer(capacity=10))
+
+    for i, p in enumerate(probs):
+        ensemble.add_prediction('BTC', ModelPrediction('BTC', p, 'neutral', 0.5, 'm'), timestamp=float(i))
+
+    timestamps, stored = ensemble.history.get('BTC')
+    assert timestamps.tolist() == [float(i) for i in range(15, 25)]
+    assert np.allclose(stored, probs[15:], atol=1e-6)
+
+    combined, direction, _, metadata = ensemble.get_temporal_prediction('BTC')
+    weights = 0.8 ** np.arange(9, -1, -1)
+    assert np.allclose(combined, weights @ probs[15:] / weights.sum(), atol=1e-6)
+    assert direction == ENSEMBLE_CLASSES[combined.argmax()]
+    assert metadata['predictions_used'] == 10
+
+
+def test_redis_history_trims_streams_and_is_shared():
+    """XADD keeps exactly `capacity` entries per stream; every worker reads them oldest first."""
+    rng = np.random.default_rng(2)
+    probs = rng.dirichlet([1, 1, 1], 25)
+    redis = StreamRedis()
+    workers = [RedisPredictionHistory(redis, capacity=10) for _ in range(2)]
+
+    for i, p in enumerate(probs):
+        workers[i % 2].append('BTC', p, timestamp=1.7e9 + i)
+    workers[0].append('ETH', probs[0], timestamp=1.7e9)
+
+    assert len(redis.streams['prediction_history:BTC']) == 10
+    for history in workers:
+        timestamps, stored = history.get('BTC')
+        assert timestamps.tolist() == [1.7e9 + i for i in range(15, 25)]
+        assert np.allclose(stored, probs[15:], atol=1e-6)
+
+    ensemble = TemporalEnsemble(decay_factor=0.8, history=workers[1])
+    combined, _, _, metadata = ensemble.get_temporal_prediction('BTC')
+    weights = 0.8 ** np.arange(9, -1, -1)
+    assert np.allclose(combined, weights @ probs[15:] / weights.sum(), atol=1e-6)
+    assert metadata['last_prediction_at'] == 1.7e9 + 24
+
+    workers[0].clear('BTC')
+    assert len(workers[1].get('BTC')[0]) == 0
+    workers[1].clear()
+    assert redis.streams == {}
+
+
+def test_ensemble_endpoint_feeds_shared_history(monkeypatch):
+    """Each served ensemble prediction is added to the Redis history; Redis errors degrade to None."""
+    import redis as redis_lib
+    import app.main as main
+
+    history = RedisPredictionHistory(StreamRedis(), capacity=3)
+    monkeypatch.setattr(main, 'temporal_ensemble', TemporalEnsemble(decay_factor=0.9, history=history))
+    result = {'probabilities': np.array([0.2, 0.1, 0.7]), 'direction': 'bullish', 'confidence': 0.7}
+
+    for _ in range(5):
+        temporal = main.update_temporal_ensemble('BTC', '7d', result)
+
+    assert temporal == {'direction': 'bullish', 'confidence': 0.7, 'predictions_used': 3, 'trend': 'strong_bullish'}
+    assert len(history.get('BTC:7d')[0]) == 3
+
+    class DownRedis:
+        def xadd(self, *args, **kwargs):
+            raise redis_lib.ConnectionError('down')
+
+    history.redis_client = DownRedis()
+    assert main.update_temporal_ensemble('BTC', '7d', result) is None
@@ -0,0 +1,34 @@
+"""Test cases for dataset building in feature engineering."""
+import sys
+import os
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.utils.feature_engineering import build_dataset, create_labels, create_sequences
+
+
+def test_build_dataset_matches_create_labels_and_sequences(price_history):
+    """build_dataset produces the same windows and labels as the two-step path."""
+    features = price_history(200)[['price', 'volume']]
+
+    expected_X, expected_y = create_sequences(features, create_labels(features, horizon=7), sequence_length=30)
+    X, y, index = build_dataset(features, horizon=7, sequence_length=30)
+
+    assert np.array_equal(X, expected_X.astype(np.float32))
+    assert np.array_equal(y, expected_y)
+    assert len(index) == len(y)
+
+
+def test_build_dataset_multi_horizon_shape(price_history):
+    """A list of horizons yields one label column per horizon, limited by the longest."""
+    features = price_history(200)[['price', 'volume']]
+
+    X, y, index = build_dataset(features, horizon=[1, 7, 30], sequence_length=30)
+    _, y_long, _ = build_dataset(features, horizon=30, sequence_length=30)
+
+    assert y.shape == (len(y_long), 3)
+    assert X.shape == (len(y_long), 30, 2)
+    assert np.array_equal(y[:, 2], y_long)
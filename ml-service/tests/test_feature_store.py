@@ -0,0 +1,47 @@
+"""Test cases for the local OHLCV/feature store."""
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.feature_store import FeatureStore
+
+
+def test_incremental_append_roundtrip(tmp_path, price_history):
+    """Overlapping appends merge into year partitions without duplicates."""
+    store = FeatureStore(str(tmp_path))
+    df = price_history(400, start='2023-06-01')
+
+    assert store.append_ohlcv('BTC', df.iloc[:300]) == 300
+    assert store.append_ohlcv('BTC', df.iloc[250:]) == 100
+
+    stored = store.read_ohlcv('BTC')
+    assert len(stored) == len(df)
+    assert np.allclose(stored['price'].values, df['price'].values)
+    assert store.last_timestamp('BTC') == df.index[-1]
+    assert sorted(os.listdir(tmp_path / 'ohlcv' / 'BTC')) == ['2023', '2024']
+
+
+def test_feature_cache_skips_rebuild(tmp_path, price_history):
+    """Unchanged inputs are served from the feature cache."""
+    store = FeatureStore(str(tmp_path))
+    df = price_history(400, start='2023-06-01')
+    calls = []
+
+    def build(frame):
+        calls.append(1)
+        return frame[['price', 'volume']] * 2
+
+    first = store.get_or_build_features('ETH', df, build_fn=build)
+    second = store.get_or_build_features('ETH', df, build_fn=build)
+
+    assert len(calls) == 1
+    assert np.allclose(first.values, second.values)
+
+    changed = df.copy()
+    changed.iloc[-1, 0] += 1
+    store.get_or_build_features('ETH', changed, build_fn=build)
+    assert len(calls) == 2
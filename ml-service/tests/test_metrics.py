@@ -0,0 +1,55 @@
+"""Test cases for the service metrics registry."""
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.metrics import Metric, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Histogram exposition has cumulative buckets, sum and count."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram('stage_seconds', 'Stage latency', ('stage',), buckets=(0.01, 0.1))
+
+    for value in (0.005, 0.05, 0.5):
+        histogram.observe(value, stage='forward')
+
+    text = registry.render()
+
+    assert '# TYPE stage_seconds histogram' in text
+    assert 'stage_seconds_bucket{stage="forward",le="0.01"} 1' in text
+    assert 'stage_seconds_bucket{stage="forward",le="0.1"} 2' in text
+    assert 'stage_seconds_bucket{stage="forward",le="+Inf"} 3' in text
+    assert 'stage_seconds_sum{stage="forward"} 0.555' in text
+    assert 'stage_seconds_count{stage="forward"} 3' in text
+
+
+def test_counter_and_callback_gauge():
+    """Counters accumulate per label set and callback gauges read at scrape time."""
+    registry = MetricsRegistry()
+    counter = registry.counter('errors_total', 'Errors', ('operation',))
+    registry.gauge('queue_depth', 'Queue depth', function=lambda: {(): 7})
+
+    counter.inc(operation='get')
+    counter.inc(operation='get')
+    counter.inc(operation='set')
+
+    text = registry.render()
+
+    assert counter.value(operation='get') == 2
+    assert 'errors_total{operation="get"} 2' in text
+    assert 'errors_total{operation="set"} 1' in text
+    assert 'queue_depth 7' in text
+
+
+def test_metric_subclass_without_samples_cannot_be_created():
+    """An incomplete metric type fails at construction, not when /metrics renders."""
+    class Summary(Metric):
+        metric_type = 'summary'
+
+    with pytest.raises(TypeError):
+        Summary('latency', 'Latency')
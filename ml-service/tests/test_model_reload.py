@@ -0,0 +1,131 @@
+"""Test cases for checkpoint publishing and hot model reload."""
+import sys
+import os
+import asyncio
+
+import torch
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.main as main
+from app.models.crypto_lstm import CryptoLSTM, build_model
+from app.training.trainer import atomic_torch_save
+
+CONFIG = {'architecture': 'stacked', 'hidden_sizes': [8, 8, 8], 'dropout': 0.2}
+
+
+def _publish(path, seed, version):
+    torch.manual_seed(seed)
+    model = CryptoLSTM(input_size=main.INPUT_FEATURES, hidden_sizes=CONFIG['hidden_sizes'])
+    atomic_torch_save({'model_state_dict': model.state_dict(), 'config': CONFIG}, path)
+    os.utime(path, ns=(version, version))
+    return model
+
+
+def test_changed_checkpoint_is_hot_swapped(tmp_path, monkeypatch):
+    """A republished checkpoint replaces the cached model; other symbols are untouched."""
+    monkeypatch.setattr(main, 'MODEL_CHECKPOINT_DIR', str(tmp_path))
+    monkeypatch.setattr(main, 'model_cache', {})
+    monkeypatch.setattr(main, 'checkpoint_versions', {})
+    deleted = []
+    monkeypatch.setattr(main, 'invalidate_prediction_cache', deleted.append)
+
+    _publish(tmp_path / 'BTC_best.pth', seed=0, version=1_000_000_000)
+    _publish(tmp_path / 'ETH_best.pth', seed=0, version=1_000_000_000)
+    old = asyncio.run(main.load_model('BTC'))['model']
+    asyncio.run(main.load_model('ETH'))
+
+    assert asyncio.run(main.reload_updated_models()) == []
+    assert list(tmp_path.glob('*.tmp*')) == []
+
+    new_weights = _publish(tmp_path / 'BTC_best.pth', seed=1, version=2_000_000_000).state_dict()
+    assert asyncio.run(main.reload_updated_models()) == ['BTC']
+
+    swapped = main.model_cache['BTC']['model']
+    assert swapped is not old
+    assert torch.equal(swapped.state_dict()['lstm1.weight_ih_l0'], new_weights['lstm1.weight_ih_l0'])
+    assert deleted == ['BTC']
+
+
+def test_global_model_is_shared_and_reloaded_for_all_symbols(tmp_path, monkeypatch):
+    """With GLOBAL_MODEL every symbol uses one cached model; republishing it invalidates them all."""
+    monkeypatch.setattr(main, 'MODEL_CHECKPOINT_DIR', str(tmp_path))
+    monkeypatch.setattr(main, 'GLOBAL_MODEL', True)
+    monkeypatch.setattr(main, 'SUPPORTED_SYMBOLS', ['BTC', 'ETH'])
+    monkeypatch.setattr(main, 'model_cache', {})
+    monkeypatch.setattr(main, 'checkpoint_versions', {})
+    deleted = []
+    monkeypatch.setattr(main, 'invalidate_prediction_cache', deleted.append)
+
+    config = dict(CONFIG, architecture='global', symbols=['BTC', 'ETH'])
+    path = tmp_path / 'GLOBAL_best.pth'
+    atomic_torch_save({'model_state_dict': build_model(config).state_dict(), 'config': config}, path)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    btc = asyncio.run(main.load_model('BTC'))['model']
+    assert asyncio.run(main.load_model('ETH'))['model'] is btc
+    assert list(main.model_cache) == ['GLOBAL']
+
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert asyncio.run(main.reload_updated_models()) == ['BTC', 'ETH']
+    assert main.model_cache['GLOBAL']['model'] is not btc
+    assert deleted == ['BTC', 'ETH']
+
+
+def test_ensemble_batch_caches_variants_and_fetches_histories_once(tmp_path, monkeypatch):
+    """The batch endpoint makes one history query and reuses variant models until their checkpoint changes."""
+    from app.utils.database import generate_mock_price_dataframe
+
+    monkeypatch.setattr(main, 'MODEL_CHECKPOINT_DIR', str(tmp_path))
+    monkeypatch.setattr(main, 'variant_model_cache', {})
+    queries = []
+
+    async def fetch_histories(symbols, days=90):
+        queries.append(list(symbols))
+        return {symbol: generate_mock_price_dataframe(days, symbol) for symbol in symbols}
+
+    monkeypatch.setattr(main, 'fetch_price_histories', fetch_histories)
+
+    _publish(tmp_path / 'BTC_best.pth', seed=0, version=1_000_000_000)
+    _publish(tmp_path / 'ETH_best.pth', seed=1, version=1_000_000_000)
+    request = main.EnsembleBatchRequest(symbols=['BTC', 'ETH'])
+
+    response = asyncio.run(main.predict_ensemble_batch(request))
+    assert queries == [['BTC', 'ETH']]
+    assert sorted(response.results) == ['BTC', 'ETH']
+
+    cached = main.variant_model_cache['BTC_best.pth']['model']
+    asyncio.run(main.predict_ensemble_batch(request))
+    assert main.variant_model_cache['BTC_best.pth']['model'] is cached
+
+    _publish(tmp_path / 'BTC_best.pth', seed=2, version=2_000_000_000)
+    asyncio.run(main.predict_ensemble_batch(request))
+    assert main.variant_model_cache['BTC_best.pth']['model'] is not cached
+
+
+def test_global_ensemble_batch_is_one_forward_pass(tmp_path, monkeypatch):
+    """With GLOBAL_MODEL the batch endpoint runs all symbols through one mixed-symbol batch."""
+    from app.utils.database import generate_mock_price_dataframe
+
+    monkeypatch.setattr(main, 'MODEL_CHECKPOINT_DIR', str(tmp_path))
+    monkeypatch.setattr(main, 'GLOBAL_MODEL', True)
+    monkeypatch.setattr(main, 'variant_model_cache', {})
+
+    async def fetch_histories(symbols, days=90):
+        return {symbol: generate_mock_price_dataframe(days, symbol) for symbol in symbols}
+
+    monkeypatch.setattr(main, 'fetch_price_histories', fetch_histories)
+
+    config = dict(CONFIG, architecture='global', symbols=['BTC', 'ETH'])
+    atomic_torch_save({'model_state_dict': build_model(config).state_dict(), 'config': config}, tmp_path / 'GLOBAL_best.pth')
+
+    model = main.load_variant_model('GLOBAL', 'best')['model']
+    batch_sizes = []
+    model.register_forward_hook(lambda module, inputs, output: batch_sizes.append(inputs[0].shape[0]))
+
+    response = asyncio.run(main.predict_ensemble_batch(main.EnsembleBatchRequest(symbols=['BTC', 'ETH', 'SOL'])))
+
+    assert batch_sizes == [2]
+    assert sorted(response.results) == ['BTC', 'ETH']
+    assert 'SOL' in response.errors
@@ -0,0 +1,90 @@
+"""Test cases for CryptoLSTM model architectures."""
+import sys
+import os
+
+import pytest
+import torch
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import (
+    CryptoLSTM,
+    FusedCryptoLSTM,
+    GlobalCryptoLSTM,
+    MultiHorizonCryptoLSTM,
+    build_model,
+    convert_stacked_to_fused
+)
+from app.training.trainer import IMPROVED_TRAINING_CONFIG, TRAINING_CONFIG
+
+
+def test_build_model_selects_architecture():
+    """build_model dispatches on config['architecture'] and defaults to stacked."""
+    assert isinstance(build_model({}), CryptoLSTM)
+    assert isinstance(build_model({'architecture': 'fused', 'hidden_sizes': [32, 32, 32]}), FusedCryptoLSTM)
+
+    with pytest.raises(ValueError):
+        build_model({'architecture': 'transformer'})
+
+
+def test_fused_stacks_fuse_runs_of_equal_width():
+    """Consecutive layers of one hidden size share a multi-layer nn.LSTM."""
+    assert [lstm.num_layers for lstm in FusedCryptoLSTM(hidden_sizes=[32, 32, 32]).lstms] == [3]
+    assert [lstm.num_layers for lstm in FusedCryptoLSTM(hidden_sizes=[32, 32, 16]).lstms] == [2, 1]
+    assert [lstm.num_layers for lstm in build_model({'architecture': 'fused'}).lstms] == [1, 1, 1]
+
+
+@pytest.mark.parametrize('config', [
+    {'hidden_sizes': [24, 24, 24]},
+    {'hidden_sizes': [32, 32, 16]},
+    TRAINING_CONFIG,
+    IMPROVED_TRAINING_CONFIG,
+])
+def test_stacked_to_fused_conversion_is_exact(config):
+    """Converted weights reproduce the stacked model's outputs, including the shipped configs."""
+    torch.manual_seed(0)
+    stacked = build_model(dict(config, architecture='stacked')).eval()
+    fused = convert_stacked_to_fused(stacked).eval()
+
+    # The converted weights load into a model built from the fused checkpoint config
+    build_model(dict(config, architecture='fused')).load_state_dict(fused.state_dict())
+
+    x = torch.randn(4, 30, 20)
+    with torch.no_grad():
+        assert torch.allclose(stacked(x), fused(x), atol=1e-6)
+
+
+def test_multi_horizon_heads_share_the_trunk():
+    """Each horizon head sees the same recurrent output and yields its own distribution."""
+    torch.manual_seed(0)
+    model = build_model({'architecture': 'multi_horizon', 'hidden_sizes': [16, 8, 4], 'horizons': [7, 14, 30]}).eval()
+
+    assert isinstance(model, MultiHorizonCryptoLSTM)
+    assert not hasattr(model, 'fc1')
+
+    with torch.no_grad():
+        output = model(torch.randn(5, 30, 20))
+
+    assert output.shape == (5, 3, 3)
+    assert torch.allclose(output.sum(dim=-1), torch.ones(5, 3))
+    assert model.horizon_index(14) == 1 and model.horizon_index(21) == 1
+
+
+def test_global_model_batches_across_symbols():
+    """One batch may mix symbols; each row matches a single-symbol pass."""
+    torch.manual_seed(0)
+    model = build_model({'architecture': 'global', 'hidden_sizes': [16, 8, 4], 'symbols': ['BTC', 'ETH']}).eval()
+    assert isinstance(model, GlobalCryptoLSTM)
+
+    x = torch.randn(2, 30, 20)
+    with torch.no_grad():
+        btc = model(model.prepare_input(x, 'BTC'))
+        eth = model(model.prepare_input(x, 'ETH'))
+        mixed = model(torch.cat([model.prepare_input(x[:1], 'BTC'), model.prepare_input(x[1:], 'ETH')]))
+
+    assert torch.allclose(mixed, torch.stack([btc[0], eth[1]]), atol=1e-6)
+    assert not torch.allclose(btc, eth)
+
+    with pytest.raises(ValueError):
+        model.prepare_input(x, 'SOL')
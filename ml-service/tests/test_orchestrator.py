@@ -0,0 +1,45 @@
+"""Test cases for the parallel multi-asset training orchestrator."""
+import sys
+import os
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.training import orchestrator
+from app.training.orchestrator import resolve_worker_budget, train_assets_parallel
+
+
+def train_or_fail(symbol, use_feature_store=True):
+    """Trivial per-asset training function (module level so spawn workers can import it)."""
+    if symbol == 'BAD':
+        raise ValueError('no data for BAD')
+    return {'status': 'success', 'use_feature_store': use_feature_store}
+
+
+def test_worker_budget_splits_cpus_across_workers(monkeypatch):
+    """Workers are capped by tasks and CPUs; threads share the CPUs between workers."""
+    monkeypatch.setattr(orchestrator.os, 'cpu_count', lambda: 8)
+
+    assert resolve_worker_budget(3) == (3, 2)
+    assert resolve_worker_budget(20) == (8, 1)
+    assert resolve_worker_budget(4, max_workers=16) == (4, 2)
+    assert resolve_worker_budget(20, max_workers=2) == (2, 4)
+    assert resolve_worker_budget(20, max_workers=2, threads_per_worker=1) == (2, 1)
+
+    monkeypatch.setattr(orchestrator.os, 'cpu_count', lambda: None)
+    assert resolve_worker_budget(5) == (1, 1)
+
+
+def test_failed_worker_is_reported_and_others_complete():
+    """A raising asset becomes a failed entry; the rest return in asset order with their kwargs."""
+    results = train_assets_parallel(
+        train_or_fail, ['BTC', 'BAD', 'ETH'],
+        max_workers=2, threads_per_worker=1, use_feature_store=False
+    )
+
+    assert [r['symbol'] for r in results] == ['BTC', 'BAD', 'ETH']
+    assert [r['status'] for r in results] == ['success', 'failed', 'success']
+    assert 'no data for BAD' in results[1]['error']
+    assert results[0]['use_feature_store'] is False
+    assert results[0]['worker_threads'] == 1
+    assert results[0]['worker_pid'] != os.getpid()
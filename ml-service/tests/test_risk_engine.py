@@ -0,0 +1,74 @@
+"""Test cases for the vectorized risk scoring engine."""
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.risk_engine import score_histories, align_returns, compute_portfolio_risk
+
+
+def _scalar_reference(df):
+    """Per-symbol computation the endpoint used before vectorization."""
+    prices = df['price'].values
+    volume = df['volume_24h'].values
+    recent_30d = prices[-30:]
+    volatility = np.std(recent_30d) / np.mean(recent_30d)
+    recent_7d = prices[-7:]
+    max_swing = (np.max(recent_7d) - np.min(recent_7d)) / np.mean(recent_7d)
+    volume_volatility = np.std(np.diff(volume) / (volume[:-1] + 1))
+    trend_slope = np.polyfit(np.arange(30), recent_30d, 1)[0] / np.mean(recent_30d)
+    scores = [
+        min(100, int(volatility * 200)),
+        min(100, int(max_swing * 150)),
+        min(100, int(volume_volatility * 100)),
+        min(100, int(abs(trend_slope) * 500)),
+    ]
+    risk_score = int(scores[0] * 0.4 + scores[1] * 0.3 + scores[2] * 0.2 + scores[3] * 0.1)
+    return max(0, min(100, risk_score)), volatility, abs(trend_slope)
+
+
+def test_batch_matches_per_symbol_scoring(price_history):
+    """One (S, T) pass reproduces per-symbol scores, including shorter histories."""
+    def history(days, seed):
+        df = price_history(days, seed=seed, drift=0.001, volatility=0.04 * (seed + 1))
+        return df[['price', 'volume']].rename(columns={'volume': 'volume_24h'})
+
+    frames = {f"T{i}": history(90 if i % 2 else 45, i) for i in range(6)}
+    frames['SHORT'] = history(20, 9)
+
+    breakdowns, errors = score_histories(frames, length=90)
+
+    assert list(errors) == ['SHORT']
+    assert [b['symbol'] for b in breakdowns] == [f"T{i}" for i in range(6)]
+
+    for breakdown in breakdowns:
+        score, volatility, slope = _scalar_reference(frames[breakdown['symbol']])
+        assert breakdown['risk_score'] == score
+        assert breakdown['risk_factors']['volatility']['value'] == round(volatility, 4)
+        assert np.isclose(breakdown['risk_factors']['trendStrength']['value'], round(slope, 6), atol=1e-6)
+
+
+def test_portfolio_risk_from_aligned_covariance(price_history):
+    """Portfolio volatility equals the stddev of the weighted return series; days align by date."""
+    days = pd.date_range('2024-01-01', periods=60, freq='D')
+    frames = {
+        'A': pd.DataFrame({'price': price_history(60, seed=1)['price'].values}, index=days),
+        'B': pd.DataFrame({'price': price_history(60, seed=2)['price'].values}, index=days).drop(days[10]),
+    }
+    frames['C'] = frames['A'] * 2  # Perfectly correlated with A
+
+    symbols, returns = align_returns(frames, length=90)
+    assert symbols == ['A', 'B', 'C']
+    assert returns.shape == (3, 58)
+
+    weights = np.array([0.5, 0.3, 0.2])
+    risk = compute_portfolio_risk(weights, returns)
+
+    assert np.isclose(risk['daily_volatility'], np.std(weights @ returns, ddof=1))
+    assert np.isclose(risk['risk_contribution'].sum(), 1.0)
+    assert np.isclose(risk['correlation'][0, 2], 1.0)
+    assert np.isclose(risk['herfindahl_index'], 0.38)
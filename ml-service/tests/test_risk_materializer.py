@@ -0,0 +1,92 @@
+"""Test cases for the precomputed risk score table."""
+import sys
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.utils.risk_materializer as risk_materializer
+from app.utils.risk_materializer import materialize_risk_scores, get_materialized_risk_score
+
+
+class DictRedis:
+    """Minimal in-process stand-in for the Redis hash commands used."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.values = {}
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: v.encode() for k, v in mapping.items()})
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+def test_materialize_then_lookup(monkeypatch):
+    """Scores land in one hash; short histories are dropped; stale entries are ignored."""
+    rng = np.random.default_rng(0)
+
+    def load(symbols, days):
+        return {
+            s: pd.DataFrame({'price': 100 + rng.random(10 if s == 'NEW' else days).cumsum(),
+                             'volume_24h': rng.uniform(1e6, 1e7, 10 if s == 'NEW' else days)})
+            for s in symbols
+        }
+
+    monkeypatch.setattr(risk_materializer, 'query_price_histories', load)
+    redis = DictRedis()
+
+    summary = materialize_risk_scores(redis, ['BTC', 'PEPE', 'NEW'], chunk_size=2)
+
+    assert summary['scored'] == 2
+    assert list(summary['errors']) == ['NEW']
+    assert get_materialized_risk_score(redis, 'PEPE')['symbol'] == 'PEPE'
+    assert get_materialized_risk_score(redis, 'NEW') is None
+    assert get_materialized_risk_score(redis, 'BTC', now=datetime.utcnow() + timedelta(days=2)) is None
+
+    # Entries served near the end of their lifetime still carry a future expiry
+    now = datetime.utcnow() + risk_materializer.MATERIALIZED_MAX_AGE - timedelta(minutes=1)
+    served = get_materialized_risk_score(redis, 'BTC', now=now)
+    assert datetime.fromisoformat(served['cache_expires_at'].rstrip('Z')) > now
+
+
+def test_missing_rows_are_dropped_and_query_errors_abort(monkeypatch):
+    """Symbols without candles leave the table; a failed query keeps the existing entries."""
+    rng = np.random.default_rng(0)
+    redis = DictRedis()
+
+    def load(symbols, days):
+        return {
+            s: pd.DataFrame({'price': 100 + rng.random(days).cumsum(), 'volume_24h': rng.uniform(1e6, 1e7, days)})
+            for s in symbols if s != 'GONE'
+        }
+
+    monkeypatch.setattr(risk_materializer, 'query_price_histories', load)
+    materialize_risk_scores(redis, ['BTC', 'GONE'])
+    redis.hset(risk_materializer.RISK_TABLE_KEY, {'GONE': redis.hget(risk_materializer.RISK_TABLE_KEY, 'BTC').decode()})
+
+    summary = materialize_risk_scores(redis, ['BTC', 'GONE'])
+    assert summary['errors'] == {'GONE': 'No price data'}
+    assert get_materialized_risk_score(redis, 'GONE') is None
+
+    def fail(symbols, days):
+        raise ConnectionError('database unavailable')
+
+    previous = redis.hget(risk_materializer.RISK_TABLE_KEY, 'BTC')
+    monkeypatch.setattr(risk_materializer, 'query_price_histories', fail)
+    with pytest.raises(ConnectionError):
+        materialize_risk_scores(redis, ['BTC'])
+    assert redis.hget(risk_materializer.RISK_TABLE_KEY, 'BTC') == previous
@@ -0,0 +1,89 @@
+"""Test cases for stateful incremental LSTM inference."""
+import sys
+import os
+import gc
+
+import numpy as np
+import pytest
+import torch
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import build_model
+from app.models.stateful_inference import StatefulInferenceCache
+from app.utils.feature_engineering import engineer_features
+
+SEQUENCE_LENGTH = 70
+HEAD_SCALE = 5.0  # Output layer scale for the sharpened test model
+DRIFT_TOLERANCE = 0.1  # Max probability difference from the stateless path within one resync interval
+
+
+@pytest.mark.parametrize('config', [
+    {'architecture': 'stacked', 'hidden_sizes': [128, 64, 32]},
+    {'architecture': 'fused', 'hidden_sizes': [64, 64, 64]},
+    {'architecture': 'fused', 'hidden_sizes': [64, 64, 32]},
+])
+def test_incremental_steps_match_a_frozen_full_pass(config, price_history):
+    """Each incremental step equals one pass from the last sync and stays near the stateless prediction."""
+    torch.manual_seed(0)
+    model = build_model(config).eval()
+
+    # Sharpen the head so outputs are far from uniform and differences show
+    with torch.no_grad():
+        for name, parameter in model.named_parameters():
+            if name.startswith('fc'):
+                parameter.mul_(HEAD_SCALE)
+
+    features = engineer_features(price_history())
+    streaming = StatefulInferenceCache()
+    modes = []
+
+    for end in range(SEQUENCE_LENGTH + 10, len(features) + 1):
+        probabilities, mode = streaming.predict('BTC', model, features.iloc[:end], SEQUENCE_LENGTH)
+        modes.append(mode)
+
+        # Stateless path: the last SEQUENCE_LENGTH rows z-scored fresh, as /predict does
+        window = features.iloc[end - SEQUENCE_LENGTH:end].values
+        with torch.no_grad():
+            stateless = model(torch.FloatTensor((window - window.mean(axis=0)) / (window.std(axis=0) + 1e-8)).unsqueeze(0))[0].numpy()
+
+        assert np.abs(probabilities - stateless).max() <= DRIFT_TOLERANCE
+
+        if mode == 'full':
+            synced_at = end
+            entry = streaming.entries['BTC']
+            continue
+
+        window = (features.iloc[synced_at - SEQUENCE_LENGTH:end].values - entry['mean']) / entry['std']
+        with torch.no_grad():
+            expected = model(torch.FloatTensor(window).unsqueeze(0))[0].numpy()
+
+        assert expected.max() > 0.45
+        assert np.allclose(probabilities, expected, atol=1e-5)
+
+    assert modes.count('incremental') > modes.count('full')
+
+
+def test_resync_and_cache_modes(price_history):
+    """Repeated calls hit the cache; gaps and new models force a full pass."""
+    torch.manual_seed(0)
+    model = build_model({}).eval()
+    features = engineer_features(price_history())
+    cache = StatefulInferenceCache(resync_interval=2)
+
+    assert cache.predict('ETH', model, features.iloc[:100], SEQUENCE_LENGTH)[1] == 'full'
+    assert cache.predict('ETH', model, features.iloc[:100], SEQUENCE_LENGTH)[1] == 'cached'
+    assert cache.predict('ETH', model, features.iloc[:101], SEQUENCE_LENGTH)[1] == 'incremental'
+    assert cache.predict('ETH', model, features.iloc[:102], SEQUENCE_LENGTH)[1] == 'incremental'
+    assert cache.predict('ETH', model, features.iloc[:103], SEQUENCE_LENGTH)[1] == 'full'  # resync
+    assert cache.predict('ETH', model, features.iloc[:110], SEQUENCE_LENGTH)[1] == 'full'  # gap
+
+    other_model = build_model({}).eval()
+    assert cache.predict('ETH', other_model, features.iloc[:111], SEQUENCE_LENGTH)[1] == 'full'
+
+    # A freed model's serial is never handed to a later model (id() can be)
+    serial = cache.model_serial(model)
+    del model
+    gc.collect()
+    assert cache.model_serial(build_model({}).eval()) > serial
@@ -0,0 +1,69 @@
+"""Test cases for the hyperparameter sweep helpers."""
+import sys
+import os
+import csv
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.training.sweep import generate_trials, should_prune, build_leaderboard, write_leaderboard_csv
+
+PRUNING = {'enabled': True, 'warmup_epochs': 3, 'min_reference_trials': 2}
+
+
+def test_grid_and_random_trials():
+    """Grid mode enumerates the product; random mode samples from the space."""
+    space = {'dropout': [0.2, 0.3], 'batch_size': [16, 32, 64]}
+
+    grid = generate_trials(space, mode='grid')
+    assert len(grid) == 6
+    assert {'dropout': 0.3, 'batch_size': 64} in grid
+
+    sampled = generate_trials(space, mode='random', num_trials=5, seed=1)
+    assert len(sampled) == 5
+    assert all(t['batch_size'] in space['batch_size'] for t in sampled)
+
+
+def test_median_stopping_rule():
+    """Trials worse than the median of their peers are pruned after warm-up."""
+    reference = [[1.0, 0.9, 0.8], [1.0, 0.95, 0.85]]
+
+    assert not should_prune([2.0, 2.0], reference, PRUNING)  # still warming up
+    assert should_prune([2.0, 2.0, 2.0], reference, PRUNING)
+    assert not should_prune([1.0, 0.8, 0.7], reference, PRUNING)
+    assert not should_prune([2.0, 2.0, 2.0], reference[:1], PRUNING)  # too few peers
+
+
+def test_leaderboard_ranks_by_mean_val_loss():
+    """Leaderboard groups per-symbol results by params and sorts by loss."""
+    results = [
+        {'trial_id': 0, 'symbol': 'BTC', 'status': 'success', 'params': {'dropout': 0.2},
+         'best_val_loss': 0.9, 'best_val_accuracy': 0.5},
+        {'trial_id': 1, 'symbol': 'BTC', 'status': 'pruned', 'params': {'dropout': 0.3},
+         'best_val_loss': 1.1, 'best_val_accuracy': 0.4},
+        {'trial_id': 2, 'symbol': 'BTC', 'status': 'failed', 'params': {'dropout': 0.4}},
+    ]
+
+    leaderboard = build_leaderboard(results)
+
+    assert [row['params']['dropout'] for row in leaderboard] == [0.2, 0.3]
+    assert leaderboard[0]['rank'] == 1
+    assert leaderboard[1]['pruned'] == 1
+
+
+def test_leaderboard_csv_has_a_column_per_swept_parameter(tmp_path):
+    """CSV columns come from the run's parameters, not the default search space."""
+    results = [
+        {'trial_id': 0, 'symbol': 'BTC', 'status': 'success', 'params': {'weight_decay': 0.01, 'dropout': 0.2},
+         'best_val_loss': 0.9, 'best_val_accuracy': 0.5},
+        {'trial_id': 1, 'symbol': 'BTC', 'status': 'success', 'params': {'weight_decay': 0.1},
+         'best_val_loss': 1.0, 'best_val_accuracy': 0.4},
+    ]
+    path = tmp_path / 'leaderboard.csv'
+
+    write_leaderboard_csv(str(path), build_leaderboard(results), ['weight_decay', 'dropout'], {'dropout': 0.3})
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert [row['weight_decay'] for row in rows] == ['0.01', '0.1']
+    assert [row['dropout'] for row in rows] == ['0.2', '0.3']
@@ -0,0 +1,38 @@
+"""Test cases for per-request stage tracing."""
+import sys
+import os
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.metrics import time_stage
+from app.utils.tracing import TracingMiddleware, RequestProfiler, span, format_server_timing
+
+
+def test_format_server_timing_sums_repeated_spans():
+    """Repeated span names are summed and a total entry is appended."""
+    header = format_server_timing([('forward', 0.002), ('db_fetch', 0.010), ('forward', 0.003)], 0.020)
+
+    assert header == 'forward;dur=5.00, db_fetch;dur=10.00, total;dur=20.00'
+
+
+def test_middleware_adds_header_and_samples_profiles(tmp_path):
+    """Spans from nested calls reach the Server-Timing header; every Nth request is profiled."""
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, profiler=RequestProfiler(sample_every=2, output_dir=str(tmp_path)))
+
+    @app.get("/work")
+    async def work():
+        with time_stage('db_fetch'):
+            with span('db_query'):
+                pass
+        return {"ok": True}
+
+    client = TestClient(app)
+    headers = [client.get("/work").headers['server-timing'] for _ in range(4)]
+
+    assert all(h.startswith('db_query;dur=') and 'db_fetch;dur=' in h and 'total;dur=' in h for h in headers)
+    assert len(list(tmp_path.glob('*.prof'))) == 2
@@ -0,0 +1,128 @@
+"""Test cases for ModelTrainer precision modes."""
+import sys
+import os
+
+import numpy as np
+import pytest
+import torch
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.crypto_lstm import CryptoLSTM, MultiHorizonCryptoLSTM
+from app.training.trainer import (
+    ModelTrainer,
+    TRAINING_CONFIG,
+    cpu_supports_bf16,
+    precision_comparison,
+    resolve_precision,
+    train_precision_reference
+)
+
+
+def _data(n=48):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((n, 12, 20)).astype(np.float32)
+    y = rng.integers(0, 3, n)
+    return X[:32], y[:32], X[32:], y[32:]
+
+
+def test_unsupported_precision_falls_back_to_fp32():
+    """fp16 autocast needs CUDA; unknown precisions are rejected."""
+    assert resolve_precision('fp16', torch.device('cpu')) == 'fp32'
+    with pytest.raises(ValueError):
+        resolve_precision('int8', torch.device('cpu'))
+
+
+@pytest.mark.skipif(not cpu_supports_bf16(), reason="CPU has no native bfloat16")
+def test_bf16_training_records_precision_comparison(tmp_path):
+    """bf16 run keeps fp32 weights and reports speedup/accuracy delta."""
+    config = dict(TRAINING_CONFIG, epochs=2, hidden_sizes=[16, 8, 4], precision='bf16',
+                  checkpoint_dir=str(tmp_path))
+    X_train, y_train, X_val, y_val = _data()
+
+    torch.manual_seed(0)
+    model = CryptoLSTM(input_size=20, hidden_sizes=config['hidden_sizes'])
+    initial = CryptoLSTM(input_size=20, hidden_sizes=config['hidden_sizes'])
+    initial.load_state_dict(model.state_dict())
+
+    results = ModelTrainer(model, config=config, device='cpu').train(
+        X_train, y_train, X_val, y_val, verbose=False
+    )
+    assert results['precision'] == 'bf16'
+    assert all(p.dtype == torch.float32 for p in model.parameters())
+
+    reference = train_precision_reference(initial, config, X_train, y_train, X_val, y_val)
+    assert reference['precision'] == 'fp32'
+    assert os.path.exists(tmp_path / 'fp32_reference' / 'BTC_best.pth')
+
+    comparison = precision_comparison(reference, results)
+    assert comparison['speedup'] > 0
+    assert comparison['accuracy_delta'] == results['best_val_accuracy'] - reference['best_val_accuracy']
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    """A run resumed from a snapshot reproduces the uninterrupted loss history."""
+    X_train, y_train, X_val, y_val = _data()
+    base = dict(TRAINING_CONFIG, hidden_sizes=[16, 8, 4], snapshot_interval=1,
+                early_stopping_patience=100)
+
+    def run(epochs, checkpoint_dir, resume=False):
+        torch.manual_seed(0)
+        model = CryptoLSTM(input_size=20, hidden_sizes=base['hidden_sizes'])
+        config = dict(base, epochs=epochs, checkpoint_dir=str(checkpoint_dir))
+        trainer = ModelTrainer(model, config=config, device='cpu')
+        results = trainer.train(X_train, y_train, X_val, y_val, verbose=False, resume=resume)
+        return trainer, results
+
+    full, _ = run(4, tmp_path / 'full')
+
+    run(2, tmp_path / 'resumed')
+    assert os.path.exists(tmp_path / 'resumed' / 'BTC_state.pth')
+    resumed, results = run(4, tmp_path / 'resumed', resume=True)
+
+    assert results['epochs_trained'] == 4
+    assert np.allclose(resumed.train_losses, full.train_losses)
+    assert np.allclose(resumed.val_losses, full.val_losses)
+
+
+def test_training_records_throughput(tmp_path):
+    """Every epoch records data vs compute time, samples/sec and peak RSS."""
+    X_train, y_train, X_val, y_val = _data()
+    config = dict(TRAINING_CONFIG, epochs=2, hidden_sizes=[16, 8, 4], data_pipeline='tensor',
+                  checkpoint_dir=str(tmp_path))
+
+    torch.manual_seed(0)
+    model = CryptoLSTM(input_size=20, hidden_sizes=config['hidden_sizes'])
+    results = ModelTrainer(model, config=config, device='cpu').train(
+        X_train, y_train, X_val, y_val, verbose=False
+    )
+
+    assert len(results['epoch_stats']) == 2
+    for stats in results['epoch_stats']:
+        assert stats['data_seconds'] + stats['compute_seconds'] <= stats['epoch_seconds']
+        assert stats['samples_per_second'] > 0
+
+    throughput = results['throughput']
+    assert 0 <= throughput['data_fraction'] <= 1
+    assert throughput['torch_threads'] == torch.get_num_threads()
+    assert throughput['peak_rss_mb'] is None or throughput['peak_rss_mb'] > 0
+
+
+def test_multi_horizon_training_reports_per_horizon_accuracy(tmp_path):
+    """Multi-horizon labels train all heads and report one accuracy per horizon."""
+    X_train, _, X_val, _ = _data()
+    rng = np.random.default_rng(1)
+    y_train, y_val = rng.integers(0, 3, (32, 2)), rng.integers(0, 3, (16, 2))
+    config = dict(TRAINING_CONFIG, epochs=1, hidden_sizes=[16, 8, 4], validation_mode='full',
+                  checkpoint_dir=str(tmp_path))
+
+    torch.manual_seed(0)
+    model = MultiHorizonCryptoLSTM(input_size=20, hidden_sizes=config['hidden_sizes'], horizons=[7, 30])
+    trainer = ModelTrainer(model, config=config, device='cpu')
+    trainer.train(X_train, y_train, X_val, y_val, verbose=False)
+
+    _, val_accuracy, metrics = trainer.validate(trainer.prepare_dataloaders(X_val, y_val, X_val, y_val)[1])
+
+    assert set(metrics) >= {'accuracy_7d', 'accuracy_30d'}
+    assert np.isclose(val_accuracy, (metrics['accuracy_7d'] + metrics['accuracy_30d']) / 2)